@@ -0,0 +1,28 @@
+import type { Metadata } from "next";
+import { PageHeader } from "@/components/layout";
+
+export const dynamic = "force-static";
+
+export const metadata: Metadata = {
+  title: "Contact | New York Knicks",
+};
+
+export default function ContactPage() {
+  return (
+    <>
+      <PageHeader title="Contact" />
+      <section className="container mx-auto px-4 py-12 space-y-4 text-lg">
+        <p>
+          Madison Square Garden
+          <br />4 Pennsylvania Plaza, New York, NY 10001
+        </p>
+        <p>
+          Tickets and general enquiries:{" "}
+          <a href="https://www.msg.com/contact-us" className="text-knicks-blue hover:text-knicks-orange">
+            msg.com/contact-us
+          </a>
+        </p>
+      </section>
+    </>
+  );
+}
@@ -0,0 +1,33 @@
+import type { Metadata } from "next";
+import { PageHeader } from "@/components/layout";
+
+export const dynamic = "force-static";
+
+export const metadata: Metadata = {
+  title: "History | New York Knicks",
+};
+
+const MILESTONES = [
+  { year: "1946", text: "The Knicks play their first game as a charter member of the BAA." },
+  { year: "1970", text: "Willis Reed walks out for Game 7 and the Knicks win their first title." },
+  { year: "1973", text: "A second championship, over the Los Angeles Lakers." },
+  { year: "1999", text: "The Knicks reach the Finals as an eighth seed." },
+] as const;
+
+export default function HistoryPage() {
+  return (
+    <>
+      <PageHeader title="History" description="Since 1946 at the Mecca of basketball" />
+      <section className="container mx-auto px-4 py-12">
+        <ol className="space-y-6 border-l-4 border-knicks-orange pl-6">
+          {MILESTONES.map((milestone) => (
+            <li key={milestone.year}>
+              <p className="text-2xl font-bold text-knicks-blue">{milestone.year}</p>
+              <p className="text-gray-600">{milestone.text}</p>
+            </li>
+          ))}
+        </ol>
+      </section>
+    </>
+  );
+}
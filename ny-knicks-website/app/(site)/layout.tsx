@@ -0,0 +1,21 @@
+import { Footer, Header } from "@/components/layout";
+import { ScoreTicker } from "@/components/sections";
+
+/**
+ * Shared chrome for the public site. Everything under this group is
+ * prerendered; the score ticker is the only live part, streamed client-side.
+ */
+export default function SiteLayout({
+  children,
+}: Readonly<{
+  children: React.ReactNode;
+}>) {
+  return (
+    <div className="flex flex-col min-h-screen">
+      <Header />
+      <ScoreTicker />
+      <main className="flex-1">{children}</main>
+      <Footer />
+    </div>
+  );
+}
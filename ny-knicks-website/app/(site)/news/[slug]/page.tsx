@@ -0,0 +1,74 @@
+import type { Metadata } from "next";
+import { notFound } from "next/navigation";
+import { PageHeader } from "@/components/layout";
+import { KnicksImage } from "@/components/ui";
+import { getNewsArticleBySlug, getNewsArticles } from "@/lib/data";
+
+export const revalidate = 3600;
+/** Older and newly published articles render on first request, then stay static */
+export const dynamicParams = true;
+
+/** Articles prerendered at build time; the archive fills in on demand */
+const PRERENDERED_ARTICLES = 100;
+
+export async function generateStaticParams() {
+  const articles = await getNewsArticles({ limit: PRERENDERED_ARTICLES });
+  return articles.map((article) => ({ slug: article.slug }));
+}
+
+export async function generateMetadata({
+  params,
+}: {
+  params: Promise<{ slug: string }>;
+}): Promise<Metadata> {
+  const article = await getNewsArticleBySlug((await params).slug);
+  return article
+    ? { title: `${article.title} | New York Knicks`, description: article.excerpt }
+    : { title: "Article not found" };
+}
+
+const dateFormat = new Intl.DateTimeFormat("en-US", {
+  dateStyle: "long",
+  timeZone: "America/New_York",
+});
+
+export default async function NewsArticlePage({
+  params,
+}: {
+  params: Promise<{ slug: string }>;
+}) {
+  const article = await getNewsArticleBySlug((await params).slug);
+  if (!article) notFound();
+
+  return (
+    <article>
+      <PageHeader
+        title={article.title}
+        description={[
+          dateFormat.format(new Date(article.publishedAt)),
+          article.author,
+          article.readingTime && `${article.readingTime} min read`,
+        ]
+          .filter(Boolean)
+          .join(" · ")}
+      />
+      <div className="container mx-auto max-w-3xl px-4 py-12 space-y-6">
+        {article.image && (
+          <KnicksImage
+            src={article.image}
+            alt=""
+            priority
+            sizes="(min-width: 768px) 768px, 100vw"
+            className="rounded-lg"
+          />
+        )}
+        <p className="text-xl text-gray-700">{article.excerpt}</p>
+        {article.content?.split(/\n{2,}/).map((paragraph, i) => (
+          <p key={i} className="text-lg leading-relaxed">
+            {paragraph}
+          </p>
+        ))}
+      </div>
+    </article>
+  );
+}
@@ -0,0 +1,45 @@
+import type { Metadata } from "next";
+import Link from "next/link";
+import { PageHeader } from "@/components/layout";
+import { newsArticlePath } from "@/lib/constants";
+import { getNewsArticles } from "@/lib/data";
+
+export const revalidate = 300;
+
+export const metadata: Metadata = {
+  title: "News | New York Knicks",
+};
+
+const dateFormat = new Intl.DateTimeFormat("en-US", {
+  dateStyle: "long",
+  timeZone: "America/New_York",
+});
+
+export default async function NewsPage() {
+  const articles = await getNewsArticles({ limit: 12 });
+
+  return (
+    <>
+      <PageHeader title="News" description="The latest from the Knicks" />
+      <section className="container mx-auto px-4 py-12">
+        <ul className="grid gap-6 md:grid-cols-2 lg:grid-cols-3">
+          {articles.map((article) => (
+            <li
+              key={article.id}
+              className="bg-white p-6 rounded-lg shadow-md border-t-4 border-knicks-blue"
+            >
+              <p className="text-sm text-gray-500">
+                {dateFormat.format(new Date(article.publishedAt))}
+                {article.readingTime && ` · ${article.readingTime} min read`}
+              </p>
+              <Link href={newsArticlePath(article.slug)} className="hover:text-knicks-orange">
+                <h2 className="mt-2 text-xl font-semibold text-knicks-blue">{article.title}</h2>
+              </Link>
+              <p className="mt-2 text-gray-600">{article.excerpt}</p>
+            </li>
+          ))}
+        </ul>
+      </section>
+    </>
+  );
+}
@@ -0,0 +1,34 @@
+import type { Metadata } from "next";
+import Link from "next/link";
+import { PageHeader } from "@/components/layout";
+import { SITE_ROUTES } from "@/lib/constants";
+
+export const dynamic = "force-static";
+
+export const metadata: Metadata = {
+  title: "Offline | New York Knicks",
+  robots: { index: false },
+};
+
+/** Served by the service worker for pages that aren't cached yet */
+export default function OfflinePage() {
+  return (
+    <>
+      <PageHeader title="You're offline" />
+      <section className="container mx-auto px-4 py-12 space-y-4 text-lg">
+        <p>This page hasn&apos;t been saved on this device yet. Pages you have already visited still work.</p>
+        <p className="flex flex-wrap gap-4">
+          <Link href={SITE_ROUTES.roster} className="text-knicks-blue hover:text-knicks-orange">
+            Roster
+          </Link>
+          <Link href={SITE_ROUTES.schedule} className="text-knicks-blue hover:text-knicks-orange">
+            Schedule
+          </Link>
+          <Link href={SITE_ROUTES.news} className="text-knicks-blue hover:text-knicks-orange">
+            News
+          </Link>
+        </p>
+      </section>
+    </>
+  );
+}
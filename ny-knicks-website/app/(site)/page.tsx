@@ -0,0 +1,84 @@
+import Link from "next/link";
+import { buttonVariants } from "@/components/ui";
+import { getNewsArticles, getUpcomingGames } from "@/lib/data";
+import { newsArticlePath, SITE_ROUTES } from "@/lib/constants";
+
+/** Regenerated in the background at most every 5 minutes, and on demand */
+export const revalidate = 300;
+
+export default async function Home() {
+  const [games, news] = await Promise.all([getUpcomingGames(3), getNewsArticles({ limit: 3 })]);
+
+  return (
+    <>
+      {/* Hero Section */}
+      <section className="bg-gradient-to-br from-knicks-blue to-blue-800 text-white py-24">
+        <div className="container mx-auto px-4 text-center">
+          <h1 className="text-5xl md:text-7xl font-bold mb-6">
+            NEW YORK KNICKS
+          </h1>
+          <p className="text-xl md:text-2xl mb-8 text-blue-100">
+            Official Team Website - Modern Experience
+          </p>
+          <div className="flex flex-col sm:flex-row gap-4 justify-center">
+            <Link
+              href={SITE_ROUTES.schedule}
+              className={buttonVariants({ variant: "secondary", size: "lg" })}
+            >
+              View Schedule
+            </Link>
+            <Link
+              href={SITE_ROUTES.roster}
+              className={buttonVariants({
+                variant: "outline",
+                size: "lg",
+                className: "bg-white hover:bg-blue-50",
+              })}
+            >
+              Team Roster
+            </Link>
+          </div>
+        </div>
+      </section>
+
+      <section className="py-16 bg-gray-50">
+        <div className="container mx-auto px-4 grid gap-12 md:grid-cols-2">
+          <div>
+            <h2 className="text-3xl font-bold mb-6 text-knicks-blue">Upcoming Games</h2>
+            <ul className="space-y-4">
+              {games.map((game) => (
+                <li
+                  key={game.id}
+                  className="bg-white p-6 rounded-lg shadow-md border-t-4 border-knicks-orange"
+                >
+                  <p className="font-semibold text-lg text-knicks-blue">
+                    {game.isHome ? "vs" : "@"} {game.opponent}
+                  </p>
+                  <p className="text-gray-600">
+                    {game.date} · {game.time} · {game.location}
+                  </p>
+                </li>
+              ))}
+            </ul>
+          </div>
+          <div>
+            <h2 className="text-3xl font-bold mb-6 text-knicks-blue">Latest News</h2>
+            <ul className="space-y-4">
+              {news.map((article) => (
+                <li
+                  key={article.id}
+                  className="bg-white p-6 rounded-lg shadow-md border-t-4 border-knicks-blue"
+                >
+                  <Link href={newsArticlePath(article.slug)} className="hover:text-knicks-orange">
+                    <h3 className="font-semibold text-lg mb-2 text-knicks-blue">{article.title}</h3>
+                  </Link>
+                  <p className="text-gray-600">{article.excerpt}</p>
+                </li>
+              ))}
+            </ul>
+          </div>
+        </div>
+      </section>
+    </>
+  );
+}
@@ -0,0 +1,44 @@
+import type { Metadata } from "next";
+import { notFound } from "next/navigation";
+import { PageHeader } from "@/components/layout";
+import { KnicksImage } from "@/components/ui";
+import { getPlayerById, getPlayers } from "@/lib/data";
+
+export const revalidate = 3600;
+/** Players signed after the build render on first request, then stay static */
+export const dynamicParams = true;
+
+export async function generateStaticParams() {
+  const players = await getPlayers();
+  return players.map((player) => ({ id: player.id }));
+}
+
+export async function generateMetadata({
+  params,
+}: {
+  params: Promise<{ id: string }>;
+}): Promise<Metadata> {
+  const player = await getPlayerById((await params).id);
+  return { title: player ? `${player.name} | New York Knicks` : "Player not found" };
+}
+
+export default async function PlayerPage({ params }: { params: Promise<{ id: string }> }) {
+  const player = await getPlayerById((await params).id);
+  if (!player) notFound();
+
+  return (
+    <>
+      <PageHeader title={player.name} description={`#${player.number} · ${player.position}`} />
+      {player.image && (
+        <section className="container mx-auto px-4 py-12">
+          <KnicksImage
+            src={player.image}
+            alt={player.name}
+            sizes="(min-width: 768px) 480px, 100vw"
+            className="max-w-md rounded-lg"
+          />
+        </section>
+      )}
+    </>
+  );
+}
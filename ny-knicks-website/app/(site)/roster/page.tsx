@@ -0,0 +1,37 @@
+import type { Metadata } from "next";
+import Link from "next/link";
+import { PageHeader } from "@/components/layout";
+import { playerPath } from "@/lib/constants";
+import { getPlayers } from "@/lib/data";
+
+export const revalidate = 3600;
+
+export const metadata: Metadata = {
+  title: "Roster | New York Knicks",
+};
+
+export default async function RosterPage() {
+  const players = await getPlayers();
+
+  return (
+    <>
+      <PageHeader title="Roster" description="The 2026-27 New York Knicks" />
+      <section className="container mx-auto px-4 py-12">
+        <ul className="grid gap-6 sm:grid-cols-2 lg:grid-cols-3">
+          {players.map((player) => (
+            <li key={player.id}>
+              <Link
+                href={playerPath(player.id)}
+                className="block bg-white p-6 rounded-lg shadow-md border-t-4 border-knicks-blue hover:border-knicks-orange transition-colors"
+              >
+                <span className="text-4xl font-bold text-knicks-orange">#{player.number}</span>
+                <h2 className="mt-2 text-xl font-semibold text-knicks-blue">{player.name}</h2>
+                <p className="text-gray-600">{player.position}</p>
+              </Link>
+            </li>
+          ))}
+        </ul>
+      </section>
+    </>
+  );
+}
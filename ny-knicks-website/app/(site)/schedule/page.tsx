@@ -0,0 +1,43 @@
+import type { Metadata } from "next";
+import { PageHeader } from "@/components/layout";
+import { getGames } from "@/lib/data";
+
+export const revalidate = 3600;
+
+export const metadata: Metadata = {
+  title: "Schedule | New York Knicks",
+};
+
+export default async function SchedulePage() {
+  const games = await getGames();
+
+  return (
+    <>
+      <PageHeader title="Schedule" description="Every game of the season, in Eastern Time" />
+      <section className="container mx-auto px-4 py-12">
+        <table className="w-full text-left">
+          <thead className="border-b-2 border-knicks-blue text-knicks-blue">
+            <tr>
+              <th className="py-3">Date</th>
+              <th className="py-3">Opponent</th>
+              <th className="py-3">Tip-off</th>
+              <th className="py-3">Location</th>
+            </tr>
+          </thead>
+          <tbody>
+            {games.map((game) => (
+              <tr key={game.id} className="border-b border-knicks-silver/40">
+                <td className="py-3">{game.date}</td>
+                <td className="py-3 font-semibold">
+                  {game.isHome ? "vs" : "@"} {game.opponent}
+                </td>
+                <td className="py-3">{game.time}</td>
+                <td className="py-3 text-gray-600">{game.location}</td>
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </section>
+    </>
+  );
+}
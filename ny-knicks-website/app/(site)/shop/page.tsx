@@ -0,0 +1,24 @@
+import type { Metadata } from "next";
+import { PageHeader } from "@/components/layout";
+
+export const dynamic = "force-static";
+
+export const metadata: Metadata = {
+  title: "Shop | New York Knicks",
+};
+
+export default function ShopPage() {
+  return (
+    <>
+      <PageHeader title="Shop" description="Jerseys, hats and gear from the Knicks Store" />
+      <section className="container mx-auto px-4 py-12">
+        <a
+          href="https://store.msg.com/collections/new-york-knicks"
+          className="inline-flex rounded-lg bg-knicks-orange px-6 py-3 font-semibold text-white hover:bg-orange-600"
+        >
+          Visit the Knicks Store
+        </a>
+      </section>
+    </>
+  );
+}
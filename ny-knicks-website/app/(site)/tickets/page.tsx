@@ -0,0 +1,42 @@
+import type { Metadata } from "next";
+import { PageHeader } from "@/components/layout";
+import { getUpcomingGames } from "@/lib/data";
+
+export const revalidate = 3600;
+
+export const metadata: Metadata = {
+  title: "Tickets | New York Knicks",
+};
+
+export default async function TicketsPage() {
+  const games = (await getUpcomingGames(20)).filter((game) => game.isHome);
+
+  return (
+    <>
+      <PageHeader title="Tickets" description="Upcoming games at Madison Square Garden" />
+      <section className="container mx-auto px-4 py-12">
+        <ul className="space-y-4">
+          {games.map((game) => (
+            <li
+              key={game.id}
+              className="flex flex-col gap-2 bg-white p-6 rounded-lg shadow-md sm:flex-row sm:items-center sm:justify-between"
+            >
+              <div>
+                <p className="font-semibold text-lg text-knicks-blue">vs {game.opponent}</p>
+                <p className="text-gray-600">
+                  {game.date} · {game.time}
+                </p>
+              </div>
+              <a
+                href="https://www.msg.com/new-york-knicks"
+                className="rounded-lg bg-knicks-orange px-6 py-3 font-semibold text-white hover:bg-orange-600"
+              >
+                Buy Tickets
+              </a>
+            </li>
+          ))}
+        </ul>
+      </section>
+    </>
+  );
+}
@@ -0,0 +1,23 @@
+import { getMediaPage } from "@/lib/data";
+
+export const runtime = "nodejs";
+
+/**
+ * Cursor-paginated media feed for the gallery:
+ * `GET /api/media?cursor=<nextCursor>&limit=40&category=game`
+ */
+export async function GET(request: Request) {
+  const params = new URL(request.url).searchParams;
+  const page = await getMediaPage({
+    cursor: params.get("cursor"),
+    limit: Number(params.get("limit") ?? 40) || 40,
+    category: params.get("category") ?? undefined,
+  });
+
+  return Response.json(page, {
+    headers: {
+      // Pages are keyed by cursor, so they are safe to share briefly
+      "Cache-Control": "public, s-maxage=60, stale-while-revalidate=300",
+    },
+  });
+}
@@ -0,0 +1,61 @@
+import {
+  getPerfStore,
+  isPerfMetricName,
+  MAX_BEACON_SAMPLES,
+  routePattern,
+  type PerfBeacon,
+  type PerfSample,
+} from "@/lib/perf";
+
+export const runtime = "nodejs";
+
+/** Upper bound for timing values, to drop clock glitches and junk */
+const MAX_TIMING_MS = 120_000;
+
+/**
+ * Field telemetry ingestion. `POST` takes the beacons sent by
+ * `startPerfCollection` (`{ route, samples: [{ name, value }] }`) and
+ * records them in the local perf store. `GET` returns p50/p75/p95 per route
+ * and metric, with any Web Vitals whose p75 is over budget.
+ */
+export async function POST(request: Request) {
+  let body: unknown;
+  try {
+    body = await request.json();
+  } catch {
+    return Response.json({ error: "Body must be JSON" }, { status: 400 });
+  }
+
+  const beacon = toBeacon(body);
+  if (!beacon) {
+    return Response.json({ error: "Expected { route, samples: [{ name, value }] }" }, { status: 400 });
+  }
+
+  if (beacon.samples.length > 0) getPerfStore().record(beacon);
+  return new Response(null, { status: 204 });
+}
+
+export function GET() {
+  return Response.json(getPerfStore().summary(), {
+    headers: { "Cache-Control": "no-store" },
+  });
+}
+
+function toBeacon(body: unknown): PerfBeacon | null {
+  if (!body || typeof body !== "object") return null;
+
+  const { route, samples } = body as { route?: unknown; samples?: unknown };
+  if (typeof route !== "string" || !Array.isArray(samples)) return null;
+
+  const valid = samples.slice(0, MAX_BEACON_SAMPLES).filter((sample): sample is PerfSample => {
+    if (!sample || typeof sample !== "object") return false;
+    const { name, value } = sample as { name?: unknown; value?: unknown };
+    if (!isPerfMetricName(name) || typeof value !== "number" || !Number.isFinite(value)) {
+      return false;
+    }
+    return value >= 0 && value <= (name === "cls" ? 10 : MAX_TIMING_MS);
+  });
+
+  // Re-derive the pattern so clients can't grow the store with new keys
+  return { route: routePattern(route), samples: valid.map(({ name, value }) => ({ name, value })) };
+}
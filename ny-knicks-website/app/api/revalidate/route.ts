@@ -0,0 +1,73 @@
+import { timingSafeEqual } from "node:crypto";
+import { revalidatePath } from "next/cache";
+import {
+  mergeRevalidationPlans,
+  planRevalidation,
+  revalidateData,
+  type RevalidationPlan,
+  type TableChange,
+} from "@/lib/data";
+
+export const runtime = "nodejs";
+
+/**
+ * On-demand revalidation, called by a Supabase Database Webhook on
+ * `players`, `games`, `news` and `media` changes.
+ *
+ * Authenticate with `Authorization: Bearer $REVALIDATE_SECRET`. The body is
+ * either a webhook payload (one `TableChange`), or an explicit
+ * `{ "tags": [...], "paths": [...] }` for manual use. Only the affected
+ * data-cache tags are dropped and only the affected pages regenerate.
+ */
+export async function POST(request: Request) {
+  if (!isAuthorized(request.headers.get("authorization"))) {
+    return Response.json({ error: "Unauthorized" }, { status: 401 });
+  }
+
+  let body: unknown;
+  try {
+    body = await request.json();
+  } catch {
+    return Response.json({ error: "Body must be JSON" }, { status: 400 });
+  }
+
+  const plan = toPlan(body);
+  if (!plan) {
+    return Response.json(
+      { error: "Expected a table change payload or { tags, paths }" },
+      { status: 400 }
+    );
+  }
+
+  // Data first, so regenerated pages read fresh rows
+  const dropped = revalidateData(...plan.tags);
+  for (const path of plan.paths) revalidatePath(path);
+
+  return Response.json({ revalidated: plan, droppedEntries: dropped, now: Date.now() });
+}
+
+function isAuthorized(header: string | null): boolean {
+  const secret = process.env.REVALIDATE_SECRET;
+  if (!secret || !header?.startsWith("Bearer ")) return false;
+
+  const given = Buffer.from(header.slice("Bearer ".length));
+  const expected = Buffer.from(secret);
+  return given.length === expected.length && timingSafeEqual(given, expected);
+}
+
+function toPlan(body: unknown): RevalidationPlan | null {
+  if (!body || typeof body !== "object") return null;
+
+  if ("table" in body && "type" in body) {
+    return planRevalidation(body as TableChange);
+  }
+
+  const { tags, paths } = body as { tags?: unknown; paths?: unknown };
+  const strings = (value: unknown) =>
+    Array.isArray(value) ? value.filter((item): item is string => typeof item === "string") : [];
+  if (tags === undefined && paths === undefined) return null;
+
+  return mergeRevalidationPlans([
+    { tags: strings(tags), paths: strings(paths).filter((path) => path.startsWith("/")) },
+  ]);
+}
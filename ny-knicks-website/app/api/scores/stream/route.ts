@@ -0,0 +1,77 @@
+import {
+  encodeHubEvent,
+  encodeSnapshot,
+  getScoreHub,
+  parseEventId,
+} from "@/lib/live";
+
+export const runtime = "nodejs";
+export const dynamic = "force-dynamic";
+
+/** Queued events after which a client is considered stalled and dropped */
+const MAX_QUEUED_EVENTS = 64;
+
+const encoder = new TextEncoder();
+
+/**
+ * Live score stream (Server-Sent Events).
+ *
+ * All connections share one upstream feed through the score hub. A client
+ * reconnecting with `Last-Event-ID` (or `?since=<epoch>:<seq>`) receives
+ * only the batches it missed; otherwise it starts from a snapshot.
+ */
+export function GET(request: Request) {
+  const hub = getScoreHub();
+  const lastEventId =
+    request.headers.get("last-event-id") ??
+    new URL(request.url).searchParams.get("since");
+  const resume = parseEventId(lastEventId);
+  const since = resume?.epoch === hub.epoch ? resume.seq : undefined;
+
+  let unsubscribe = () => {};
+
+  const stream = new ReadableStream<Uint8Array>({
+    start(controller) {
+      const close = () => {
+        unsubscribe();
+        try {
+          controller.close();
+        } catch {
+          // Already closed by the client
+        }
+      };
+
+      const subscription = hub.subscribe((event) => {
+        // Stalled clients are dropped and resume from their last id later
+        if ((controller.desiredSize ?? 0) < -MAX_QUEUED_EVENTS) {
+          close();
+          return;
+        }
+        controller.enqueue(encodeHubEvent(hub.epoch, event));
+      }, since);
+      unsubscribe = subscription.unsubscribe;
+
+      controller.enqueue(encoder.encode("retry: 2000\n\n"));
+      if (subscription.snapshot) {
+        controller.enqueue(encodeSnapshot(subscription.snapshot));
+      }
+      for (const batch of subscription.backlog) {
+        controller.enqueue(encodeHubEvent(hub.epoch, { type: "batch", batch }));
+      }
+
+      request.signal.addEventListener("abort", close);
+    },
+    cancel() {
+      unsubscribe();
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": "text/event-stream; charset=utf-8",
+      "Cache-Control": "no-cache, no-transform",
+      Connection: "keep-alive",
+      "X-Accel-Buffering": "no",
+    },
+  });
+}
@@ -0,0 +1,27 @@
+import { isSearchIndexName, SEARCH_INDEX_NAMES } from "@/lib/search/documents";
+import { buildSiteSearchIndex } from "@/lib/search/server";
+
+/**
+ * Prebuilt search indexes (`/api/search/news`, `/api/search/players`).
+ * Generated at build time and regenerated on revalidation, then served as
+ * static JSON; all querying happens in the browser's search worker.
+ */
+export const dynamic = "force-static";
+export const dynamicParams = false;
+export const revalidate = 3600;
+
+export function generateStaticParams() {
+  return SEARCH_INDEX_NAMES.map((index) => ({ index }));
+}
+
+export async function GET(
+  _request: Request,
+  { params }: { params: Promise<{ index: string }> }
+) {
+  const { index } = await params;
+  if (!isSearchIndexName(index)) {
+    return new Response("Not found", { status: 404 });
+  }
+
+  return Response.json(await buildSiteSearchIndex(index));
+}
@@ -0,0 +1,61 @@
+"use client";
+
+import { motion } from "framer-motion";
+import { useCallback, useMemo } from "react";
+import { MediaGallery } from "@/components/sections";
+import type { FetchCursorPage } from "@/hooks";
+import { createSyntheticMedia } from "@/lib/data/synthetic";
+import type { MediaItem } from "@/types";
+
+const PAGE_SIZE = 200;
+
+export function GalleryBench({ count, mode }: { count: number; mode: "virtual" | "naive" }) {
+  const items = useMemo(() => createSyntheticMedia(count), [count]);
+
+  // Same cursor contract as `/api/media`, served from memory
+  const fetchPage = useCallback<FetchCursorPage<MediaItem>>(
+    async (cursor) => {
+      const start = cursor ? Number(cursor) : 0;
+      const end = Math.min(start + PAGE_SIZE, items.length);
+      return {
+        items: items.slice(start, end),
+        nextCursor: end < items.length ? String(end) : null,
+      };
+    },
+    [items]
+  );
+
+  if (mode === "naive") {
+    return <NaiveGallery items={items} />;
+  }
+  return <MediaGallery fetchPage={fetchPage} />;
+}
+
+/**
+ * Baseline: every tile mounted up front with a staggered entrance
+ */
+function NaiveGallery({ items }: { items: readonly MediaItem[] }) {
+  return (
+    <div className="columns-2 gap-3 md:columns-3 lg:columns-4 2xl:columns-5">
+      {items.map((item, i) => (
+        <motion.figure
+          key={item.id}
+          data-gallery-tile
+          className="mb-3 break-inside-avoid overflow-hidden rounded-lg"
+          initial={{ opacity: 0, y: 20 }}
+          animate={{ opacity: 1, y: 0 }}
+          transition={{ delay: Math.min(i * 0.02, 2) }}
+        >
+          {/* eslint-disable-next-line @next/next/no-img-element */}
+          <img
+            src={item.thumbnail ?? item.src}
+            alt=""
+            width={item.width}
+            height={item.height}
+            className="h-auto w-full"
+          />
+        </motion.figure>
+      ))}
+    </div>
+  );
+}
@@ -0,0 +1,22 @@
+import { GalleryBench } from "./GalleryBench";
+
+/**
+ * Gallery benchmark fixture: `?count=10000` synthetic items, rendered by
+ * the virtualized gallery or, with `?mode=naive`, as a plain animated grid
+ */
+export default async function GalleryBenchPage({
+  searchParams,
+}: {
+  searchParams: Promise<{ count?: string; mode?: string }>;
+}) {
+  const { count, mode } = await searchParams;
+
+  return (
+    <main className="min-h-screen bg-knicks-black px-4 py-8">
+      <GalleryBench
+        count={Math.min(Math.max(Number(count) || 10_000, 1), 100_000)}
+        mode={mode === "naive" ? "naive" : "virtual"}
+      />
+    </main>
+  );
+}
@@ -0,0 +1,27 @@
+import { HERO_POSTER, HERO_RENDITIONS } from "@/lib/video";
+
+/**
+ * Baseline for the hero benchmark: the largest rendition autoplaying
+ * straight away, as a plain `<video autoplay>` would
+ */
+export default function NaiveHeroBenchPage() {
+  const largest = HERO_RENDITIONS[HERO_RENDITIONS.length - 1];
+
+  return (
+    <section className="relative h-screen min-h-[32rem] w-full overflow-hidden bg-knicks-black">
+      <video
+        src={largest?.src}
+        poster={HERO_POSTER}
+        autoPlay
+        muted
+        loop
+        playsInline
+        className="absolute inset-0 h-full w-full object-cover"
+      />
+      <div className="absolute inset-0 bg-gradient-to-br from-knicks-blue/70 via-knicks-black/40 to-knicks-orange/50" />
+      <div className="relative z-10 flex h-full items-center justify-center">
+        <h1 className="text-5xl md:text-7xl font-bold text-white">NEW YORK KNICKS</h1>
+      </div>
+    </section>
+  );
+}
@@ -0,0 +1,9 @@
+import { HeroVideo } from "@/components/sections";
+
+export default function HeroBenchPage() {
+  return (
+    <HeroVideo posterAlt="Knicks highlights at Madison Square Garden">
+      <h1 className="text-5xl md:text-7xl font-bold text-white">NEW YORK KNICKS</h1>
+    </HeroVideo>
+  );
+}
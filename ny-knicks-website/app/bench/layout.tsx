@@ -0,0 +1,13 @@
+import { notFound } from "next/navigation";
+
+/**
+ * Benchmark fixtures, only built when `ENABLE_BENCH_ROUTES=1`
+ */
+export default function BenchLayout({
+  children,
+}: Readonly<{
+  children: React.ReactNode;
+}>) {
+  if (process.env.ENABLE_BENCH_ROUTES !== "1") notFound();
+  return children;
+}
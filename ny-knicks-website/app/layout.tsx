@@ -1,5 +1,6 @@
 import type { Metadata } from "next";
 import { Geist, Geist_Mono } from "next/font/google";
+import { PerfReporter, ServiceWorkerRegistration, SmoothScroll } from "@/components/layout";
 import "./globals.css";
 
 const geistSans = Geist({
@@ -13,8 +14,8 @@ const geistMono = Geist_Mono({
 });
 
 export const metadata: Metadata = {
-  title: "Create Next App",
-  description: "Generated by create next app",
+  title: "New York Knicks",
+  description: "The official website of the New York Knicks",
 };
 
 export default function RootLayout({
@@ -28,6 +29,9 @@ export default function RootLayout({
         className={`${geistSans.variable} ${geistMono.variable} antialiased`}
       >
         {children}
+        <SmoothScroll />
+        <ServiceWorkerRegistration />
+        <PerfReporter />
       </body>
     </html>
   );
@@ -1,3 +1,6 @@
+import Link from "next/link";
+import { SITE_ROUTES } from "@/lib/constants";
+
 /**
  * Footer component - Site footer
  * TODO: Implement full footer structure
@@ -17,19 +20,19 @@ export function Footer() {
             <h4 className="font-semibold mb-4">Quick Links</h4>
             <ul className="space-y-2 text-knicks-silver">
               <li>
-                <a href="#" className="hover:text-knicks-orange transition-colors">
+                <Link href={SITE_ROUTES.roster} className="hover:text-knicks-orange transition-colors">
                   Team Roster
-                </a>
+                </Link>
               </li>
               <li>
-                <a href="#" className="hover:text-knicks-orange transition-colors">
+                <Link href={SITE_ROUTES.schedule} className="hover:text-knicks-orange transition-colors">
                   Schedule
-                </a>
+                </Link>
               </li>
               <li>
-                <a href="#" className="hover:text-knicks-orange transition-colors">
+                <Link href={SITE_ROUTES.news} className="hover:text-knicks-orange transition-colors">
                   News
-                </a>
+                </Link>
               </li>
             </ul>
           </div>
@@ -0,0 +1,64 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import { getFrameScheduler, type FrameStats } from "@/lib/animation";
+
+export interface FrameBudgetOverlayProps {
+  /** Refresh interval */
+  intervalMs?: number;
+  /** Number of over-budget callbacks listed */
+  maxTasks?: number;
+}
+
+/**
+ * Development overlay showing frame rate, dropped frames and the scheduled
+ * callbacks that exceed their per-frame budget
+ */
+export function FrameBudgetOverlay({ intervalMs = 500, maxTasks = 6 }: FrameBudgetOverlayProps) {
+  const [stats, setStats] = useState<FrameStats | null>(null);
+
+  useEffect(() => {
+    const scheduler = getFrameScheduler();
+    const timer = setInterval(() => setStats(scheduler.stats()), intervalMs);
+    return () => clearInterval(timer);
+  }, [intervalMs]);
+
+  if (!stats) return null;
+
+  const overBudget = stats.tasks
+    .filter((task) => task.overBudget > 0)
+    .sort((a, b) => b.maxMs - a.maxMs)
+    .slice(0, maxTasks);
+
+  return (
+    <div className="pointer-events-none fixed bottom-2 right-2 z-[9999] min-w-56 rounded-md bg-knicks-black/85 p-3 font-mono text-xs text-white shadow-lg">
+      <div className="flex justify-between gap-4">
+        <span>{stats.fps.toFixed(0)} fps</span>
+        <span className={stats.droppedFrames > 0 ? "text-knicks-orange" : undefined}>
+          {stats.droppedFrames} dropped
+        </span>
+      </div>
+      <div className="flex justify-between gap-4 text-knicks-silver">
+        <span>work {stats.lastFrameMs.toFixed(2)}ms</span>
+        <span>worst {stats.worstFrameMs.toFixed(1)}ms</span>
+      </div>
+      <div className="mt-1 text-knicks-silver">
+        {stats.tasks.filter((task) => task.active).length}/{stats.tasks.length} tasks active
+      </div>
+      {overBudget.length > 0 && (
+        <ul className="mt-2 space-y-0.5 border-t border-knicks-silver/30 pt-2">
+          {overBudget.map((task) => (
+            <li key={`${task.phase}:${task.id}`} className="flex justify-between gap-4">
+              <span className="truncate">
+                {task.phase}:{task.id}
+              </span>
+              <span className="text-knicks-orange">
+                {task.maxMs.toFixed(1)}/{task.budgetMs}ms ×{task.overBudget}
+              </span>
+            </li>
+          ))}
+        </ul>
+      )}
+    </div>
+  );
+}
@@ -0,0 +1,20 @@
+import type { ReactNode } from "react";
+
+export interface PageHeaderProps {
+  title: string;
+  description?: ReactNode;
+}
+
+/**
+ * Title banner at the top of content pages
+ */
+export function PageHeader({ title, description }: PageHeaderProps) {
+  return (
+    <section className="bg-gradient-to-br from-knicks-blue to-blue-800 text-white py-16">
+      <div className="container mx-auto px-4">
+        <h1 className="text-4xl md:text-5xl font-bold">{title}</h1>
+        {description && <p className="mt-4 text-lg text-blue-100">{description}</p>}
+      </div>
+    </section>
+  );
+}
@@ -0,0 +1,24 @@
+"use client";
+
+import { useEffect } from "react";
+import { startPerfCollection } from "@/lib/perf/collect";
+
+export interface PerfReporterProps {
+  /** Fraction of page loads that report (defaults to `NEXT_PUBLIC_PERF_SAMPLE_RATE` or 1) */
+  sampleRate?: number;
+}
+
+/**
+ * Reports Web Vitals and custom marks to `/api/perf` in production builds.
+ * Render once, in the root layout.
+ */
+export function PerfReporter({
+  sampleRate = Number(process.env.NEXT_PUBLIC_PERF_SAMPLE_RATE ?? 1),
+}: PerfReporterProps) {
+  useEffect(() => {
+    if (process.env.NODE_ENV !== "production") return;
+    return startPerfCollection({ sampleRate });
+  }, [sampleRate]);
+
+  return null;
+}
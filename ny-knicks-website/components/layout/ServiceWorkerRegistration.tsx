@@ -0,0 +1,30 @@
+"use client";
+
+import { useEffect } from "react";
+import { SW_URL } from "@/lib/offline";
+
+/**
+ * Registers the offline service worker (`npm run build:sw`) in production
+ * builds. Registration waits for the load event so it never competes with
+ * the first render for bandwidth. Render once, in the root layout.
+ */
+export function ServiceWorkerRegistration() {
+  useEffect(() => {
+    if (process.env.NODE_ENV !== "production" || !("serviceWorker" in navigator)) return;
+
+    const register = () => {
+      navigator.serviceWorker.register(SW_URL).catch((error: unknown) => {
+        console.warn("Service worker registration failed", error);
+      });
+    };
+
+    if (document.readyState === "complete") {
+      register();
+      return;
+    }
+    window.addEventListener("load", register, { once: true });
+    return () => window.removeEventListener("load", register);
+  }, []);
+
+  return null;
+}
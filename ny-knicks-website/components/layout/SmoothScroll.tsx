@@ -0,0 +1,24 @@
+"use client";
+
+import { useEffect } from "react";
+import { startSmoothScroll, type LenisOptions } from "@/lib/animation";
+import { FrameBudgetOverlay } from "./FrameBudgetOverlay";
+
+export interface SmoothScrollProps {
+  options?: LenisOptions;
+  /** Show the frame timing overlay (defaults to on in development) */
+  showFrameOverlay?: boolean;
+}
+
+/**
+ * Starts Lenis smooth scrolling and moves GSAP onto the shared frame
+ * scheduler. Render once, in the root layout.
+ */
+export function SmoothScroll({
+  options,
+  showFrameOverlay = process.env.NODE_ENV === "development",
+}: SmoothScrollProps) {
+  useEffect(() => startSmoothScroll(options), [options]);
+
+  return showFrameOverlay ? <FrameBudgetOverlay /> : null;
+}
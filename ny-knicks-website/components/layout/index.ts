@@ -3,3 +3,8 @@
  */
 export * from "./Header";
 export * from "./Footer";
+export * from "./FrameBudgetOverlay";
+export * from "./PageHeader";
+export * from "./PerfReporter";
+export * from "./ServiceWorkerRegistration";
+export * from "./SmoothScroll";
@@ -0,0 +1,53 @@
+import type { ReactNode } from "react";
+import { KnicksImage } from "@/components/ui";
+import { HERO_POSTER, HERO_RENDITIONS, type VideoRendition } from "@/lib/video";
+import { cn } from "@/lib/utils";
+import { HeroVideoPlayer } from "./HeroVideoPlayer";
+
+export interface HeroVideoProps {
+  /** Poster image, painted immediately and kept as the LCP element */
+  poster?: string;
+  posterAlt: string;
+  renditions?: readonly VideoRendition[];
+  /** Hero content rendered above the video and gradient */
+  children?: ReactNode;
+  className?: string;
+}
+
+/**
+ * Full-screen hero with a poster-first, deferred background video
+ */
+export function HeroVideo({
+  poster = HERO_POSTER,
+  posterAlt,
+  renditions = HERO_RENDITIONS,
+  children,
+  className,
+}: HeroVideoProps) {
+  return (
+    <section
+      className={cn(
+        "relative h-screen min-h-[32rem] w-full overflow-hidden bg-knicks-black",
+        className
+      )}
+    >
+      <KnicksImage
+        src={poster}
+        alt={posterAlt}
+        priority
+        sizes="100vw"
+        className="absolute inset-0 h-full w-full max-w-none object-cover"
+      />
+      <HeroVideoPlayer
+        renditions={renditions}
+        className="absolute inset-0 h-full w-full object-cover"
+      />
+      <div className="absolute inset-0 bg-gradient-to-br from-knicks-blue/70 via-knicks-black/40 to-knicks-orange/50" />
+      {children && (
+        <div className="relative z-10 flex h-full items-center justify-center">
+          {children}
+        </div>
+      )}
+    </section>
+  );
+}
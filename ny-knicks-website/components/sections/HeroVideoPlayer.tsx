@@ -0,0 +1,114 @@
+"use client";
+
+import { useEffect, useRef, useState } from "react";
+import {
+  readPlaybackEnvironment,
+  selectRendition,
+  type VideoRendition,
+} from "@/lib/video";
+import { markOnce, PERF_MARKS } from "@/lib/perf/marks";
+import { cn } from "@/lib/utils";
+
+export interface HeroVideoPlayerProps {
+  renditions: readonly VideoRendition[];
+  className?: string;
+}
+
+function whenPageLoaded(): Promise<void> {
+  if (document.readyState === "complete") return Promise.resolve();
+  return new Promise((resolve) =>
+    window.addEventListener("load", () => resolve(), { once: true })
+  );
+}
+
+function scheduleIdle(callback: () => void): () => void {
+  if ("requestIdleCallback" in window) {
+    const handle = window.requestIdleCallback(callback, { timeout: 3000 });
+    return () => window.cancelIdleCallback(handle);
+  }
+  const handle = setTimeout(callback, 200);
+  return () => clearTimeout(handle);
+}
+
+/**
+ * Background video layered over the hero poster.
+ *
+ * Nothing is requested until the page has loaded, the browser is idle and
+ * the hero is on screen, so the poster stays the LCP element. The rendition
+ * is chosen from connection quality and viewport size; with reduced motion
+ * or Save-Data the video never loads. Playback pauses while off screen.
+ */
+export function HeroVideoPlayer({ renditions, className }: HeroVideoPlayerProps) {
+  const videoRef = useRef<HTMLVideoElement>(null);
+  const [rendition, setRendition] = useState<VideoRendition | null>(null);
+  const [playing, setPlaying] = useState(false);
+
+  useEffect(() => {
+    const video = videoRef.current;
+    const selected = selectRendition(renditions, readPlaybackEnvironment());
+    if (!video || !selected) return;
+
+    let visible = false;
+    let ready = false;
+    let started = false;
+    let cancelIdle = () => {};
+
+    const start = () => {
+      if (started || !visible || !ready) return;
+      started = true;
+      setRendition(selected);
+    };
+
+    const observer = new IntersectionObserver(([entry]) => {
+      visible = entry?.isIntersecting ?? false;
+      if (!started) {
+        start();
+      } else if (visible) {
+        video.play().catch(() => {});
+      } else {
+        video.pause();
+      }
+    });
+    observer.observe(video);
+
+    let cancelled = false;
+    whenPageLoaded().then(() => {
+      if (cancelled) return;
+      cancelIdle = scheduleIdle(() => {
+        ready = true;
+        start();
+      });
+    });
+
+    return () => {
+      cancelled = true;
+      cancelIdle();
+      observer.disconnect();
+    };
+  }, [renditions]);
+
+  useEffect(() => {
+    if (rendition) videoRef.current?.play().catch(() => {});
+  }, [rendition]);
+
+  return (
+    <video
+      ref={videoRef}
+      src={rendition?.src}
+      muted
+      loop
+      playsInline
+      preload="none"
+      aria-hidden="true"
+      onPlaying={() => {
+        setPlaying(true);
+        markOnce(PERF_MARKS.heroReady);
+      }}
+      className={cn(
+        "transition-opacity duration-700",
+        playing ? "opacity-100" : "opacity-0",
+        className
+      )}
+    />
+  );
+}
@@ -0,0 +1,162 @@
+"use client";
+
+import { memo, useEffect, useRef, useState } from "react";
+import { useScrollScheduler } from "@/hooks";
+import { assignSlots, columnCountFor, MasonryLayout, type SlotAssignment } from "@/lib/gallery";
+import { markOnce, PERF_MARKS } from "@/lib/perf/marks";
+import { cn } from "@/lib/utils";
+import type { MediaItem } from "@/types";
+
+export interface MasonryGalleryProps {
+  items: readonly MediaItem[];
+  /** Called as the user nears the end of the loaded items */
+  onLoadMore?: () => void;
+  hasMore?: boolean;
+  onSelect?: (index: number) => void;
+  gap?: number;
+  /** Extra area rendered above and below the viewport, in viewport heights */
+  overscan?: number;
+  /** Remaining tiles below the rendered range that trigger `onLoadMore` */
+  loadAhead?: number;
+  className?: string;
+}
+
+/** A recycled slot: free slots stay mounted (hidden) for the next item */
+const MasonryTile = memo(function MasonryTile({
+  item,
+  index,
+  x,
+  y,
+  width,
+  height,
+  onSelect,
+}: {
+  item: MediaItem | undefined;
+  index: number;
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+  onSelect?: (index: number) => void;
+}) {
+  return (
+    <button
+      type="button"
+      data-gallery-tile
+      hidden={!item}
+      onClick={() => onSelect?.(index)}
+      className="absolute left-0 top-0 overflow-hidden rounded-lg bg-knicks-blue/40 focus-visible:outline-2 focus-visible:outline-knicks-orange"
+      style={{ width, height, transform: `translate3d(${x}px, ${y}px, 0)` }}
+      aria-label={item?.caption ?? `Open ${item?.type ?? "item"} ${index + 1}`}
+    >
+      {/* Plain img: a recycled slot only swaps `src`, without a new node */}
+      {/* eslint-disable-next-line @next/next/no-img-element */}
+      <img
+        src={item ? (item.thumbnail ?? item.src) : undefined}
+        alt=""
+        width={item?.width}
+        height={item?.height}
+        decoding="async"
+        draggable={false}
+        className="h-full w-full object-cover"
+      />
+      {item?.type === "video" && (
+        <span className="absolute right-2 top-2 rounded bg-knicks-black/70 px-1.5 py-0.5 text-xs font-semibold text-white">
+          ▶
+        </span>
+      )}
+    </button>
+  );
+});
+
+/**
+ * Virtualized masonry grid.
+ *
+ * Positions come from the items' known aspect ratios (see `MasonryLayout`),
+ * so nothing is measured per tile. Only tiles in and near the viewport are
+ * mounted, in a pool of recycled slots, and the visible range is computed
+ * in the shared frame scheduler's read phase while the grid is on screen.
+ */
+export function MasonryGallery({
+  items,
+  onLoadMore,
+  hasMore = false,
+  onSelect,
+  gap = 12,
+  overscan = 1,
+  loadAhead = 20,
+  className,
+}: MasonryGalleryProps) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [width, setWidth] = useState(0);
+  const [slots, setSlots] = useState<SlotAssignment>([]);
+
+  useEffect(() => {
+    const element = containerRef.current;
+    if (!element) return;
+
+    // Fires once on observe, so this also provides the initial width
+    const observer = new ResizeObserver(([entry]) => {
+      if (entry) setWidth(Math.round(entry.contentRect.width));
+    });
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, []);
+
+  // Layouts are immutable, so deriving the next one during render is pure.
+  // Appending a page copies the placed tiles and only places the new items.
+  const options = { columnCount: columnCountFor(width), width, gap };
+  const [storedLayout, setStoredLayout] = useState(() => new MasonryLayout(options).withItems(items));
+  const layout = (storedLayout.matches(options) ? storedLayout : new MasonryLayout(options)).withItems(items);
+  if (layout !== storedLayout) setStoredLayout(layout);
+  const contentHeight = layout.height;
+
+  useScrollScheduler(
+    () => {
+      const element = containerRef.current;
+      if (!element) return;
+
+      // One layout read per frame; everything else is arithmetic
+      const top = -element.getBoundingClientRect().top;
+      const margin = window.innerHeight * overscan;
+      const bottom = top + window.innerHeight + margin;
+      const visible = layout.query(top - margin, bottom);
+
+      setSlots((previous) => assignSlots(previous, visible));
+
+      const last = visible[visible.length - 1] ?? -1;
+      if (hasMore && (last >= layout.size - loadAhead || bottom >= contentHeight)) {
+        onLoadMore?.();
+      }
+    },
+    { id: "masonry-gallery", phase: "read", target: containerRef, enabled: width > 0 }
+  );
+
+  useEffect(() => {
+    if (slots.some((index) => index !== null)) markOnce(PERF_MARKS.galleryFirstTiles);
+  }, [slots]);
+
+  return (
+    <div
+      ref={containerRef}
+      className={cn("relative w-full", className)}
+      style={{ height: contentHeight }}
+    >
+      {slots.map((index, slot) => {
+        const rect = index === null ? undefined : layout.rect(index);
+        return (
+          <MasonryTile
+            key={slot}
+            index={index ?? -1}
+            item={index === null || !rect ? undefined : items[index]}
+            x={rect?.x ?? 0}
+            y={rect?.y ?? 0}
+            width={rect?.width ?? 0}
+            height={rect?.height ?? 0}
+            onSelect={onSelect}
+          />
+        );
+      })}
+    </div>
+  );
+}
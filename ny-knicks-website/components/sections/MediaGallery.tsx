@@ -0,0 +1,67 @@
+"use client";
+
+import { useCallback, useState } from "react";
+import { useCursorPagination, type CursorPage, type FetchCursorPage } from "@/hooks";
+import type { MediaItem } from "@/types";
+import { MasonryGallery } from "./MasonryGallery";
+import { MediaLightbox } from "./MediaLightbox";
+
+export interface MediaGalleryProps {
+  /** Restrict to one category (remount with a new `key` to switch) */
+  category?: string;
+  pageSize?: number;
+  /** Custom page source; defaults to `/api/media` */
+  fetchPage?: FetchCursorPage<MediaItem>;
+  className?: string;
+}
+
+/**
+ * Media gallery: cursor-paged masonry grid plus lightbox
+ */
+export function MediaGallery({
+  category,
+  pageSize = 40,
+  fetchPage,
+  className,
+}: MediaGalleryProps) {
+  const fetchFromApi = useCallback<FetchCursorPage<MediaItem>>(
+    async (cursor, signal) => {
+      const params = new URLSearchParams({ limit: String(pageSize) });
+      if (cursor) params.set("cursor", cursor);
+      if (category) params.set("category", category);
+
+      const response = await fetch(`/api/media?${params}`, { signal });
+      if (!response.ok) {
+        throw new Error(`Media request failed with ${response.status}`);
+      }
+      return (await response.json()) as CursorPage<MediaItem>;
+    },
+    [category, pageSize]
+  );
+
+  const { items, hasMore, error, loadMore, retry } = useCursorPagination(
+    fetchPage ?? fetchFromApi
+  );
+  const [selected, setSelected] = useState<number | null>(null);
+
+  return (
+    <>
+      <MasonryGallery
+        items={items}
+        hasMore={hasMore}
+        onLoadMore={loadMore}
+        onSelect={setSelected}
+        className={className}
+      />
+      {error && (
+        <p className="mt-4 text-center text-knicks-silver">
+          Couldn&apos;t load more media.{" "}
+          <button type="button" onClick={retry} className="text-knicks-orange underline">
+            Try again
+          </button>
+        </p>
+      )}
+      <MediaLightbox items={items} index={selected} onIndexChange={setSelected} />
+    </>
+  );
+}
@@ -0,0 +1,128 @@
+"use client";
+
+import { AnimatePresence, motion } from "framer-motion";
+import { useEffect } from "react";
+import { preloadNeighbors } from "@/lib/gallery";
+import type { MediaItem } from "@/types";
+
+export interface MediaLightboxProps {
+  items: readonly MediaItem[];
+  /** Open item, or `null` when closed */
+  index: number | null;
+  onIndexChange: (index: number | null) => void;
+  /** Neighbors preloaded on each side of the open item */
+  preloadRadius?: number;
+}
+
+/**
+ * Full-size media viewer with previous/next navigation (arrow keys, Esc to
+ * close). Neighbors of the open item are preloaded, so stepping through
+ * the gallery shows the next image immediately.
+ */
+export function MediaLightbox({
+  items,
+  index,
+  onIndexChange,
+  preloadRadius = 2,
+}: MediaLightboxProps) {
+  const item = index === null ? undefined : items[index];
+
+  useEffect(() => {
+    if (index !== null) preloadNeighbors(items, index, preloadRadius);
+  }, [items, index, preloadRadius]);
+
+  useEffect(() => {
+    if (index === null) return;
+
+    const onKeyDown = (event: KeyboardEvent) => {
+      if (event.key === "Escape") onIndexChange(null);
+      else if (event.key === "ArrowRight" && index < items.length - 1) onIndexChange(index + 1);
+      else if (event.key === "ArrowLeft" && index > 0) onIndexChange(index - 1);
+    };
+    window.addEventListener("keydown", onKeyDown);
+    return () => window.removeEventListener("keydown", onKeyDown);
+  }, [index, items.length, onIndexChange]);
+
+  return (
+    <AnimatePresence>
+      {item && index !== null && (
+        <motion.div
+          key="lightbox"
+          role="dialog"
+          aria-modal="true"
+          aria-label={item.caption ?? "Media viewer"}
+          className="fixed inset-0 z-50 flex items-center justify-center bg-knicks-black/90 p-4"
+          initial={{ opacity: 0 }}
+          animate={{ opacity: 1 }}
+          exit={{ opacity: 0 }}
+          onClick={() => onIndexChange(null)}
+        >
+          <figure
+            className="flex max-h-full max-w-5xl flex-col items-center gap-3"
+            onClick={(event) => event.stopPropagation()}
+          >
+            {item.type === "video" ? (
+              <video
+                key={item.id}
+                src={item.src}
+                poster={item.thumbnail}
+                controls
+                autoPlay
+                playsInline
+                className="max-h-[80vh] w-auto rounded-lg"
+              />
+            ) : (
+              // eslint-disable-next-line @next/next/no-img-element
+              <img
+                key={item.id}
+                src={item.src}
+                alt={item.caption ?? ""}
+                width={item.width}
+                height={item.height}
+                className="max-h-[80vh] w-auto rounded-lg object-contain"
+              />
+            )}
+            {item.caption && (
+              <figcaption className="text-sm text-knicks-silver">{item.caption}</figcaption>
+            )}
+          </figure>
+
+          <button
+            type="button"
+            aria-label="Close"
+            onClick={() => onIndexChange(null)}
+            className="absolute right-4 top-4 text-3xl text-white hover:text-knicks-orange"
+          >
+            ×
+          </button>
+          {index > 0 && (
+            <button
+              type="button"
+              aria-label="Previous"
+              onClick={(event) => {
+                event.stopPropagation();
+                onIndexChange(index - 1);
+              }}
+              className="absolute left-4 top-1/2 -translate-y-1/2 text-4xl text-white hover:text-knicks-orange"
+            >
+              ‹
+            </button>
+          )}
+          {index < items.length - 1 && (
+            <button
+              type="button"
+              aria-label="Next"
+              onClick={(event) => {
+                event.stopPropagation();
+                onIndexChange(index + 1);
+              }}
+              className="absolute right-4 top-1/2 -translate-y-1/2 text-4xl text-white hover:text-knicks-orange"
+            >
+              ›
+            </button>
+          )}
+        </motion.div>
+      )}
+    </AnimatePresence>
+  );
+}
@@ -0,0 +1,110 @@
+"use client";
+
+import { AnimatePresence, motion } from "framer-motion";
+import { memo } from "react";
+import { useLiveScoreStream } from "@/hooks";
+import { useLiveScores } from "@/lib/stores";
+import { cn } from "@/lib/utils";
+
+export interface ScoreTickerProps {
+  /** Stream endpoint */
+  url?: string;
+  className?: string;
+}
+
+const STATUS_LABELS = {
+  scheduled: "Upcoming",
+  halftime: "Half",
+  final: "Final",
+} as const;
+
+/**
+ * Score value that animates when it changes. Subscribes to a single number,
+ * so clock ticks and other games never re-render it.
+ */
+const TickerScore = memo(function TickerScore({
+  gameId,
+  side,
+}: {
+  gameId: string;
+  side: "knicksScore" | "opponentScore";
+}) {
+  const score = useLiveScores((state) => state.games[gameId]?.[side] ?? 0);
+
+  return (
+    <span className="relative inline-block min-w-[2ch] overflow-hidden text-right tabular-nums">
+      <AnimatePresence initial={false} mode="popLayout">
+        <motion.span
+          key={score}
+          className="inline-block"
+          initial={{ y: "100%", opacity: 0 }}
+          animate={{ y: 0, opacity: 1 }}
+          exit={{ y: "-100%", opacity: 0 }}
+          transition={{ duration: 0.25 }}
+        >
+          {score}
+        </motion.span>
+      </AnimatePresence>
+    </span>
+  );
+});
+
+const TickerClock = memo(function TickerClock({ gameId }: { gameId: string }) {
+  const status = useLiveScores((state) => state.games[gameId]?.status);
+  const period = useLiveScores((state) => state.games[gameId]?.period ?? 0);
+  const clock = useLiveScores((state) => state.games[gameId]?.clock ?? "");
+
+  if (!status) return null;
+  if (status !== "live") {
+    return <span className="text-knicks-silver">{STATUS_LABELS[status]}</span>;
+  }
+
+  const label = period > 4 ? `OT${period > 5 ? period - 4 : ""}` : `Q${period}`;
+  return (
+    <span className="tabular-nums text-knicks-orange">
+      {label} {clock}
+    </span>
+  );
+});
+
+const TickerCell = memo(function TickerCell({ gameId }: { gameId: string }) {
+  const opponent = useLiveScores((state) => state.games[gameId]?.opponent);
+  const isHome = useLiveScores((state) => state.games[gameId]?.isHome);
+
+  return (
+    <li className="flex shrink-0 items-center gap-3 px-4 py-2 text-sm">
+      <span className="font-bold">NYK</span>
+      <TickerScore gameId={gameId} side="knicksScore" />
+      <span className="text-knicks-silver">{isHome ? "vs" : "@"}</span>
+      <span className="font-bold">{opponent}</span>
+      <TickerScore gameId={gameId} side="opponentScore" />
+      <TickerClock gameId={gameId} />
+    </li>
+  );
+});
+
+/**
+ * Live score ticker. Each cell subscribes to its own slice of the live
+ * scores store, so an update re-renders only the values that changed.
+ */
+export function ScoreTicker({ url, className }: ScoreTickerProps) {
+  useLiveScoreStream(url);
+  const order = useLiveScores((state) => state.order);
+  const connected = useLiveScores((state) => state.connected);
+
+  if (order.length === 0) return null;
+
+  return (
+    <div
+      className={cn("bg-knicks-black text-white overflow-x-auto", className)}
+      aria-label="Live scores"
+      aria-busy={!connected}
+    >
+      <ul className="flex divide-x divide-knicks-silver/20">
+        {order.map((gameId) => (
+          <TickerCell key={gameId} gameId={gameId} />
+        ))}
+      </ul>
+    </div>
+  );
+}
@@ -0,0 +1,9 @@
+/**
+ * Section Components barrel export
+ */
+export * from "./ScoreTicker";
+export * from "./HeroVideo";
+export * from "./HeroVideoPlayer";
+export * from "./MasonryGallery";
+export * from "./MediaLightbox";
+export * from "./MediaGallery";
@@ -1,55 +1,56 @@
 import { ButtonHTMLAttributes, forwardRef } from "react";
 import { cn } from "@/lib/utils";
 
-export interface ButtonProps extends ButtonHTMLAttributes<HTMLButtonElement> {
+export interface ButtonStyleProps {
   /** Button variant styling */
   variant?: "primary" | "secondary" | "outline" | "ghost";
   /** Button size */
   size?: "sm" | "md" | "lg";
   /** Full width button */
   fullWidth?: boolean;
+  className?: string;
+}
+
+export interface ButtonProps
+  extends ButtonHTMLAttributes<HTMLButtonElement>,
+    Omit<ButtonStyleProps, "className"> {}
+
+const baseStyles = "inline-flex items-center justify-center font-semibold rounded-lg transition-all duration-200 disabled:opacity-50 disabled:cursor-not-allowed";
+
+const variants = {
+  primary: "bg-knicks-blue text-white hover:bg-blue-700 active:bg-blue-800",
+  secondary: "bg-knicks-orange text-white hover:bg-orange-600 active:bg-orange-700",
+  outline: "border-2 border-knicks-blue text-knicks-blue hover:bg-knicks-blue hover:text-white",
+  ghost: "text-knicks-blue hover:bg-knicks-blue/10",
+};
+
+const sizes = {
+  sm: "px-4 py-2 text-sm",
+  md: "px-6 py-3 text-base",
+  lg: "px-8 py-4 text-lg",
+};
+
+/**
+ * Button classes, for links and other elements styled as buttons
+ */
+export function buttonVariants({
+  variant = "primary",
+  size = "md",
+  fullWidth = false,
+  className,
+}: ButtonStyleProps = {}): string {
+  return cn(baseStyles, variants[variant], sizes[size], fullWidth && "w-full", className);
 }
 
 /**
  * Reusable Button component with Knicks branding
  */
 export const Button = forwardRef<HTMLButtonElement, ButtonProps>(
-  (
-    {
-      variant = "primary",
-      size = "md",
-      fullWidth = false,
-      className,
-      children,
-      ...props
-    },
-    ref
-  ) => {
-    const baseStyles = "inline-flex items-center justify-center font-semibold rounded-lg transition-all duration-200 disabled:opacity-50 disabled:cursor-not-allowed";
-
-    const variants = {
-      primary: "bg-knicks-blue text-white hover:bg-blue-700 active:bg-blue-800",
-      secondary: "bg-knicks-orange text-white hover:bg-orange-600 active:bg-orange-700",
-      outline: "border-2 border-knicks-blue text-knicks-blue hover:bg-knicks-blue hover:text-white",
-      ghost: "text-knicks-blue hover:bg-knicks-blue/10",
-    };
-
-    const sizes = {
-      sm: "px-4 py-2 text-sm",
-      md: "px-6 py-3 text-base",
-      lg: "px-8 py-4 text-lg",
-    };
-
+  ({ variant, size, fullWidth, className, children, ...props }, ref) => {
     return (
       <button
         ref={ref}
-        className={cn(
-          baseStyles,
-          variants[variant],
-          sizes[size],
-          fullWidth && "w-full",
-          className
-        )}
+        className={buttonVariants({ variant, size, fullWidth, className })}
         {...props}
       >
         {children}
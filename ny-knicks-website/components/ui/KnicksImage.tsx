@@ -0,0 +1,89 @@
+import type { ImgHTMLAttributes } from "react";
+import { buildSrcSet, getImageEntry } from "@/lib/images";
+import { cn } from "@/lib/utils";
+
+export interface KnicksImageProps
+  extends Omit<
+    ImgHTMLAttributes<HTMLImageElement>,
+    "src" | "srcSet" | "width" | "height" | "placeholder"
+  > {
+  /** Source path or URL, as listed in the image manifest */
+  src: string;
+  alt: string;
+  /** `sizes` attribute; defaults to full viewport width */
+  sizes?: string;
+  /** Load eagerly with high fetch priority (LCP images) */
+  priority?: boolean;
+  /** Show the blurred placeholder while loading */
+  placeholder?: "blur" | "empty";
+}
+
+/**
+ * Responsive image backed by the build-time image manifest.
+ *
+ * Emits a `<picture>` with AVIF and WebP `srcset`s and intrinsic
+ * width/height (so the browser reserves space and nothing shifts), with no
+ * runtime image processing. Images missing from the manifest render as a
+ * plain `<img>`.
+ */
+export function KnicksImage({
+  src,
+  alt,
+  sizes = "100vw",
+  priority = false,
+  placeholder = "blur",
+  className,
+  style,
+  ...props
+}: KnicksImageProps) {
+  const entry = getImageEntry(src);
+  const loading = priority ? "eager" : "lazy";
+  const fetchPriority = priority ? "high" : "auto";
+
+  if (!entry) {
+    return (
+      // eslint-disable-next-line @next/next/no-img-element
+      <img
+        src={src}
+        alt={alt}
+        loading={loading}
+        fetchPriority={fetchPriority}
+        decoding="async"
+        className={className}
+        style={style}
+        {...props}
+      />
+    );
+  }
+
+  const fallback = entry.variants.webp[entry.variants.webp.length - 1];
+
+  return (
+    <picture>
+      <source type="image/avif" srcSet={buildSrcSet(entry.variants.avif)} sizes={sizes} />
+      <source type="image/webp" srcSet={buildSrcSet(entry.variants.webp)} sizes={sizes} />
+      {/* eslint-disable-next-line @next/next/no-img-element */}
+      <img
+        src={fallback?.path ?? src}
+        alt={alt}
+        width={entry.width}
+        height={entry.height}
+        loading={loading}
+        fetchPriority={fetchPriority}
+        decoding={priority ? "sync" : "async"}
+        className={cn("h-auto max-w-full", className)}
+        style={
+          placeholder === "blur"
+            ? {
+                backgroundImage: `url("${entry.placeholder}")`,
+                backgroundSize: "cover",
+                backgroundPosition: "center",
+                ...style,
+              }
+            : style
+        }
+        {...props}
+      />
+    </picture>
+  );
+}
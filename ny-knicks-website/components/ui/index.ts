@@ -2,3 +2,4 @@
  * UI Components barrel export
  */
 export * from "./Button";
+export * from "./KnicksImage";
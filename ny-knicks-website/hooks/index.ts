@@ -1,5 +1,8 @@
 /**
  * Custom hooks barrel export
- * TODO: Add custom hooks as needed
  */
-export {};
+export * from "./useCursorPagination";
+export * from "./useLenis";
+export * from "./useLiveScoreStream";
+export * from "./useScrollScheduler";
+export * from "./useSearch";
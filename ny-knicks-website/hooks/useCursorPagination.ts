@@ -0,0 +1,72 @@
+"use client";
+
+import { useCallback, useEffect, useRef, useState } from "react";
+
+export interface CursorPage<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+export type FetchCursorPage<T> = (
+  cursor: string | null,
+  signal: AbortSignal
+) => Promise<CursorPage<T>>;
+
+/**
+ * Accumulates cursor-paginated results. `loadMore` is safe to call on every
+ * frame: it is a no-op while a page is in flight, after a failed fetch (until
+ * `retry`) or once the feed is done. To start over (e.g. a new filter),
+ * remount the consumer with a different `key`.
+ */
+export function useCursorPagination<T>(fetchPage: FetchCursorPage<T>) {
+  const [items, setItems] = useState<T[]>([]);
+  const [hasMore, setHasMore] = useState(true);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState<Error | null>(null);
+
+  const state = useRef(initialState());
+  const controller = useRef<AbortController | null>(null);
+
+  useEffect(() => () => controller.current?.abort(), []);
+
+  const loadMore = useCallback(() => {
+    const current = state.current;
+    if (current.inFlight || current.failed || current.done) return;
+
+    current.inFlight = true;
+    const abort = new AbortController();
+    controller.current = abort;
+    setLoading(true);
+
+    fetchPage(current.cursor, abort.signal)
+      .then((page) => {
+        if (abort.signal.aborted) return;
+        current.cursor = page.nextCursor;
+        current.done = page.nextCursor === null;
+        setItems((previous) => previous.concat(page.items));
+        setHasMore(!current.done);
+        setError(null);
+      })
+      .catch((reason: unknown) => {
+        if (abort.signal.aborted) return;
+        current.failed = true;
+        setError(reason instanceof Error ? reason : new Error(String(reason)));
+      })
+      .finally(() => {
+        if (abort.signal.aborted) return;
+        current.inFlight = false;
+        setLoading(false);
+      });
+  }, [fetchPage]);
+
+  const retry = useCallback(() => {
+    state.current.failed = false;
+    loadMore();
+  }, [loadMore]);
+
+  return { items, hasMore, loading, error, loadMore, retry };
+}
+
+function initialState() {
+  return { cursor: null as string | null, done: false, inFlight: false, failed: false };
+}
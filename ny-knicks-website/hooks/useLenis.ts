@@ -0,0 +1,25 @@
+"use client";
+
+import { useEffect, useRef, useSyncExternalStore } from "react";
+import type Lenis from "@studio-freight/lenis";
+import { getLenis, subscribeLenis } from "@/lib/animation";
+
+/**
+ * The active Lenis instance (null before mount and with reduced motion).
+ * The optional callback runs on every smooth-scroll step.
+ */
+export function useLenis(onScroll?: (lenis: Lenis) => void): Lenis | null {
+  const lenis = useSyncExternalStore(subscribeLenis, getLenis, () => null);
+  const onScrollRef = useRef(onScroll);
+
+  useEffect(() => {
+    onScrollRef.current = onScroll;
+  });
+
+  useEffect(() => {
+    if (!lenis) return;
+    return lenis.on("scroll", () => onScrollRef.current?.(lenis));
+  }, [lenis]);
+
+  return lenis;
+}
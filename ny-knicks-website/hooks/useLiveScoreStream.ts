@@ -0,0 +1,38 @@
+"use client";
+
+import { useEffect } from "react";
+import type { ScoreBatch, ScoreSnapshot } from "@/lib/live/delta";
+import { markOnce, PERF_MARKS } from "@/lib/perf/marks";
+import { useLiveScores } from "@/lib/stores";
+
+/**
+ * Connects to the live score stream and feeds the live scores store.
+ * EventSource reconnects on its own and sends `Last-Event-ID`, so after a
+ * drop the server replays only the missed batches.
+ */
+export function useLiveScoreStream(url = "/api/scores/stream") {
+  useEffect(() => {
+    const { epoch, seq, applySnapshot, applyBatch, setConnected } =
+      useLiveScores.getState();
+
+    // Resume across remounts (e.g. client-side navigation) as well
+    const source = new EventSource(
+      epoch ? `${url}?since=${encodeURIComponent(`${epoch}:${seq}`)}` : url
+    );
+
+    source.addEventListener("snapshot", (event) => {
+      applySnapshot(JSON.parse((event as MessageEvent<string>).data) as ScoreSnapshot);
+      markOnce(PERF_MARKS.tickerFirstUpdate);
+    });
+    source.addEventListener("batch", (event) => {
+      applyBatch(JSON.parse((event as MessageEvent<string>).data) as ScoreBatch);
+    });
+    source.onopen = () => setConnected(true);
+    source.onerror = () => setConnected(false);
+
+    return () => {
+      source.close();
+      setConnected(false);
+    };
+  }, [url]);
+}
@@ -0,0 +1,54 @@
+"use client";
+
+import { useEffect, useRef, type RefObject } from "react";
+import {
+  getFrameScheduler,
+  observeVisibility,
+  type FrameCallback,
+  type FramePhase,
+} from "@/lib/animation";
+
+export interface UseScrollSchedulerOptions {
+  /** Name shown in frame timing instrumentation */
+  id: string;
+  /** `read` for DOM measurements, `write` for DOM mutations */
+  phase?: FramePhase;
+  budgetMs?: number;
+  /** Only run while this element is on (or near) the screen */
+  target?: RefObject<Element | null>;
+  enabled?: boolean;
+}
+
+/**
+ * Run a callback every frame on the shared scheduler, alongside Lenis, GSAP
+ * and Framer Motion
+ */
+export function useScrollScheduler(
+  callback: FrameCallback,
+  { id, phase = "update", budgetMs, target, enabled = true }: UseScrollSchedulerOptions
+) {
+  const callbackRef = useRef(callback);
+
+  useEffect(() => {
+    callbackRef.current = callback;
+  });
+
+  useEffect(() => {
+    if (!enabled) return;
+
+    const element = target?.current ?? null;
+    const handle = getFrameScheduler().add(
+      id,
+      (time, delta) => callbackRef.current(time, delta),
+      { phase, budgetMs, active: !element }
+    );
+    const stopObserving = element
+      ? observeVisibility(element, (visible) => handle.setActive(visible))
+      : null;
+
+    return () => {
+      stopObserving?.();
+      handle.remove();
+    };
+  }, [id, phase, budgetMs, target, enabled]);
+}
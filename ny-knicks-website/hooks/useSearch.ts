@@ -0,0 +1,68 @@
+"use client";
+
+import { useEffect, useRef, useState } from "react";
+import { searchIndexUrl, type SearchIndexName } from "@/lib/search/documents";
+import type { SearchWorkerRequest, SearchWorkerResponse } from "@/lib/search/search.worker";
+import type { SearchQuery, SearchResult } from "@/lib/search/types";
+
+export interface SearchState<THit> {
+  ready: boolean;
+  /** Facet field -> every value in the index, for filter controls */
+  facetValues: Record<string, string[]>;
+  result: SearchResult<THit> | null;
+  error: string | null;
+}
+
+/**
+ * Query a prebuilt search index in a Web Worker. The index downloads once
+ * per mount; every query change is answered off the main thread, and only
+ * the latest answer is kept.
+ */
+export function useSearch<THit>(name: SearchIndexName, query: SearchQuery): SearchState<THit> {
+  const [state, setState] = useState<SearchState<THit>>({
+    ready: false,
+    facetValues: {},
+    result: null,
+    error: null,
+  });
+  const workerRef = useRef<Worker | null>(null);
+  const latestId = useRef(0);
+
+  useEffect(() => {
+    const worker = new Worker(new URL("../lib/search/search.worker.ts", import.meta.url), {
+      type: "module",
+    });
+    workerRef.current = worker;
+
+    worker.onmessage = (event: MessageEvent<SearchWorkerResponse>) => {
+      const message = event.data;
+      if (message.type === "ready") {
+        setState((previous) => ({ ...previous, ready: true, facetValues: message.facetValues }));
+      } else if (message.type === "result") {
+        if (message.id !== latestId.current) return;
+        const result = message.result as SearchResult<THit>;
+        setState((previous) => ({ ...previous, result, error: null }));
+      } else if (message.id === undefined || message.id === latestId.current) {
+        setState((previous) => ({ ...previous, error: message.message }));
+      }
+    };
+    worker.postMessage({ type: "load", url: searchIndexUrl(name) } satisfies SearchWorkerRequest);
+
+    return () => {
+      worker.terminate();
+      workerRef.current = null;
+    };
+  }, [name]);
+
+  const queryKey = JSON.stringify(query);
+  useEffect(() => {
+    const id = ++latestId.current;
+    workerRef.current?.postMessage({
+      type: "query",
+      id,
+      query: JSON.parse(queryKey) as SearchQuery,
+    } satisfies SearchWorkerRequest);
+  }, [name, queryKey]);
+
+  return state;
+}
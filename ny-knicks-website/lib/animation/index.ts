@@ -0,0 +1,6 @@
+/**
+ * Animation runtime barrel export
+ */
+export * from "./scheduler";
+export * from "./smoothScroll";
+export * from "./visibility";
@@ -0,0 +1,267 @@
+import { cancelFrame, frame } from "framer-motion";
+
+/**
+ * Single requestAnimationFrame scheduler for every animation engine.
+ *
+ * Tasks run inside Framer Motion's frameloop, which already owns one RAF
+ * and splits each frame into read, update and render steps, so Lenis, GSAP
+ * and Motion all advance in the same tick. Tasks declare a phase: all DOM
+ * reads run before any update, and all writes run last, so layout is never
+ * forced mid-frame. Each task is timed against a per-task budget.
+ */
+
+export type FramePhase = "read" | "update" | "write";
+
+export type FrameCallback = (time: number, delta: number) => void;
+
+export interface FrameTaskOptions {
+  phase?: FramePhase;
+  /** Time a single call may take before it is reported as over budget */
+  budgetMs?: number;
+  /** Inactive tasks are skipped, e.g. while their section is off screen */
+  active?: boolean;
+}
+
+export interface FrameTaskHandle {
+  readonly id: string;
+  setActive: (active: boolean) => void;
+  remove: () => void;
+}
+
+export interface FrameTaskTiming {
+  id: string;
+  phase: FramePhase;
+  active: boolean;
+  budgetMs: number;
+  calls: number;
+  lastMs: number;
+  /** Exponential moving average */
+  avgMs: number;
+  maxMs: number;
+  overBudget: number;
+}
+
+export interface FrameStats {
+  frames: number;
+  droppedFrames: number;
+  fps: number;
+  /** Time spent in scheduled tasks during the last frame */
+  lastFrameMs: number;
+  worstFrameMs: number;
+  tasks: FrameTaskTiming[];
+}
+
+interface FrameTask extends FrameTaskTiming {
+  callback: FrameCallback;
+}
+
+interface FrameInfo {
+  timestamp: number;
+  delta: number;
+}
+
+const FRAME_MS = 1000 / 60;
+const DEFAULT_BUDGET_MS = 2;
+const SMOOTHING = 0.1;
+
+export class FrameScheduler {
+  private readonly tasks: Record<FramePhase, Map<string, FrameTask>> = {
+    read: new Map(),
+    update: new Map(),
+    write: new Map(),
+  };
+  private running = false;
+  private lastTimestamp: number | null = null;
+  private frameWorkMs = 0;
+  private frames = 0;
+  private droppedFrames = 0;
+  private fps = 60;
+  private lastFrameMs = 0;
+  private worstFrameMs = 0;
+
+  private readonly runRead = ({ timestamp, delta }: FrameInfo) => {
+    this.recordFrame(timestamp);
+    this.frameWorkMs = 0;
+    this.runPhase("read", timestamp, delta);
+  };
+
+  private readonly runUpdate = ({ timestamp, delta }: FrameInfo) => {
+    this.runPhase("update", timestamp, delta);
+  };
+
+  private readonly runWrite = ({ timestamp, delta }: FrameInfo) => {
+    this.runPhase("write", timestamp, delta);
+    this.lastFrameMs = this.frameWorkMs;
+    this.worstFrameMs = Math.max(this.worstFrameMs, this.frameWorkMs);
+  };
+
+  /** Register a per-frame task. Ids only need to be unique per phase. */
+  add(
+    id: string,
+    callback: FrameCallback,
+    { phase = "update", budgetMs = DEFAULT_BUDGET_MS, active = true }: FrameTaskOptions = {}
+  ): FrameTaskHandle {
+    const tasks = this.tasks[phase];
+    let taskId = id;
+    for (let n = 2; tasks.has(taskId); n++) taskId = `${id}#${n}`;
+
+    const task: FrameTask = {
+      id: taskId,
+      phase,
+      active,
+      budgetMs,
+      callback,
+      calls: 0,
+      lastMs: 0,
+      avgMs: 0,
+      maxMs: 0,
+      overBudget: 0,
+    };
+    tasks.set(taskId, task);
+    this.sync();
+
+    return {
+      id: taskId,
+      setActive: (next) => {
+        task.active = next;
+        this.sync();
+      },
+      remove: () => {
+        if (tasks.get(taskId) === task) tasks.delete(taskId);
+        this.sync();
+      },
+    };
+  }
+
+  /** Run `callback` once in the read phase of the next frame */
+  read(callback: () => void): void {
+    frame.read(() => this.timeOnce(callback));
+  }
+
+  /** Run `callback` once in the write phase of the next frame */
+  write(callback: () => void): void {
+    frame.render(() => this.timeOnce(callback));
+  }
+
+  stats(): FrameStats {
+    const tasks = (["read", "update", "write"] as const).flatMap((phase) =>
+      Array.from(this.tasks[phase].values(), (task) => ({
+        id: task.id,
+        phase: task.phase,
+        active: task.active,
+        budgetMs: task.budgetMs,
+        calls: task.calls,
+        lastMs: task.lastMs,
+        avgMs: task.avgMs,
+        maxMs: task.maxMs,
+        overBudget: task.overBudget,
+      }))
+    );
+    return {
+      frames: this.frames,
+      droppedFrames: this.droppedFrames,
+      fps: this.fps,
+      lastFrameMs: this.lastFrameMs,
+      worstFrameMs: this.worstFrameMs,
+      tasks,
+    };
+  }
+
+  resetStats(): void {
+    this.frames = 0;
+    this.droppedFrames = 0;
+    this.worstFrameMs = 0;
+    for (const tasks of Object.values(this.tasks)) {
+      for (const task of Array.from(tasks.values())) {
+        task.calls = 0;
+        task.maxMs = 0;
+        task.overBudget = 0;
+      }
+    }
+  }
+
+  /** Keep the loop running only while some task is active */
+  private sync() {
+    const hasActive = Object.values(this.tasks).some((tasks) =>
+      Array.from(tasks.values()).some((task) => task.active)
+    );
+
+    if (hasActive && !this.running) {
+      this.running = true;
+      this.lastTimestamp = null;
+      frame.read(this.runRead, true);
+      frame.update(this.runUpdate, true);
+      frame.render(this.runWrite, true);
+    } else if (!hasActive && this.running) {
+      this.running = false;
+      cancelFrame(this.runRead);
+      cancelFrame(this.runUpdate);
+      cancelFrame(this.runWrite);
+    }
+  }
+
+  /**
+   * A throwing task is reported once and removed, so it can't stop the rest
+   * of the phase or Motion's frameloop that Lenis and GSAP also run on
+   */
+  private runPhase(phase: FramePhase, time: number, delta: number) {
+    let failed = false;
+    for (const task of Array.from(this.tasks[phase].values())) {
+      if (!task.active) continue;
+
+      const start = performance.now();
+      try {
+        task.callback(time, delta);
+      } catch (error) {
+        console.error(`Frame task "${task.id}" threw and was removed`, error);
+        this.tasks[phase].delete(task.id);
+        failed = true;
+      } finally {
+        const elapsed = performance.now() - start;
+        this.frameWorkMs += elapsed;
+        task.calls++;
+        task.lastMs = elapsed;
+        task.avgMs += (elapsed - task.avgMs) * SMOOTHING;
+        task.maxMs = Math.max(task.maxMs, elapsed);
+        if (elapsed > task.budgetMs) task.overBudget++;
+      }
+    }
+    if (failed) this.sync();
+  }
+
+  private timeOnce(callback: () => void) {
+    const start = performance.now();
+    try {
+      callback();
+    } catch (error) {
+      console.error("One-off frame callback threw", error);
+    } finally {
+      this.frameWorkMs += performance.now() - start;
+    }
+  }
+
+  // Motion clamps its own delta, so frame pacing is measured from raw timestamps
+  private recordFrame(timestamp: number) {
+    const previous = this.lastTimestamp;
+    this.lastTimestamp = timestamp;
+    if (previous === null) return;
+
+    const elapsed = timestamp - previous;
+    this.frames++;
+    if (elapsed > FRAME_MS * 1.5) {
+      this.droppedFrames += Math.round(elapsed / FRAME_MS) - 1;
+    }
+    if (elapsed > 0) this.fps += (1000 / elapsed - this.fps) * SMOOTHING;
+  }
+}
+
+const globalForScheduler = globalThis as unknown as {
+  knicksFrameScheduler?: FrameScheduler;
+};
+
+export function getFrameScheduler(): FrameScheduler {
+  if (!globalForScheduler.knicksFrameScheduler) {
+    globalForScheduler.knicksFrameScheduler = new FrameScheduler();
+  }
+  return globalForScheduler.knicksFrameScheduler;
+}
@@ -0,0 +1,63 @@
+import Lenis from "@studio-freight/lenis";
+import { gsap } from "gsap";
+import { ScrollTrigger } from "gsap/ScrollTrigger";
+import { getFrameScheduler, type FrameScheduler } from "./scheduler";
+
+/**
+ * Lenis smooth scrolling and GSAP, both driven by the shared frame scheduler
+ * instead of their own requestAnimationFrame loops
+ */
+
+export type LenisOptions = ConstructorParameters<typeof Lenis>[0];
+
+let currentLenis: Lenis | null = null;
+const lenisListeners = new Set<() => void>();
+
+function setLenis(lenis: Lenis | null) {
+  currentLenis = lenis;
+  lenisListeners.forEach((listener) => listener());
+}
+
+export function getLenis(): Lenis | null {
+  return currentLenis;
+}
+
+/** Subscribe to the Lenis instance being created or destroyed */
+export function subscribeLenis(listener: () => void): () => void {
+  lenisListeners.add(listener);
+  return () => lenisListeners.delete(listener);
+}
+
+/**
+ * Start smooth scrolling; returns a cleanup function. With
+ * `prefers-reduced-motion` native scrolling is kept and only GSAP is moved
+ * onto the shared frame.
+ */
+export function startSmoothScroll(
+  options?: LenisOptions,
+  scheduler: FrameScheduler = getFrameScheduler()
+): () => void {
+  gsap.registerPlugin(ScrollTrigger);
+
+  const reducedMotion = window.matchMedia("(prefers-reduced-motion: reduce)").matches;
+  const lenis = reducedMotion ? null : new Lenis(options);
+
+  // Lenis first, so ScrollTrigger sees this frame's scroll position
+  const lenisTask = lenis
+    ? scheduler.add("lenis", (time) => lenis.raf(time), { budgetMs: 1 })
+    : null;
+  lenis?.on("scroll", ScrollTrigger.update);
+
+  gsap.ticker.remove(gsap.updateRoot);
+  const gsapTask = scheduler.add("gsap", (time) => gsap.updateRoot(time / 1000));
+
+  setLenis(lenis);
+
+  return () => {
+    gsapTask.remove();
+    gsap.ticker.add(gsap.updateRoot);
+    lenisTask?.remove();
+    lenis?.destroy();
+    setLenis(null);
+  };
+}
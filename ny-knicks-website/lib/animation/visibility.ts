@@ -0,0 +1,46 @@
+/**
+ * One shared IntersectionObserver for every scheduled section, used to
+ * pause per-frame work while a section is off screen
+ */
+
+type VisibilityListener = (visible: boolean) => void;
+
+/** Start work a little before a section scrolls into view */
+const ROOT_MARGIN = "25% 0px";
+
+const listeners = new Map<Element, Set<VisibilityListener>>();
+let observer: IntersectionObserver | null = null;
+
+function getObserver(): IntersectionObserver {
+  if (!observer) {
+    observer = new IntersectionObserver(
+      (entries) => {
+        for (const entry of entries) {
+          listeners.get(entry.target)?.forEach((listener) => listener(entry.isIntersecting));
+        }
+      },
+      { rootMargin: ROOT_MARGIN }
+    );
+  }
+  return observer;
+}
+
+export function observeVisibility(element: Element, listener: VisibilityListener): () => void {
+  let set = listeners.get(element);
+  if (!set) {
+    set = new Set();
+    listeners.set(element, set);
+    getObserver().observe(element);
+  }
+  set.add(listener);
+
+  return () => {
+    const current = listeners.get(element);
+    if (!current) return;
+    current.delete(listener);
+    if (current.size === 0) {
+      listeners.delete(element);
+      observer?.unobserve(element);
+    }
+  };
+}
@@ -2,3 +2,4 @@
  * Constants barrel export
  */
 export * from "./colors";
+export * from "./routes";
@@ -0,0 +1,33 @@
+/**
+ * Site routes, shared by navigation, links and on-demand revalidation
+ */
+export const SITE_ROUTES = {
+  home: "/",
+  roster: "/roster",
+  schedule: "/schedule",
+  news: "/news",
+  tickets: "/tickets",
+  shop: "/shop",
+  history: "/history",
+  contact: "/contact",
+  offline: "/offline",
+} as const;
+
+export const NAV_LINKS = [
+  { href: SITE_ROUTES.home, label: "Home" },
+  { href: SITE_ROUTES.roster, label: "Roster" },
+  { href: SITE_ROUTES.schedule, label: "Schedule" },
+  { href: SITE_ROUTES.news, label: "News" },
+  { href: SITE_ROUTES.tickets, label: "Tickets" },
+  { href: SITE_ROUTES.shop, label: "Shop" },
+  { href: SITE_ROUTES.history, label: "History" },
+  { href: SITE_ROUTES.contact, label: "Contact" },
+] as const;
+
+export function playerPath(id: string): string {
+  return `${SITE_ROUTES.roster}/${encodeURIComponent(id)}`;
+}
+
+export function newsArticlePath(slug: string): string {
+  return `${SITE_ROUTES.news}/${encodeURIComponent(slug)}`;
+}
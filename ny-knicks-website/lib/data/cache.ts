@@ -0,0 +1,201 @@
+/**
+ * In-process entity cache with TTL, LRU eviction, tag invalidation and
+ * request coalescing.
+ *
+ * Entries are fresh for `ttlMs`, then served stale for up to
+ * `staleWhileRevalidateMs` while a single background refresh runs.
+ * Concurrent misses for the same key share one in-flight loader.
+ */
+
+export interface EntityCacheOptions {
+  /** Maximum number of entries kept before the least recently used is evicted */
+  maxEntries?: number;
+  /** How long an entry is served without revalidation */
+  ttlMs?: number;
+  /** How long an expired entry may still be served while it is refreshed */
+  staleWhileRevalidateMs?: number;
+  /** Clock, injectable for tests and benchmarks */
+  now?: () => number;
+}
+
+export interface EntityCacheStats {
+  hits: number;
+  staleHits: number;
+  misses: number;
+  coalesced: number;
+  evictions: number;
+  refreshErrors: number;
+  size: number;
+}
+
+interface CacheEntry {
+  value: unknown;
+  storedAt: number;
+  tags: readonly string[];
+}
+
+export class EntityCache {
+  private readonly entries = new Map<string, CacheEntry>();
+  private readonly inflight = new Map<
+    string,
+    { promise: Promise<unknown>; tags: readonly string[] }
+  >();
+  private readonly tagIndex = new Map<string, Set<string>>();
+  private readonly tagVersions = new Map<string, number>();
+  private readonly maxEntries: number;
+  private readonly ttlMs: number;
+  private readonly staleWhileRevalidateMs: number;
+  private readonly now: () => number;
+  private readonly counters = {
+    hits: 0,
+    staleHits: 0,
+    misses: 0,
+    coalesced: 0,
+    evictions: 0,
+    refreshErrors: 0,
+  };
+
+  constructor({
+    maxEntries = 500,
+    ttlMs = 60_000,
+    staleWhileRevalidateMs = 5 * 60_000,
+    now = Date.now,
+  }: EntityCacheOptions = {}) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.staleWhileRevalidateMs = staleWhileRevalidateMs;
+    this.now = now;
+  }
+
+  /**
+   * Return the cached value for `key`, loading it with `loader` on a miss.
+   * `tags` are recorded so the entry can be dropped by `invalidateTag`.
+   */
+  async get<T>(
+    key: string,
+    tags: readonly string[],
+    loader: () => Promise<T>
+  ): Promise<T> {
+    const entry = this.entries.get(key);
+
+    if (entry) {
+      const age = this.now() - entry.storedAt;
+
+      // Re-insert to mark as most recently used
+      this.entries.delete(key);
+      this.entries.set(key, entry);
+
+      if (age < this.ttlMs) {
+        this.counters.hits++;
+        return entry.value as T;
+      }
+
+      if (age < this.ttlMs + this.staleWhileRevalidateMs) {
+        this.counters.staleHits++;
+        this.load(key, tags, loader).catch(() => {
+          this.counters.refreshErrors++;
+        });
+        return entry.value as T;
+      }
+    }
+
+    this.counters.misses++;
+    return this.load(key, tags, loader);
+  }
+
+  /** Drop every entry recorded under `tag` */
+  invalidateTag(tag: string): number {
+    this.tagVersions.set(tag, (this.tagVersions.get(tag) ?? 0) + 1);
+
+    // Later callers must not join a query that started before the change
+    for (const [key, pending] of Array.from(this.inflight)) {
+      if (pending.tags.includes(tag)) this.inflight.delete(key);
+    }
+
+    const keys = this.tagIndex.get(tag);
+    if (!keys) return 0;
+
+    let removed = 0;
+    for (const key of Array.from(keys)) {
+      if (this.delete(key)) removed++;
+    }
+    this.tagIndex.delete(tag);
+    return removed;
+  }
+
+  delete(key: string): boolean {
+    const entry = this.entries.get(key);
+    if (!entry) return false;
+
+    this.entries.delete(key);
+    for (const tag of entry.tags) {
+      const keys = this.tagIndex.get(tag);
+      keys?.delete(key);
+      if (keys && keys.size === 0) this.tagIndex.delete(tag);
+    }
+    return true;
+  }
+
+  clear(): void {
+    this.entries.clear();
+    this.inflight.clear();
+    this.tagIndex.clear();
+    this.tagVersions.clear();
+  }
+
+  stats(): EntityCacheStats {
+    return { ...this.counters, size: this.entries.size };
+  }
+
+  private load<T>(
+    key: string,
+    tags: readonly string[],
+    loader: () => Promise<T>
+  ): Promise<T> {
+    const pending = this.inflight.get(key);
+    if (pending) {
+      this.counters.coalesced++;
+      return pending.promise as Promise<T>;
+    }
+
+    const versions = tags.map((tag) => this.tagVersions.get(tag) ?? 0);
+    const promise: Promise<T> = loader()
+      .then((value) => {
+        // Skip storing results that were invalidated while the query ran
+        const invalidated = tags.some(
+          (tag, i) => (this.tagVersions.get(tag) ?? 0) !== versions[i]
+        );
+        if (!invalidated) this.set(key, tags, value);
+        return value;
+      })
+      .finally(() => {
+        if (this.inflight.get(key)?.promise === promise) {
+          this.inflight.delete(key);
+        }
+      });
+
+    this.inflight.set(key, { promise, tags });
+    return promise;
+  }
+
+  private set(key: string, tags: readonly string[], value: unknown): void {
+    this.delete(key);
+    this.entries.set(key, { value, storedAt: this.now(), tags });
+
+    for (const tag of tags) {
+      let keys = this.tagIndex.get(tag);
+      if (!keys) {
+        keys = new Set();
+        this.tagIndex.set(tag, keys);
+      }
+      keys.add(key);
+    }
+
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest === undefined) break;
+      this.delete(oldest);
+      this.counters.evictions++;
+    }
+  }
+}
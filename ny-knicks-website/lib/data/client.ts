@@ -0,0 +1,81 @@
+import { EntityCache } from "./cache";
+import { FIXTURE_SEED } from "./fixtures";
+import { createMemoryDataSource } from "./memory";
+import type { DataSource } from "./source";
+import { createSupabaseDataSource, isSupabaseConfigured } from "./supabase";
+
+/**
+ * Process-wide data source and entity cache.
+ *
+ * `DATA_SOURCE=memory` forces the in-memory fixtures; otherwise Supabase is
+ * used whenever it is configured, so local builds work without credentials.
+ */
+
+export const DATA_TAGS = {
+  players: "players",
+  games: "games",
+  news: "news",
+  media: "media",
+} as const;
+
+export type DataTag = (typeof DATA_TAGS)[keyof typeof DATA_TAGS];
+
+export function playerTag(id: string) {
+  return `player:${id}`;
+}
+
+export function newsArticleTag(slug: string) {
+  return `news:${slug}`;
+}
+
+const globalForData = globalThis as unknown as {
+  knicksDataSource?: DataSource;
+  knicksDataCache?: EntityCache;
+};
+
+export function getDataSource(): DataSource {
+  if (!globalForData.knicksDataSource) {
+    const useMemory =
+      process.env.DATA_SOURCE === "memory" ||
+      (process.env.DATA_SOURCE !== "supabase" && !isSupabaseConfigured());
+
+    globalForData.knicksDataSource = useMemory
+      ? createMemoryDataSource(FIXTURE_SEED)
+      : createSupabaseDataSource();
+  }
+  return globalForData.knicksDataSource;
+}
+
+/** Swap the active data source (tests, benchmarks) and drop cached data */
+export function setDataSource(source: DataSource): void {
+  globalForData.knicksDataSource = source;
+  getDataCache().clear();
+}
+
+/** Numeric env setting; missing, malformed or negative values use `fallback` */
+function envNumber(name: string, fallback: number): number {
+  const raw = process.env[name]?.trim();
+  const value = raw ? Number(raw) : Number.NaN;
+  if (Number.isFinite(value) && value >= 0) return value;
+  if (raw) console.warn(`Ignoring invalid ${name}=${raw}; using ${fallback}`);
+  return fallback;
+}
+
+export function getDataCache(): EntityCache {
+  if (!globalForData.knicksDataCache) {
+    globalForData.knicksDataCache = new EntityCache({
+      maxEntries: envNumber("DATA_CACHE_MAX_ENTRIES", 500),
+      ttlMs: envNumber("DATA_CACHE_TTL_MS", 60_000),
+      // Off by default: pages are ISR, so a stale hit would be written into
+      // the shared page cache and outlive the entity until the next revalidate
+      staleWhileRevalidateMs: envNumber("DATA_CACHE_SWR_MS", 0),
+    });
+  }
+  return globalForData.knicksDataCache;
+}
+
+/** Drop cached entries for one or more tags; returns the number removed */
+export function revalidateData(...tags: string[]): number {
+  const cache = getDataCache();
+  return tags.reduce((removed, tag) => removed + cache.invalidateTag(tag), 0);
+}
@@ -0,0 +1,83 @@
+import type { GameRow, MediaRow, NewsRow, PlayerRow } from "./rows";
+import type { MemorySeed } from "./memory";
+import { createSyntheticMedia } from "./synthetic";
+
+/**
+ * Seed rows for the in-memory data source, used when Supabase is not
+ * configured (local development, CI, benchmarks)
+ */
+
+export const FIXTURE_PLAYERS: PlayerRow[] = [
+  { id: "jalen-brunson", name: "Jalen Brunson", position: "Guard", jersey_number: 11, image_url: null },
+  { id: "karl-anthony-towns", name: "Karl-Anthony Towns", position: "Center", jersey_number: 32, image_url: null },
+  { id: "og-anunoby", name: "OG Anunoby", position: "Forward", jersey_number: 8, image_url: null },
+  { id: "mikal-bridges", name: "Mikal Bridges", position: "Forward", jersey_number: 25, image_url: null },
+  { id: "josh-hart", name: "Josh Hart", position: "Guard", jersey_number: 3, image_url: null },
+  { id: "mitchell-robinson", name: "Mitchell Robinson", position: "Center", jersey_number: 23, image_url: null },
+  { id: "miles-mcbride", name: "Miles McBride", position: "Guard", jersey_number: 2, image_url: null },
+];
+
+export const FIXTURE_GAMES: GameRow[] = [
+  { id: "2026-10-21-cle", date: "2026-10-21T23:30:00Z", opponent: "Cleveland Cavaliers", home_away: "home", location: null },
+  { id: "2026-10-24-bos", date: "2026-10-24T23:30:00Z", opponent: "Boston Celtics", home_away: "away", location: "TD Garden" },
+  { id: "2026-10-26-mil", date: "2026-10-26T23:00:00Z", opponent: "Milwaukee Bucks", home_away: "home", location: null },
+  { id: "2026-10-29-mia", date: "2026-10-29T23:30:00Z", opponent: "Miami Heat", home_away: "away", location: "Kaseya Center" },
+  { id: "2026-11-01-phi", date: "2026-11-01T23:30:00Z", opponent: "Philadelphia 76ers", home_away: "home", location: null },
+];
+
+export const FIXTURE_NEWS: NewsRow[] = [
+  {
+    id: "news-1",
+    slug: "knicks-open-training-camp",
+    title: "Knicks Open Training Camp",
+    excerpt: "The roster reports to Tarrytown as the new season gets underway.",
+    author: "Knicks Staff",
+    published_date: "2026-09-30T14:00:00Z",
+    featured_image: null,
+    content:
+      "Media day gave way to the first practice of the season in Tarrytown. The coaching staff focused on defensive rotations and pace, and the rookies got their first run with the starters.",
+    tags: ["training-camp", "preseason"],
+  },
+  {
+    id: "news-2",
+    slug: "brunson-named-captain",
+    title: "Brunson Named Team Captain",
+    excerpt: "Jalen Brunson will wear the C for the third straight season.",
+    author: "Knicks Staff",
+    published_date: "2026-10-05T16:00:00Z",
+    featured_image: null,
+    content:
+      "Jalen Brunson was named captain for the third straight season. Teammates pointed to his leadership in the locker room and his scoring in the clutch during last year's playoff run.",
+    tags: ["roster", "brunson"],
+  },
+  {
+    id: "news-3",
+    slug: "preseason-recap-vs-wizards",
+    title: "Preseason Recap: Knicks Handle Wizards",
+    excerpt: "Balanced scoring and a strong second unit carried the night at the Garden.",
+    author: "Knicks Staff",
+    published_date: "2026-10-10T02:30:00Z",
+    featured_image: null,
+    content:
+      "Karl-Anthony Towns posted a double-double and the bench outscored Washington's reserves as the Knicks pulled away in the fourth quarter at Madison Square Garden.",
+    tags: ["preseason", "game-recap", "towns"],
+  },
+];
+
+export const FIXTURE_MEDIA: MediaRow[] = createSyntheticMedia(240).map((item, i) => ({
+  id: i + 1,
+  type: item.type,
+  url: item.src,
+  thumbnail_url: item.thumbnail ?? null,
+  width: item.width,
+  height: item.height,
+  caption: item.caption ?? null,
+  category: item.category ?? null,
+}));
+
+export const FIXTURE_SEED: MemorySeed = {
+  players: FIXTURE_PLAYERS,
+  games: FIXTURE_GAMES,
+  news: FIXTURE_NEWS,
+  media: FIXTURE_MEDIA,
+};
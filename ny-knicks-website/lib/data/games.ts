@@ -0,0 +1,27 @@
+import type { Game } from "@/types";
+import { DATA_TAGS, getDataCache, getDataSource } from "./client";
+import { teamDate, toGame, type GameRow } from "./rows";
+
+/**
+ * Full season schedule, ordered by tip-off
+ */
+export function getGames(): Promise<Game[]> {
+  return getDataCache().get("games:all", [DATA_TAGS.games], async () => {
+    const rows = await getDataSource().select<GameRow>("games", {
+      order: { column: "date" },
+    });
+    return rows.map(toGame);
+  });
+}
+
+/**
+ * Next `limit` games on or after `from` (a `YYYY-MM-DD` date, defaulting to
+ * today in New York, like `Game.date`), sliced from the cached schedule
+ */
+export async function getUpcomingGames(
+  limit = 5,
+  from: string = teamDate()
+): Promise<Game[]> {
+  const games = await getGames();
+  return games.filter((game) => game.date >= from).slice(0, limit);
+}
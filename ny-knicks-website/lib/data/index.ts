@@ -0,0 +1,17 @@
+/**
+ * Data layer barrel export
+ * Server-side only: imports the Supabase client and reads secrets from env
+ */
+export * from "./cache";
+export * from "./client";
+export * from "./fixtures";
+export * from "./games";
+export * from "./media";
+export * from "./memory";
+export * from "./news";
+export * from "./players";
+export * from "./revalidation";
+export * from "./rows";
+export * from "./source";
+export * from "./supabase";
+export * from "./synthetic";
@@ -0,0 +1,56 @@
+import type { MediaItem } from "@/types";
+import { DATA_TAGS, getDataCache, getDataSource } from "./client";
+import { toMediaItem, type MediaRow } from "./rows";
+
+export interface MediaPageOptions {
+  /** `nextCursor` from the previous page; omit for the first page */
+  cursor?: string | null;
+  /** Page size */
+  limit?: number;
+  category?: string;
+}
+
+export interface MediaPage {
+  items: MediaItem[];
+  /** Pass back as `cursor` for the next page; `null` when exhausted */
+  nextCursor: string | null;
+}
+
+export const MAX_MEDIA_PAGE_SIZE = 100;
+
+/**
+ * A page of media, newest first.
+ *
+ * Keyset pagination on `id`: each page filters `id < cursor` instead of
+ * skipping rows, so deep pages cost the same as the first and inserts
+ * never shift or duplicate items across pages.
+ */
+export function getMediaPage({
+  cursor = null,
+  limit = 40,
+  category,
+}: MediaPageOptions = {}): Promise<MediaPage> {
+  const pageSize = Math.min(Math.max(1, Math.floor(limit)), MAX_MEDIA_PAGE_SIZE);
+  const before = cursor && /^\d+$/.test(cursor) ? Number(cursor) : null;
+
+  return getDataCache().get(
+    `media:page:${category ?? "all"}:${before ?? "start"}:${pageSize}`,
+    [DATA_TAGS.media],
+    async () => {
+      // One extra row tells us whether another page exists
+      const rows = await getDataSource().select<MediaRow>("media", {
+        match: category ? { category } : undefined,
+        lessThan: before !== null ? { column: "id", value: before } : undefined,
+        order: { column: "id", ascending: false },
+        range: { from: 0, to: pageSize },
+      });
+
+      const page = rows.slice(0, pageSize);
+      const last = page[page.length - 1];
+      return {
+        items: page.map(toMediaItem),
+        nextCursor: rows.length > pageSize && last ? String(last.id) : null,
+      };
+    }
+  );
+}
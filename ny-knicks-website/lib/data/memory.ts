@@ -0,0 +1,89 @@
+import type { DataQuery, DataSource, TableName } from "./source";
+
+/**
+ * In-memory stand-in for Supabase, used for offline development, tests and
+ * benchmarks. Supports the same `DataQuery` subset as the Supabase source
+ * and can simulate network latency.
+ */
+
+export type MemorySeed = Partial<Record<TableName, readonly object[]>>;
+
+export interface MemoryDataSourceOptions {
+  /** Artificial delay per query, to mimic a database round trip */
+  latencyMs?: number;
+}
+
+export interface MemoryDataSource extends DataSource {
+  /** Number of queries served so far, per table */
+  readonly queryCounts: Record<TableName, number>;
+  /** Replace the rows of a table, e.g. to simulate a database change */
+  setRows(table: TableName, rows: readonly object[]): void;
+}
+
+export function createMemoryDataSource(
+  seed: MemorySeed = {},
+  { latencyMs = 0 }: MemoryDataSourceOptions = {}
+): MemoryDataSource {
+  const tables: Record<TableName, readonly object[]> = {
+    players: seed.players ?? [],
+    games: seed.games ?? [],
+    news: seed.news ?? [],
+    media: seed.media ?? [],
+  };
+  const queryCounts: Record<TableName, number> = {
+    players: 0,
+    games: 0,
+    news: 0,
+    media: 0,
+  };
+
+  return {
+    name: "memory",
+    queryCounts,
+
+    setRows(table, rows) {
+      tables[table] = rows;
+    },
+
+    async select<Row>(table: TableName, query: DataQuery = {}) {
+      queryCounts[table]++;
+      if (latencyMs > 0) {
+        await new Promise((resolve) => setTimeout(resolve, latencyMs));
+      }
+
+      let rows = tables[table] as readonly Record<string, unknown>[];
+
+      const match = query.match;
+      if (match) {
+        rows = rows.filter((row) =>
+          Object.entries(match).every(([column, value]) => row[column] === value)
+        );
+      }
+
+      const lessThan = query.lessThan;
+      if (lessThan) {
+        rows = rows.filter(
+          (row) => (row[lessThan.column] as string | number) < lessThan.value
+        );
+      }
+
+      if (query.order) {
+        const { column, ascending = true } = query.order;
+        const direction = ascending ? 1 : -1;
+        rows = [...rows].sort((a, b) => {
+          const left = a[column] as string | number;
+          const right = b[column] as string | number;
+          if (left === right) return 0;
+          return left < right ? -direction : direction;
+        });
+      }
+
+      if (query.range) {
+        rows = rows.slice(query.range.from, query.range.to + 1);
+      }
+
+      // Hand out copies so callers can't mutate the backing store
+      return rows.map((row) => ({ ...row })) as Row[];
+    },
+  };
+}
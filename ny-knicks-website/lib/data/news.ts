@@ -0,0 +1,65 @@
+import type { NewsArticle } from "@/types";
+import { DATA_TAGS, getDataCache, getDataSource, newsArticleTag } from "./client";
+import { toNewsArticle, type NewsRow } from "./rows";
+
+export interface NewsPageOptions {
+  /** Number of articles to skip */
+  offset?: number;
+  /** Page size */
+  limit?: number;
+}
+
+/**
+ * A page of articles, newest first
+ */
+export function getNewsArticles({
+  offset = 0,
+  limit = 12,
+}: NewsPageOptions = {}): Promise<NewsArticle[]> {
+  return getDataCache().get(
+    `news:page:${offset}:${limit}`,
+    [DATA_TAGS.news],
+    async () => {
+      const rows = await getDataSource().select<NewsRow>("news", {
+        order: { column: "published_date", ascending: false },
+        range: { from: offset, to: offset + limit - 1 },
+      });
+      return rows.map(toNewsArticle);
+    }
+  );
+}
+
+/** PostgREST caps responses at 1000 rows by default */
+const FETCH_ALL_PAGE_SIZE = 1000;
+
+/**
+ * Every article, newest first, fetched in pages. For build-time work such
+ * as static params and the search index, not for rendering lists.
+ */
+export function getAllNewsArticles(): Promise<NewsArticle[]> {
+  return getDataCache().get("news:all", [DATA_TAGS.news], async () => {
+    const articles: NewsArticle[] = [];
+    for (let from = 0; ; from += FETCH_ALL_PAGE_SIZE) {
+      const rows = await getDataSource().select<NewsRow>("news", {
+        order: { column: "published_date", ascending: false },
+        range: { from, to: from + FETCH_ALL_PAGE_SIZE - 1 },
+      });
+      articles.push(...rows.map(toNewsArticle));
+      if (rows.length < FETCH_ALL_PAGE_SIZE) return articles;
+    }
+  });
+}
+
+export function getNewsArticleBySlug(slug: string): Promise<NewsArticle | null> {
+  return getDataCache().get(
+    `news:slug:${slug}`,
+    [DATA_TAGS.news, newsArticleTag(slug)],
+    async () => {
+      const [row] = await getDataSource().select<NewsRow>("news", {
+        match: { slug },
+        range: { from: 0, to: 0 },
+      });
+      return row ? toNewsArticle(row) : null;
+    }
+  );
+}
@@ -0,0 +1,38 @@
+import type { Player } from "@/types";
+import { DATA_TAGS, getDataCache, getDataSource, playerTag } from "./client";
+import { toPlayer, type PlayerRow } from "./rows";
+
+/**
+ * Full roster, ordered by jersey number
+ */
+export function getPlayers(): Promise<Player[]> {
+  return getDataCache().get("players:all", [DATA_TAGS.players], async () => {
+    const rows = await getDataSource().select<PlayerRow>("players", {
+      order: { column: "jersey_number" },
+    });
+    return rows.map(toPlayer);
+  });
+}
+
+export function getPlayerById(id: string): Promise<Player | null> {
+  return getDataCache().get(
+    `players:id:${id}`,
+    [DATA_TAGS.players, playerTag(id)],
+    async () => {
+      const [row] = await getDataSource().select<PlayerRow>("players", {
+        match: { id },
+        range: { from: 0, to: 0 },
+      });
+      return row ? toPlayer(row) : null;
+    }
+  );
+}
+
+/**
+ * Players at a position, filtered from the cached roster so position
+ * toggles never cost a query
+ */
+export async function getPlayersByPosition(position: string): Promise<Player[]> {
+  const players = await getPlayers();
+  return players.filter((player) => player.position === position);
+}
@@ -0,0 +1,101 @@
+import { newsArticlePath, playerPath, SITE_ROUTES } from "@/lib/constants";
+import { searchIndexUrl } from "@/lib/search/documents";
+import { DATA_TAGS, newsArticleTag, playerTag } from "./client";
+import type { TableName } from "./source";
+
+/**
+ * Maps a database change to the data-cache tags and prerendered paths it
+ * affects, so a change regenerates only the pages that show that row
+ */
+
+/** Supabase Database Webhook payload */
+export interface TableChange {
+  type: "INSERT" | "UPDATE" | "DELETE";
+  table: string;
+  schema?: string;
+  record: Record<string, unknown> | null;
+  old_record: Record<string, unknown> | null;
+}
+
+export interface RevalidationPlan {
+  tags: string[];
+  paths: string[];
+}
+
+const TABLES: readonly string[] = ["players", "games", "news", "media"] satisfies TableName[];
+
+function isTableName(table: string): table is TableName {
+  return TABLES.includes(table);
+}
+
+/** Values of `column` in the new and old row (a renamed slug touches both) */
+function columnValues(change: TableChange, column: string): string[] {
+  const values = [change.record?.[column], change.old_record?.[column]]
+    .filter((value) => typeof value === "string" || typeof value === "number")
+    .map(String);
+  return [...new Set(values)];
+}
+
+/**
+ * `games` columns shown on schedule-facing pages. The live score feed
+ * updates the same rows with score, period, clock and status on every
+ * basket; those updates must not regenerate pages.
+ */
+const SCHEDULE_COLUMNS = ["id", "date", "opponent", "home_away", "location"];
+
+/**
+ * Whether an UPDATE touched a schedule-facing column. Needs the full old
+ * row (`ALTER TABLE games REPLICA IDENTITY FULL`); a column missing from
+ * `old_record` counts as changed.
+ */
+function scheduleChanged(change: TableChange): boolean {
+  const { record, old_record: old } = change;
+  if (change.type !== "UPDATE" || !record || !old) return true;
+
+  return Object.keys(record)
+    .filter((column) => SCHEDULE_COLUMNS.includes(column) || column.startsWith("ticket"))
+    .some((column) => !(column in old) || JSON.stringify(record[column]) !== JSON.stringify(old[column]));
+}
+
+export function planRevalidation(change: TableChange): RevalidationPlan {
+  if (!isTableName(change.table)) return { tags: [], paths: [] };
+
+  switch (change.table) {
+    case "players": {
+      const ids = columnValues(change, "id");
+      return {
+        tags: [DATA_TAGS.players, ...ids.map(playerTag)],
+        paths: [SITE_ROUTES.roster, ...ids.map(playerPath), searchIndexUrl("players")],
+      };
+    }
+    case "games":
+      if (!scheduleChanged(change)) return { tags: [], paths: [] };
+      return {
+        tags: [DATA_TAGS.games],
+        paths: [SITE_ROUTES.home, SITE_ROUTES.schedule, SITE_ROUTES.tickets],
+      };
+    case "news": {
+      const slugs = columnValues(change, "slug");
+      return {
+        tags: [DATA_TAGS.news, ...slugs.map(newsArticleTag)],
+        paths: [
+          SITE_ROUTES.home,
+          SITE_ROUTES.news,
+          ...slugs.map(newsArticlePath),
+          searchIndexUrl("news"),
+        ],
+      };
+    }
+    case "media":
+      // Served by the cursor API, which pages straight from the data cache
+      return { tags: [DATA_TAGS.media], paths: [] };
+  }
+}
+
+/** Merge plans, dropping duplicates */
+export function mergeRevalidationPlans(plans: readonly RevalidationPlan[]): RevalidationPlan {
+  return {
+    tags: [...new Set(plans.flatMap((plan) => plan.tags))],
+    paths: [...new Set(plans.flatMap((plan) => plan.paths))],
+  };
+}
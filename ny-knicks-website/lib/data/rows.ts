@@ -0,0 +1,126 @@
+import type { Game, MediaItem, NewsArticle, Player } from "@/types";
+
+/**
+ * Database row shapes (snake_case, as stored in Supabase) and their
+ * mappers to the app-facing types in `@/types`
+ */
+
+export interface PlayerRow {
+  id: string;
+  name: string;
+  position: string;
+  jersey_number: number;
+  image_url: string | null;
+}
+
+export interface GameRow {
+  id: string;
+  /** Tip-off as an ISO timestamp */
+  date: string;
+  opponent: string;
+  home_away: "home" | "away";
+  location: string | null;
+}
+
+export interface NewsRow {
+  id: string;
+  slug: string;
+  title: string;
+  excerpt: string;
+  author: string | null;
+  published_date: string;
+  featured_image: string | null;
+  content: string | null;
+  tags: string[] | null;
+}
+
+export interface MediaRow {
+  /** Serial id; newer media has a higher id */
+  id: number;
+  type: "image" | "video";
+  url: string;
+  thumbnail_url: string | null;
+  width: number;
+  height: number;
+  caption: string | null;
+  category: string | null;
+}
+
+const HOME_ARENA = "Madison Square Garden";
+const TEAM_TIME_ZONE = "America/New_York";
+const READING_WORDS_PER_MINUTE = 225;
+
+const gameDateFormat = new Intl.DateTimeFormat("en-CA", {
+  timeZone: TEAM_TIME_ZONE,
+  year: "numeric",
+  month: "2-digit",
+  day: "2-digit",
+});
+
+const gameTimeFormat = new Intl.DateTimeFormat("en-US", {
+  timeZone: TEAM_TIME_ZONE,
+  hour: "numeric",
+  minute: "2-digit",
+});
+
+/** `YYYY-MM-DD` of `date` in team time, matching `Game.date` */
+export function teamDate(date: Date = new Date()): string {
+  return gameDateFormat.format(date);
+}
+
+export function toPlayer(row: PlayerRow): Player {
+  return {
+    id: row.id,
+    name: row.name,
+    number: row.jersey_number,
+    position: row.position,
+    image: row.image_url ?? undefined,
+  };
+}
+
+export function toGame(row: GameRow): Game {
+  const tipOff = new Date(row.date);
+  const isHome = row.home_away === "home";
+
+  return {
+    id: row.id,
+    opponent: row.opponent,
+    date: teamDate(tipOff),
+    time: `${gameTimeFormat.format(tipOff)} ET`,
+    location: row.location ?? (isHome ? HOME_ARENA : "Away"),
+    isHome,
+  };
+}
+
+export function toNewsArticle(row: NewsRow): NewsArticle {
+  return {
+    id: row.id,
+    title: row.title,
+    excerpt: row.excerpt,
+    image: row.featured_image ?? undefined,
+    publishedAt: row.published_date,
+    author: row.author ?? undefined,
+    slug: row.slug,
+    content: row.content ?? undefined,
+    tags: row.tags ?? [],
+    readingTime: readingTimeMinutes(row.content ?? row.excerpt),
+  };
+}
+
+export function readingTimeMinutes(text: string): number {
+  const words = text.split(/\s+/).filter(Boolean).length;
+  return Math.max(1, Math.round(words / READING_WORDS_PER_MINUTE));
+}
+
+export function toMediaItem(row: MediaRow): MediaItem {
+  return {
+    id: String(row.id),
+    type: row.type,
+    src: row.url,
+    thumbnail: row.thumbnail_url ?? undefined,
+    width: row.width,
+    height: row.height,
+    caption: row.caption ?? undefined,
+    category: row.category ?? undefined,
+  };
+}
@@ -0,0 +1,22 @@
+/**
+ * Minimal query contract shared by the Supabase and in-memory data sources
+ */
+
+export type TableName = "players" | "games" | "news" | "media";
+
+export interface DataQuery {
+  /** Equality filters, column -> value */
+  match?: Record<string, string | number | boolean>;
+  /** Strict less-than filter, for keyset (cursor) pagination */
+  lessThan?: { column: string; value: string | number };
+  /** Sort order applied before `range` */
+  order?: { column: string; ascending?: boolean };
+  /** Inclusive row range, as in PostgREST */
+  range?: { from: number; to: number };
+}
+
+export interface DataSource {
+  /** Human-readable name used in logs and benchmark output */
+  readonly name: string;
+  select<Row>(table: TableName, query?: DataQuery): Promise<Row[]>;
+}
@@ -0,0 +1,78 @@
+import { createClient, type SupabaseClient } from "@supabase/supabase-js";
+import type { DataQuery, DataSource, TableName } from "./source";
+
+/**
+ * Server-side Supabase access.
+ *
+ * One client is shared by the whole Node process (and kept on `globalThis`
+ * so dev-server hot reloads don't create new ones), so every query reuses
+ * the same keep-alive HTTP connection pool.
+ */
+
+const globalForSupabase = globalThis as unknown as {
+  knicksSupabase?: SupabaseClient;
+};
+
+export function isSupabaseConfigured(): boolean {
+  return Boolean(
+    process.env.NEXT_PUBLIC_SUPABASE_URL &&
+      (process.env.SUPABASE_SERVICE_ROLE_KEY ||
+        process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY)
+  );
+}
+
+export function getSupabaseClient(): SupabaseClient {
+  if (globalForSupabase.knicksSupabase) {
+    return globalForSupabase.knicksSupabase;
+  }
+
+  const url = process.env.NEXT_PUBLIC_SUPABASE_URL;
+  const key =
+    process.env.SUPABASE_SERVICE_ROLE_KEY ??
+    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
+
+  if (!url || !key) {
+    throw new Error(
+      "Supabase is not configured: set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (or NEXT_PUBLIC_SUPABASE_ANON_KEY)"
+    );
+  }
+
+  const client = createClient(url, key, {
+    auth: { persistSession: false, autoRefreshToken: false },
+  });
+  globalForSupabase.knicksSupabase = client;
+  return client;
+}
+
+export function createSupabaseDataSource(
+  client: SupabaseClient = getSupabaseClient()
+): DataSource {
+  return {
+    name: "supabase",
+
+    async select<Row>(table: TableName, query: DataQuery = {}) {
+      let builder = client.from(table).select("*");
+
+      for (const [column, value] of Object.entries(query.match ?? {})) {
+        builder = builder.eq(column, value);
+      }
+      if (query.lessThan) {
+        builder = builder.lt(query.lessThan.column, query.lessThan.value);
+      }
+      if (query.order) {
+        builder = builder.order(query.order.column, {
+          ascending: query.order.ascending ?? true,
+        });
+      }
+      if (query.range) {
+        builder = builder.range(query.range.from, query.range.to);
+      }
+
+      const { data, error } = await builder;
+      if (error) {
+        throw new Error(`Supabase query on "${table}" failed: ${error.message}`);
+      }
+      return (data ?? []) as Row[];
+    },
+  };
+}
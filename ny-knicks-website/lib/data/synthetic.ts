@@ -0,0 +1,56 @@
+import { mulberry32 } from "@/lib/utils/random";
+import type { MediaItem } from "@/types";
+
+/**
+ * Deterministic placeholder media for fixtures and the gallery benchmark.
+ * Images are inline SVG data URIs, so no files or network are involved.
+ * Free of server imports, so client code can import this module directly.
+ */
+
+const ASPECTS: readonly [number, number][] = [
+  [4, 3],
+  [3, 4],
+  [16, 9],
+  [1, 1],
+  [2, 3],
+  [3, 2],
+];
+
+const CATEGORIES = ["game", "practice", "community", "fans"] as const;
+
+export function placeholderSvg(
+  width: number,
+  height: number,
+  hue: number,
+  label: string
+): string {
+  const svg =
+    `<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 ${width} ${height}">` +
+    `<rect width="100%" height="100%" fill="hsl(${hue} 70% 35%)"/>` +
+    `<text x="50%" y="50%" fill="#fff" font-family="sans-serif" font-size="${Math.round(width / 8)}" ` +
+    `text-anchor="middle" dominant-baseline="middle">${label}</text></svg>`;
+  return `data:image/svg+xml,${encodeURIComponent(svg)}`;
+}
+
+export function createSyntheticMedia(count: number, seed = 1): MediaItem[] {
+  const random = mulberry32(seed);
+
+  return Array.from({ length: count }, (_, i) => {
+    const [aspectWidth, aspectHeight] = ASPECTS[Math.floor(random() * ASPECTS.length)]!;
+    const width = aspectWidth * 120;
+    const height = aspectHeight * 120;
+    const hue = Math.floor(random() * 360);
+    const image = placeholderSvg(width, height, hue, `#${i + 1}`);
+
+    return {
+      id: `synthetic-${i}`,
+      type: "image",
+      src: image,
+      thumbnail: image,
+      width,
+      height,
+      caption: `Synthetic photo ${i + 1}`,
+      category: CATEGORIES[Math.floor(random() * CATEGORIES.length)],
+    } satisfies MediaItem;
+  });
+}
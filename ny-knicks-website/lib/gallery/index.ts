@@ -0,0 +1,6 @@
+/**
+ * Gallery barrel export
+ */
+export * from "./masonry";
+export * from "./preload";
+export * from "./slots";
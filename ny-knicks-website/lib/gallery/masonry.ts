@@ -0,0 +1,150 @@
+/**
+ * Masonry layout computed from known aspect ratios.
+ *
+ * Tile positions are derived from each item's intrinsic width/height, so the
+ * grid never measures the DOM. Items are placed in the shortest column, and
+ * appending a page never moves tiles that are already placed.
+ *
+ * Layouts are immutable once built, so they are safe to derive during a
+ * React render: `withItems` returns a new layout and never changes `this`.
+ */
+
+export interface MasonrySize {
+  width: number;
+  height: number;
+}
+
+export interface MasonryRect {
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+export interface MasonryOptions {
+  columnCount: number;
+  /** Container width in CSS pixels */
+  width: number;
+  gap?: number;
+}
+
+export class MasonryLayout {
+  readonly columnCount: number;
+  readonly columnWidth: number;
+  readonly gap: number;
+  readonly width: number;
+
+  /** The list this layout was built for */
+  private placed: readonly MasonrySize[] = [];
+  private rects: MasonryRect[] = [];
+  private columnHeights: number[];
+  /** Item indices per column, in ascending `y` order */
+  private columns: number[][];
+
+  constructor({ columnCount, width, gap = 12 }: MasonryOptions) {
+    this.columnCount = Math.max(1, columnCount);
+    this.width = width;
+    this.gap = gap;
+    this.columnWidth = Math.max(
+      0,
+      (width - gap * (this.columnCount - 1)) / this.columnCount
+    );
+    this.columnHeights = new Array<number>(this.columnCount).fill(0);
+    this.columns = Array.from({ length: this.columnCount }, () => []);
+  }
+
+  /** Whether this layout was built with these options */
+  matches({ columnCount, width, gap = 12 }: MasonryOptions): boolean {
+    return this.columnCount === Math.max(1, columnCount) && this.width === width && this.gap === gap;
+  }
+
+  /** Number of items placed so far */
+  get size(): number {
+    return this.rects.length;
+  }
+
+  /** Total content height */
+  get height(): number {
+    return Math.max(0, Math.max(...this.columnHeights) - this.gap);
+  }
+
+  /**
+   * Layout for `items`. When `items` extends the list placed so far, the
+   * placed tiles are copied and only the new items are placed; otherwise
+   * everything is placed from scratch.
+   */
+  withItems(items: readonly MasonrySize[]): MasonryLayout {
+    if (items === this.placed) return this;
+
+    const size = this.rects.length;
+    const isExtension =
+      size <= items.length && (size === 0 || items[size - 1] === this.placed[size - 1]);
+    const next = new MasonryLayout({ columnCount: this.columnCount, width: this.width, gap: this.gap });
+    if (isExtension) {
+      next.rects = this.rects.slice();
+      next.columnHeights = this.columnHeights.slice();
+      next.columns = this.columns.map((column) => column.slice());
+    }
+    next.place(items.slice(next.rects.length));
+    next.placed = items;
+    return next;
+  }
+
+  private place(items: readonly MasonrySize[]): void {
+    for (const item of items) {
+      let column = 0;
+      for (let i = 1; i < this.columnCount; i++) {
+        if (this.columnHeights[i]! < this.columnHeights[column]!) column = i;
+      }
+
+      const aspect = item.width > 0 && item.height > 0 ? item.height / item.width : 1;
+      const rect: MasonryRect = {
+        x: column * (this.columnWidth + this.gap),
+        y: this.columnHeights[column]!,
+        width: this.columnWidth,
+        height: Math.round(this.columnWidth * aspect),
+      };
+
+      this.columns[column]!.push(this.rects.length);
+      this.rects.push(rect);
+      this.columnHeights[column] = rect.y + rect.height + this.gap;
+    }
+  }
+
+  rect(index: number): MasonryRect | undefined {
+    return this.rects[index];
+  }
+
+  /** Indices of items intersecting `[top, bottom]`, ascending */
+  query(top: number, bottom: number): number[] {
+    const result: number[] = [];
+
+    for (const column of this.columns) {
+      // First tile whose bottom edge reaches `top`
+      let low = 0;
+      let high = column.length;
+      while (low < high) {
+        const middle = (low + high) >>> 1;
+        const rect = this.rects[column[middle]!]!;
+        if (rect.y + rect.height < top) low = middle + 1;
+        else high = middle;
+      }
+
+      for (let i = low; i < column.length; i++) {
+        const index = column[i]!;
+        if (this.rects[index]!.y > bottom) break;
+        result.push(index);
+      }
+    }
+
+    return result.sort((a, b) => a - b);
+  }
+}
+
+/** Responsive column count for a container width */
+export function columnCountFor(width: number): number {
+  if (width < 640) return 2;
+  if (width < 1024) return 3;
+  if (width < 1536) return 4;
+  return 5;
+}
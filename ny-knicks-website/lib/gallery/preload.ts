@@ -0,0 +1,40 @@
+import type { MediaItem } from "@/types";
+
+/**
+ * Warm the browser cache for media the user is likely to open next
+ */
+
+const MAX_TRACKED = 200;
+const preloaded = new Set<string>();
+
+export function preloadMedia(item: MediaItem): void {
+  if (typeof window === "undefined") return;
+
+  // Clips preload their poster; the video itself streams on demand
+  const url = item.type === "video" ? item.thumbnail : item.src;
+  if (!url || preloaded.has(url)) return;
+
+  if (preloaded.size >= MAX_TRACKED) {
+    const oldest = preloaded.values().next().value;
+    if (oldest !== undefined) preloaded.delete(oldest);
+  }
+  preloaded.add(url);
+
+  const image = new Image();
+  image.decoding = "async";
+  image.src = url;
+}
+
+/** Preload the `radius` items on either side of `index` */
+export function preloadNeighbors(
+  items: readonly MediaItem[],
+  index: number,
+  radius = 2
+): void {
+  for (let offset = 1; offset <= radius; offset++) {
+    const next = items[index + offset];
+    const previous = items[index - offset];
+    if (next) preloadMedia(next);
+    if (previous) preloadMedia(previous);
+  }
+}
@@ -0,0 +1,38 @@
+/**
+ * Tile node recycling.
+ *
+ * The grid renders a fixed pool of slots keyed by slot number, so React
+ * keeps the same DOM nodes and only updates their position and image as
+ * items scroll in and out. Slots hold an item index, or `null` when free.
+ */
+
+export type SlotAssignment = readonly (number | null)[];
+
+/**
+ * Reassign slots for a new set of visible items. Items that stay visible
+ * keep their slot; items that leave free theirs for newcomers. Returns the
+ * previous array when nothing changed.
+ */
+export function assignSlots(
+  previous: SlotAssignment,
+  visible: readonly number[]
+): SlotAssignment {
+  const wanted = new Set(visible);
+  const next = previous.map((index) =>
+    index !== null && wanted.has(index) ? index : null
+  );
+  for (const index of next) {
+    if (index !== null) wanted.delete(index);
+  }
+
+  let changed = next.some((index, slot) => index !== previous[slot]);
+  let free = 0;
+  for (const index of wanted) {
+    while (free < next.length && next[free] !== null) free++;
+    if (free < next.length) next[free] = index;
+    else next.push(index);
+    changed = true;
+  }
+
+  return changed ? next : previous;
+}
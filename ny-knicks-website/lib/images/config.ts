@@ -0,0 +1,34 @@
+/**
+ * Image pipeline settings and manifest types, shared by the build script
+ * and `<KnicksImage>`
+ */
+
+export const IMAGE_FORMATS = ["avif", "webp"] as const;
+export type ImageFormat = (typeof IMAGE_FORMATS)[number];
+
+/** Variant widths, in CSS pixels at 1x */
+export const IMAGE_BREAKPOINTS = [320, 640, 960, 1280, 1920] as const;
+
+/** Directory under `public/` the variants are written to */
+export const IMAGE_OUTPUT_DIR = "_img";
+
+export interface ImageVariant {
+  width: number;
+  /** Public URL path of the encoded file */
+  path: string;
+}
+
+export interface ImageManifestEntry {
+  /** Content hash of the source bytes */
+  hash: string;
+  width: number;
+  height: number;
+  /** Blurred low-resolution data URL shown until the image loads */
+  placeholder: string;
+  variants: Record<ImageFormat, ImageVariant[]>;
+}
+
+export interface ImageManifest {
+  version: 1;
+  images: Record<string, ImageManifestEntry>;
+}
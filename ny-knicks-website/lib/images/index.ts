@@ -0,0 +1,22 @@
+import manifest from "./manifest.json";
+import type { ImageManifest, ImageManifestEntry, ImageVariant } from "./config";
+
+/**
+ * Responsive image manifest, generated by `npm run build:images`.
+ *
+ * Each source image (a `public/` path such as `/players/brunson.jpg`, or a
+ * remote `Player.image` / `NewsArticle.image` URL) maps to content-hashed
+ * AVIF and WebP variants plus a tiny blurred placeholder.
+ */
+
+export * from "./config";
+
+const imageManifest = manifest as ImageManifest;
+
+export function getImageEntry(src: string): ImageManifestEntry | undefined {
+  return imageManifest.images[src];
+}
+
+export function buildSrcSet(variants: readonly ImageVariant[]): string {
+  return variants.map((variant) => `${variant.path} ${variant.width}w`).join(", ");
+}
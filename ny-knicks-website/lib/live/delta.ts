@@ -0,0 +1,84 @@
+import type { GameStatus, LiveGameState } from "@/types";
+
+/**
+ * Compact wire format for live score changes. Only fields that changed are
+ * sent; `g` carries the full state the first time a game appears.
+ */
+export interface GameDelta {
+  id: string;
+  /** [knicksScore, opponentScore] */
+  s?: [number, number];
+  /** Period */
+  p?: number;
+  /** Clock */
+  c?: string;
+  /** Status */
+  st?: GameStatus;
+  /** Full state for a game the client has not seen yet */
+  g?: LiveGameState;
+}
+
+/** One coalesced flush of the hub, numbered for resume-after-reconnect */
+export interface ScoreBatch {
+  seq: number;
+  deltas: GameDelta[];
+}
+
+export interface ScoreSnapshot {
+  epoch: string;
+  seq: number;
+  games: LiveGameState[];
+}
+
+export function diffGameState(
+  prev: LiveGameState | undefined,
+  next: LiveGameState
+): GameDelta | null {
+  if (!prev) return { id: next.gameId, g: next };
+
+  const delta: GameDelta = { id: next.gameId };
+  let changed = false;
+
+  if (
+    prev.knicksScore !== next.knicksScore ||
+    prev.opponentScore !== next.opponentScore
+  ) {
+    delta.s = [next.knicksScore, next.opponentScore];
+    changed = true;
+  }
+  if (prev.period !== next.period) {
+    delta.p = next.period;
+    changed = true;
+  }
+  if (prev.clock !== next.clock) {
+    delta.c = next.clock;
+    changed = true;
+  }
+  if (prev.status !== next.status) {
+    delta.st = next.status;
+    changed = true;
+  }
+
+  return changed ? delta : null;
+}
+
+/**
+ * Apply a delta, returning a new state object, or `prev` when the delta
+ * cannot be applied (unknown game without a full state)
+ */
+export function applyGameDelta(
+  prev: LiveGameState | undefined,
+  delta: GameDelta
+): LiveGameState | undefined {
+  if (delta.g) return delta.g;
+  if (!prev) return prev;
+
+  return {
+    ...prev,
+    knicksScore: delta.s ? delta.s[0] : prev.knicksScore,
+    opponentScore: delta.s ? delta.s[1] : prev.opponentScore,
+    period: delta.p ?? prev.period,
+    clock: delta.c ?? prev.clock,
+    status: delta.st ?? prev.status,
+  };
+}
@@ -0,0 +1,178 @@
+import type { SupabaseClient } from "@supabase/supabase-js";
+import { mulberry32 } from "@/lib/utils/random";
+import type { GameStatus, LiveGameState } from "@/types";
+
+/**
+ * Upstream sources of live game state. A feed pushes full game states; the
+ * hub takes care of diffing and fan-out.
+ */
+export interface ScoreFeed {
+  /** Start pushing updates; returns a function that stops the feed */
+  subscribe(onUpdate: (state: LiveGameState) => void): () => void;
+}
+
+export interface LiveGameRow {
+  id: string;
+  opponent: string;
+  home_away: "home" | "away";
+  knicks_score: number | null;
+  opponent_score: number | null;
+  period: number | null;
+  clock: string | null;
+  status: GameStatus;
+}
+
+export function toLiveGameState(row: LiveGameRow): LiveGameState {
+  return {
+    gameId: row.id,
+    opponent: row.opponent,
+    isHome: row.home_away === "home",
+    knicksScore: row.knicks_score ?? 0,
+    opponentScore: row.opponent_score ?? 0,
+    period: row.period ?? 0,
+    clock: row.clock ?? "12:00",
+    status: row.status,
+  };
+}
+
+/**
+ * Live scores from Supabase Realtime: seeds from the games currently in
+ * progress, then follows UPDATEs on the `games` table
+ */
+export function createSupabaseScoreFeed(client: SupabaseClient): ScoreFeed {
+  return {
+    subscribe(onUpdate) {
+      let active = true;
+
+      client
+        .from("games")
+        .select("*")
+        .in("status", ["live", "halftime"])
+        .then(({ data }) => {
+          if (!active) return;
+          for (const row of (data ?? []) as LiveGameRow[]) {
+            onUpdate(toLiveGameState(row));
+          }
+        });
+
+      const channel = client
+        .channel("live-scores")
+        .on(
+          "postgres_changes",
+          { event: "UPDATE", schema: "public", table: "games" },
+          (payload) => {
+            const row = payload.new as LiveGameRow;
+            if (row.status !== "scheduled") onUpdate(toLiveGameState(row));
+          }
+        )
+        .subscribe();
+
+      return () => {
+        active = false;
+        void client.removeChannel(channel);
+      };
+    },
+  };
+}
+
+export interface FakeScoreFeedOptions {
+  /** Number of simultaneous games */
+  games?: number;
+  /** Interval between simulated ticks */
+  tickMs?: number;
+  /** Game seconds elapsed per tick */
+  secondsPerTick?: number;
+  /** Seed for the deterministic random generator */
+  seed?: number;
+}
+
+const FAKE_OPPONENTS = [
+  "Boston Celtics",
+  "Philadelphia 76ers",
+  "Brooklyn Nets",
+  "Miami Heat",
+  "Milwaukee Bucks",
+  "Chicago Bulls",
+  "Cleveland Cavaliers",
+  "Indiana Pacers",
+];
+
+const QUARTER_SECONDS = 12 * 60;
+
+function formatClock(seconds: number) {
+  const minutes = Math.floor(seconds / 60);
+  return `${minutes}:${String(seconds % 60).padStart(2, "0")}`;
+}
+
+/**
+ * Local stand-in feed that plays out simulated games, for development and
+ * load testing without a database
+ */
+export function createFakeScoreFeed({
+  games = 4,
+  tickMs = 1000,
+  secondsPerTick = 6,
+  seed = 33,
+}: FakeScoreFeedOptions = {}): ScoreFeed {
+  return {
+    subscribe(onUpdate) {
+      const random = mulberry32(seed);
+      const remaining: number[] = [];
+      const states: LiveGameState[] = Array.from({ length: games }, (_, i) => {
+        remaining.push(QUARTER_SECONDS);
+        return {
+          gameId: `fake-${i + 1}`,
+          opponent: FAKE_OPPONENTS[i % FAKE_OPPONENTS.length] ?? "Opponent",
+          isHome: i % 2 === 0,
+          knicksScore: 0,
+          opponentScore: 0,
+          period: 1,
+          clock: formatClock(QUARTER_SECONDS),
+          status: "live",
+        };
+      });
+
+      states.forEach((state) => onUpdate(state));
+
+      const timer = setInterval(() => {
+        states.forEach((state, i) => {
+          if (state.status === "final") return;
+
+          let seconds = Math.max(0, (remaining[i] ?? 0) - secondsPerTick);
+          let { knicksScore, opponentScore, period, status } = state;
+
+          // Roughly one scoring play every 14 game seconds
+          if (random() < secondsPerTick / 14) {
+            const points = random() < 0.35 ? 3 : random() < 0.15 ? 1 : 2;
+            if (random() < 0.52) knicksScore += points;
+            else opponentScore += points;
+          }
+
+          if (seconds === 0) {
+            if (period >= 4 && knicksScore !== opponentScore) {
+              status = "final";
+            } else {
+              period += 1;
+              seconds = period > 4 ? 5 * 60 : QUARTER_SECONDS;
+              status = "live";
+            }
+          }
+          remaining[i] = seconds;
+
+          const next: LiveGameState = {
+            ...state,
+            knicksScore,
+            opponentScore,
+            period,
+            status,
+            clock: formatClock(seconds),
+          };
+          states[i] = next;
+          onUpdate(next);
+        });
+      }, tickMs);
+
+      return () => clearInterval(timer);
+    },
+  };
+}
@@ -0,0 +1,189 @@
+import type { LiveGameState } from "@/types";
+import {
+  diffGameState,
+  type GameDelta,
+  type ScoreBatch,
+  type ScoreSnapshot,
+} from "./delta";
+import type { ScoreFeed } from "./feeds";
+
+/**
+ * Fans one upstream score feed out to any number of subscribers.
+ *
+ * Upstream updates are coalesced per game for `coalesceMs`, diffed against
+ * the last published state and published as one numbered batch. Recent
+ * batches are kept so a reconnecting client can resume from its last
+ * sequence number instead of reloading a full snapshot.
+ *
+ * The feed only runs while someone is subscribed. When the last subscriber
+ * leaves, all state is dropped and the epoch changes, since updates missed
+ * while idle can't be replayed: the next subscribers get a fresh snapshot.
+ */
+
+export type ScoreHubEvent =
+  | { type: "batch"; batch: ScoreBatch }
+  | { type: "heartbeat" };
+
+export type ScoreHubListener = (event: ScoreHubEvent) => void;
+
+export interface ScoreHubOptions {
+  /** Window over which bursts of upstream updates are merged */
+  coalesceMs?: number;
+  /** Number of batches kept for resume */
+  historySize?: number;
+  /** Interval of keep-alive events while anyone is subscribed */
+  heartbeatMs?: number;
+}
+
+export interface ScoreSubscription {
+  /** Full state, sent when the client is new or too far behind to resume */
+  snapshot: ScoreSnapshot | null;
+  /** Batches the client missed, when it can resume */
+  backlog: ScoreBatch[];
+  unsubscribe: () => void;
+}
+
+export class ScoreHub {
+  private static runs = 0;
+  private currentEpoch = ScoreHub.nextEpoch();
+  private readonly feed: ScoreFeed;
+  private readonly coalesceMs: number;
+  private readonly historySize: number;
+  private readonly heartbeatMs: number;
+  private readonly games = new Map<string, LiveGameState>();
+  private readonly pending = new Map<string, LiveGameState>();
+  private history: ScoreBatch[] = [];
+  private readonly listeners = new Set<ScoreHubListener>();
+  private seq = 0;
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+  private heartbeatTimer: ReturnType<typeof setInterval> | null = null;
+  private stopFeed: (() => void) | null = null;
+
+  constructor(
+    feed: ScoreFeed,
+    { coalesceMs = 250, historySize = 512, heartbeatMs = 15_000 }: ScoreHubOptions = {}
+  ) {
+    this.feed = feed;
+    this.coalesceMs = coalesceMs;
+    this.historySize = historySize;
+    this.heartbeatMs = heartbeatMs;
+  }
+
+  private static nextEpoch(): string {
+    return `${Date.now().toString(36)}-${(ScoreHub.runs++).toString(36)}`;
+  }
+
+  /**
+   * Identifies this hub run (process and feed subscription), so sequence
+   * numbers from a previous run are never resumed
+   */
+  get epoch(): string {
+    return this.currentEpoch;
+  }
+
+  get subscriberCount(): number {
+    return this.listeners.size;
+  }
+
+  /**
+   * Subscribe to batches. Pass the last sequence number the client applied
+   * (from this hub's epoch) to receive only what it missed.
+   */
+  subscribe(listener: ScoreHubListener, since?: number): ScoreSubscription {
+    const oldest = this.history[0]?.seq ?? this.seq + 1;
+    const resumeFrom =
+      since !== undefined && since <= this.seq && since >= oldest - 1
+        ? since
+        : null;
+
+    this.listeners.add(listener);
+    if (this.listeners.size === 1) this.start();
+
+    return {
+      snapshot: resumeFrom === null ? this.snapshot() : null,
+      backlog:
+        resumeFrom === null
+          ? []
+          : this.history.filter((batch) => batch.seq > resumeFrom),
+      unsubscribe: () => {
+        if (this.listeners.delete(listener) && this.listeners.size === 0) {
+          this.stop();
+        }
+      },
+    };
+  }
+
+  snapshot(): ScoreSnapshot {
+    return {
+      epoch: this.epoch,
+      seq: this.seq,
+      games: Array.from(this.games.values()),
+    };
+  }
+
+  /** Queue an upstream state; bursts for the same game collapse to the latest */
+  publish(state: LiveGameState): void {
+    this.pending.set(state.gameId, state);
+    if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => this.flush(), this.coalesceMs);
+    }
+  }
+
+  flush(): void {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+
+    const deltas: GameDelta[] = [];
+    for (const [gameId, state] of Array.from(this.pending)) {
+      const delta = diffGameState(this.games.get(gameId), state);
+      if (delta) {
+        deltas.push(delta);
+        this.games.set(gameId, state);
+      }
+    }
+    this.pending.clear();
+    if (deltas.length === 0) return;
+
+    const batch: ScoreBatch = { seq: ++this.seq, deltas };
+    this.history.push(batch);
+    if (this.history.length > this.historySize) this.history.shift();
+
+    this.emit({ type: "batch", batch });
+  }
+
+  private emit(event: ScoreHubEvent): void {
+    for (const listener of Array.from(this.listeners)) {
+      listener(event);
+    }
+  }
+
+  private start(): void {
+    this.stopFeed = this.feed.subscribe((state) => this.publish(state));
+    this.heartbeatTimer = setInterval(
+      () => this.emit({ type: "heartbeat" }),
+      this.heartbeatMs
+    );
+  }
+
+  private stop(): void {
+    this.stopFeed?.();
+    this.stopFeed = null;
+    if (this.heartbeatTimer) {
+      clearInterval(this.heartbeatTimer);
+      this.heartbeatTimer = null;
+    }
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+
+    // Nothing is tracked while idle, so the kept state would go stale
+    this.games.clear();
+    this.pending.clear();
+    this.history = [];
+    this.seq = 0;
+    this.currentEpoch = ScoreHub.nextEpoch();
+  }
+}
@@ -0,0 +1,9 @@
+/**
+ * Live scores barrel export
+ * Client code should import `@/lib/live/delta` directly to keep the hub and
+ * Supabase feed out of the browser bundle
+ */
+export * from "./delta";
+export * from "./feeds";
+export * from "./hub";
+export * from "./server";
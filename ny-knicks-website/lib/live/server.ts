@@ -0,0 +1,73 @@
+import { getSupabaseClient, isSupabaseConfigured } from "@/lib/data";
+import type { ScoreBatch, ScoreSnapshot } from "./delta";
+import { createFakeScoreFeed, createSupabaseScoreFeed } from "./feeds";
+import { ScoreHub, type ScoreHubEvent } from "./hub";
+
+/**
+ * Process-wide score hub and Server-Sent Events encoding.
+ *
+ * `LIVE_SCORES_FEED=fake` forces the simulated feed; otherwise Supabase
+ * Realtime is used whenever Supabase is configured.
+ */
+
+const globalForLive = globalThis as unknown as { knicksScoreHub?: ScoreHub };
+
+export function getScoreHub(): ScoreHub {
+  if (!globalForLive.knicksScoreHub) {
+    const useFake =
+      process.env.LIVE_SCORES_FEED === "fake" ||
+      (process.env.LIVE_SCORES_FEED !== "supabase" && !isSupabaseConfigured());
+
+    globalForLive.knicksScoreHub = new ScoreHub(
+      useFake
+        ? createFakeScoreFeed()
+        : createSupabaseScoreFeed(getSupabaseClient())
+    );
+  }
+  return globalForLive.knicksScoreHub;
+}
+
+const encoder = new TextEncoder();
+const HEARTBEAT = encoder.encode(": heartbeat\n\n");
+
+// Every subscriber receives the same batch object, so each batch is
+// serialized once no matter how many clients are connected
+const encodedBatches = new WeakMap<ScoreBatch, Uint8Array>();
+
+/** SSE event id: `<epoch>:<seq>`, echoed back by EventSource as Last-Event-ID */
+export function formatEventId(epoch: string, seq: number): string {
+  return `${epoch}:${seq}`;
+}
+
+export function parseEventId(
+  value: string | null
+): { epoch: string; seq: number } | null {
+  if (!value) return null;
+  const [epoch, seq] = value.split(":");
+  const parsed = Number(seq);
+  return epoch && Number.isInteger(parsed) && parsed >= 0
+    ? { epoch, seq: parsed }
+    : null;
+}
+
+export function encodeSnapshot(snapshot: ScoreSnapshot): Uint8Array {
+  return encoder.encode(
+    `id: ${formatEventId(snapshot.epoch, snapshot.seq)}\n` +
+      `event: snapshot\ndata: ${JSON.stringify(snapshot)}\n\n`
+  );
+}
+
+export function encodeHubEvent(epoch: string, event: ScoreHubEvent): Uint8Array {
+  if (event.type === "heartbeat") return HEARTBEAT;
+
+  const { batch } = event;
+  let encoded = encodedBatches.get(batch);
+  if (!encoded) {
+    encoded = encoder.encode(
+      `id: ${formatEventId(epoch, batch.seq)}\n` +
+        `event: batch\ndata: ${JSON.stringify(batch)}\n\n`
+    );
+    encodedBatches.set(batch, encoded);
+  }
+  return encoded;
+}
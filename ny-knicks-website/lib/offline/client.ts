@@ -0,0 +1,25 @@
+import type { SwMessage, SwStats } from "./config";
+
+/**
+ * Page-side helpers for talking to the active service worker
+ */
+
+function ask<T>(message: SwMessage): Promise<T | null> {
+  const controller = typeof navigator !== "undefined" ? navigator.serviceWorker?.controller : null;
+  if (!controller) return Promise.resolve(null);
+
+  return new Promise((resolve) => {
+    const channel = new MessageChannel();
+    channel.port1.onmessage = (event: MessageEvent<T>) => resolve(event.data);
+    controller.postMessage(message, [channel.port2]);
+  });
+}
+
+/** Cache hit/miss counters of the controlling worker, or `null` without one */
+export function getServiceWorkerStats(): Promise<SwStats | null> {
+  return ask<SwStats>({ type: "stats" });
+}
+
+export function resetServiceWorkerStats(): Promise<null> {
+  return ask<null>({ type: "reset-stats" });
+}
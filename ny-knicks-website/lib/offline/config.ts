@@ -0,0 +1,50 @@
+/**
+ * Service worker contract shared by the worker, its build script and the
+ * page-side registration
+ */
+
+export const SW_URL = "/sw.js";
+export const SW_CACHE_PREFIX = "knicks";
+/** Served when a navigation misses the cache while offline */
+export const OFFLINE_PATH = "/offline";
+
+/** Injected into `public/sw.js` by `npm run build:sw` */
+export interface SwManifest {
+  /** Content version: every cache name ends with it */
+  version: string;
+  /** Same-origin URLs cached on install (shell pages, JS, CSS, fonts) */
+  precache: string[];
+  cachePrefix: string;
+  offlinePath: string;
+  media: { maxEntries: number; maxBytes: number };
+  /** Path prefixes the worker never handles (streams, beacons, webhooks) */
+  bypass: string[];
+}
+
+export type SwStrategy = "static" | "pages" | "data" | "media";
+
+export interface SwStrategyStats {
+  hits: number;
+  misses: number;
+  /** Navigations answered with the offline page */
+  offline: number;
+}
+
+export interface SwStats {
+  version: string;
+  strategies: Record<SwStrategy, SwStrategyStats>;
+}
+
+export type SwMessage = { type: "stats" } | { type: "reset-stats" } | { type: "skip-waiting" };
+
+/** Cache-first media cache bounds, evicted least recently used first */
+export const MEDIA_CACHE_MAX_ENTRIES = 300;
+export const MEDIA_CACHE_MAX_BYTES = 60 * 1024 * 1024;
+
+export const SW_BYPASS_PATHS = [
+  "/api/scores/stream",
+  "/api/revalidate",
+  "/api/perf",
+  "/bench",
+  "/_next/webpack-hmr",
+];
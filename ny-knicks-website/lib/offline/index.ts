@@ -0,0 +1,6 @@
+/**
+ * Offline support barrel export
+ * The worker itself (`sw.ts`) is compiled separately by `npm run build:sw`
+ */
+export * from "./client";
+export * from "./config";
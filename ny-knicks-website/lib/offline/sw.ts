@@ -0,0 +1,303 @@
+import type { SwManifest, SwMessage, SwStats, SwStrategy } from "./config";
+
+/**
+ * Service worker source, compiled to `public/sw.js` by `npm run build:sw`
+ * with the build's `SwManifest` prepended as `self.__SW_MANIFEST`.
+ *
+ * - static (`/_next/static`, precached shell and fonts): cache first
+ * - pages (navigations and RSC payloads): stale-while-revalidate, with an
+ *   offline page for misses
+ * - data (search indexes, media pages): stale-while-revalidate
+ * - media (images, video posters): cache first, LRU-bounded by count and bytes
+ *
+ * Every cache name ends with the content version, and caches from other
+ * versions are deleted on activate. A new worker only activates once no
+ * page runs the old build, so a deploy swaps all cached content at once.
+ */
+
+// Typed locally: the project compiles against the DOM lib, not WebWorker
+interface ExtendableEventLike extends Event {
+  waitUntil(promise: Promise<unknown>): void;
+}
+
+interface FetchEventLike extends ExtendableEventLike {
+  request: Request;
+  respondWith(response: Response | Promise<Response>): void;
+}
+
+interface MessageEventLike extends ExtendableEventLike {
+  data: SwMessage;
+  ports: readonly MessagePort[];
+}
+
+interface ServiceWorkerScope {
+  __SW_MANIFEST: SwManifest;
+  location: Location;
+  clients: { claim(): Promise<void> };
+  skipWaiting(): Promise<void>;
+  addEventListener(type: "install" | "activate", listener: (event: ExtendableEventLike) => void): void;
+  addEventListener(type: "fetch", listener: (event: FetchEventLike) => void): void;
+  addEventListener(type: "message", listener: (event: MessageEventLike) => void): void;
+}
+
+const sw = self as unknown as ServiceWorkerScope;
+const manifest = sw.__SW_MANIFEST;
+
+const CACHES: Record<SwStrategy, string> = {
+  static: `${manifest.cachePrefix}-static-${manifest.version}`,
+  pages: `${manifest.cachePrefix}-pages-${manifest.version}`,
+  data: `${manifest.cachePrefix}-data-${manifest.version}`,
+  media: `${manifest.cachePrefix}-media-${manifest.version}`,
+};
+
+const DATA_PATHS = ["/api/search/", "/api/media"];
+const MEDIA_PATHS = ["/_img/", "/_next/image", "/video/"];
+const MEDIA_EXTENSIONS = /\.(avif|webp|png|jpe?g|gif|svg)$/i;
+/** Skip LRU bookkeeping writes for entries touched this recently */
+const TOUCH_INTERVAL_MS = 60_000;
+
+const stats: SwStats = { version: manifest.version, strategies: emptyStrategyStats() };
+
+function emptyStrategyStats(): SwStats["strategies"] {
+  const empty = () => ({ hits: 0, misses: 0, offline: 0 });
+  return { static: empty(), pages: empty(), data: empty(), media: empty() };
+}
+
+sw.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches
+      .open(CACHES.static)
+      .then((cache) =>
+        cache.addAll(manifest.precache.map((url) => new Request(url, { cache: "reload" })))
+      )
+  );
+});
+
+sw.addEventListener("activate", (event) => {
+  event.waitUntil(
+    (async () => {
+      const current = new Set(Object.values(CACHES));
+      const names = await caches.keys();
+      await Promise.all(
+        names
+          .filter((name) => name.startsWith(`${manifest.cachePrefix}-`) && !current.has(name))
+          .map((name) => caches.delete(name))
+      );
+      await mediaIndex.clearOtherVersions();
+      await sw.clients.claim();
+    })()
+  );
+});
+
+sw.addEventListener("message", (event) => {
+  const port = event.ports[0];
+  switch (event.data.type) {
+    case "stats":
+      port?.postMessage(stats);
+      break;
+    case "reset-stats":
+      stats.strategies = emptyStrategyStats();
+      port?.postMessage(null);
+      break;
+    case "skip-waiting":
+      event.waitUntil(sw.skipWaiting());
+      break;
+  }
+});
+
+sw.addEventListener("fetch", (event) => {
+  const { request } = event;
+  if (request.method !== "GET") return;
+
+  const url = new URL(request.url);
+  if (url.origin !== sw.location.origin) return;
+  if (manifest.bypass.some((prefix) => url.pathname.startsWith(prefix))) return;
+
+  if (url.pathname.startsWith("/_next/static/")) {
+    event.respondWith(cacheFirst(request));
+  } else if (
+    request.destination === "image" ||
+    (MEDIA_PATHS.some((prefix) => url.pathname.startsWith(prefix)) &&
+      MEDIA_EXTENSIONS.test(url.pathname))
+  ) {
+    event.respondWith(cacheFirstMedia(event));
+  } else if (request.mode === "navigate" || request.headers.get("RSC") === "1") {
+    event.respondWith(staleWhileRevalidate(event, "pages"));
+  } else if (DATA_PATHS.some((prefix) => url.pathname.startsWith(prefix))) {
+    event.respondWith(staleWhileRevalidate(event, "data"));
+  }
+});
+
+/** Responses that may be stored: complete, same-origin, not `no-store` */
+function isCacheable(response: Response): boolean {
+  return (
+    response.status === 200 &&
+    response.type === "basic" &&
+    !/no-store/i.test(response.headers.get("Cache-Control") ?? "")
+  );
+}
+
+async function cacheFirst(request: Request): Promise<Response> {
+  const cache = await caches.open(CACHES.static);
+  const cached = await cache.match(request);
+  if (cached) {
+    stats.strategies.static.hits++;
+    return cached;
+  }
+
+  stats.strategies.static.misses++;
+  const response = await fetch(request);
+  if (isCacheable(response)) await cache.put(request, response.clone());
+  return response;
+}
+
+async function staleWhileRevalidate(event: FetchEventLike, strategy: "pages" | "data"): Promise<Response> {
+  const { request } = event;
+  const cache = await caches.open(CACHES[strategy]);
+  // Precached shell pages answer until the first runtime copy exists
+  const cached =
+    (await cache.match(request)) ??
+    (strategy === "pages" ? await caches.match(request, { cacheName: CACHES.static }) : undefined);
+
+  const update = fetch(request).then(async (response) => {
+    if (isCacheable(response)) await cache.put(request, response.clone());
+    return response;
+  });
+
+  if (cached) {
+    stats.strategies[strategy].hits++;
+    // Refresh in the background; a failure just leaves the cached copy
+    event.waitUntil(update.catch(() => undefined));
+    return cached;
+  }
+
+  stats.strategies[strategy].misses++;
+  try {
+    return await update;
+  } catch (error) {
+    if (request.mode === "navigate") {
+      const fallback = await caches.match(manifest.offlinePath);
+      if (fallback) {
+        stats.strategies[strategy].offline++;
+        return fallback;
+      }
+    }
+    throw error;
+  }
+}
+
+async function cacheFirstMedia(event: FetchEventLike): Promise<Response> {
+  const { request } = event;
+  const cache = await caches.open(CACHES.media);
+  const cached = await cache.match(request);
+  if (cached) {
+    stats.strategies.media.hits++;
+    event.waitUntil(mediaIndex.touch(request.url));
+    return cached;
+  }
+
+  stats.strategies.media.misses++;
+  const response = await fetch(request);
+  if (isCacheable(response)) {
+    const copy = response.clone();
+    event.waitUntil(
+      (async () => {
+        const size = Number(copy.headers.get("Content-Length")) || (await copy.clone().blob()).size;
+        await cache.put(request, copy);
+        const evicted = await mediaIndex.record(request.url, size);
+        await Promise.all(evicted.map((url) => cache.delete(url)));
+      })()
+    );
+  }
+  return response;
+}
+
+/**
+ * LRU bookkeeping for the media cache in IndexedDB (the Cache API keeps no
+ * access order): url -> last access time and size, per version
+ */
+const mediaIndex = (() => {
+  const STORE = "media";
+  let database: Promise<IDBDatabase> | null = null;
+
+  function open(): Promise<IDBDatabase> {
+    database ??= new Promise((resolve, reject) => {
+      const request = indexedDB.open(`${manifest.cachePrefix}-sw`, 1);
+      request.onupgradeneeded = () => {
+        const store = request.result.createObjectStore(STORE, { keyPath: "url" });
+        store.createIndex("lastAccess", "lastAccess");
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => reject(request.error);
+    });
+    return database;
+  }
+
+  function done(transaction: IDBTransaction): Promise<void> {
+    return new Promise((resolve, reject) => {
+      transaction.oncomplete = () => resolve();
+      transaction.onerror = () => reject(transaction.error);
+    });
+  }
+
+  interface Entry {
+    url: string;
+    version: string;
+    size: number;
+    lastAccess: number;
+  }
+
+  return {
+    async touch(url: string): Promise<void> {
+      const transaction = (await open()).transaction(STORE, "readwrite");
+      const store = transaction.objectStore(STORE);
+      const request = store.get(url);
+      request.onsuccess = () => {
+        const entry = request.result as Entry | undefined;
+        if (entry && Date.now() - entry.lastAccess > TOUCH_INTERVAL_MS) {
+          store.put({ ...entry, lastAccess: Date.now() });
+        }
+      };
+      await done(transaction);
+    },
+
+    /** Record a new entry; returns URLs evicted to stay within bounds */
+    async record(url: string, size: number): Promise<string[]> {
+      const transaction = (await open()).transaction(STORE, "readwrite");
+      const store = transaction.objectStore(STORE);
+      store.put({ url, version: manifest.version, size, lastAccess: Date.now() } satisfies Entry);
+
+      const evicted: string[] = [];
+      const all = store.index("lastAccess").getAll();
+      all.onsuccess = () => {
+        const entries = all.result as Entry[];
+        let count = entries.length;
+        let bytes = entries.reduce((total, entry) => total + entry.size, 0);
+        // Oldest first
+        for (const entry of entries) {
+          if (count <= manifest.media.maxEntries && bytes <= manifest.media.maxBytes) break;
+          if (entry.url === url) continue;
+          store.delete(entry.url);
+          evicted.push(entry.url);
+          count--;
+          bytes -= entry.size;
+        }
+      };
+      await done(transaction);
+      return evicted;
+    },
+
+    async clearOtherVersions(): Promise<void> {
+      const transaction = (await open()).transaction(STORE, "readwrite");
+      const store = transaction.objectStore(STORE);
+      const cursor = store.openCursor();
+      cursor.onsuccess = () => {
+        const current = cursor.result;
+        if (!current) return;
+        if ((current.value as Entry).version !== manifest.version) current.delete();
+        current.continue();
+      };
+      await done(transaction);
+    },
+  };
+})();
@@ -0,0 +1,38 @@
+/**
+ * Performance budgets from the project targets. Field data is checked at
+ * p75, lab runs at the median of their repeats.
+ */
+
+export const VITALS_BUDGETS = {
+  fcp: 1500,
+  lcp: 2500,
+  /** Lab only: needs long task attribution the field collector doesn't have */
+  tbt: 200,
+  cls: 0.1,
+} as const;
+
+export type BudgetMetric = keyof typeof VITALS_BUDGETS;
+
+/** Gzipped client JS per route, shared framework chunks included */
+export const JS_BUDGET_BYTES = 200 * 1024;
+
+export interface BudgetViolation {
+  metric: BudgetMetric | "js";
+  value: number;
+  budget: number;
+}
+
+/** Metrics over budget; missing values are skipped */
+export function checkVitalsBudget(
+  values: Partial<Record<BudgetMetric, number | null>>
+): BudgetViolation[] {
+  const violations: BudgetViolation[] = [];
+  for (const metric of Object.keys(VITALS_BUDGETS) as BudgetMetric[]) {
+    const value = values[metric];
+    const budget = VITALS_BUDGETS[metric];
+    if (value !== undefined && value !== null && value > budget) {
+      violations.push({ metric, value, budget });
+    }
+  }
+  return violations;
+}
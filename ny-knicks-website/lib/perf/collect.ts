@@ -0,0 +1,148 @@
+import {
+  MAX_BEACON_SAMPLES,
+  PERF_ENDPOINT,
+  routePattern,
+  type PerfBeacon,
+  type PerfSample,
+} from "./config";
+import { PERF_MARKS, type PerfMarkName } from "./marks";
+
+export interface PerfCollectionOptions {
+  endpoint?: string;
+  /** Defaults to the pattern of the landing page's path */
+  route?: string;
+  /** Fraction of page loads that report, 0-1 */
+  sampleRate?: number;
+}
+
+interface LayoutShiftEntry extends PerformanceEntry {
+  value: number;
+  hadRecentInput: boolean;
+}
+
+interface EventTimingEntry extends PerformanceEntry {
+  interactionId?: number;
+}
+
+const MARK_NAMES = new Set<string>(Object.values(PERF_MARKS));
+
+/**
+ * Collects Web Vitals (FCP, LCP, CLS, INP, TTFB) and the custom marks in
+ * `PERF_MARKS` for the current page load, and sends them in batches with
+ * `navigator.sendBeacon` when the page is hidden.
+ *
+ * One-shot values (FCP, TTFB, marks) are queued as they happen. LCP, CLS
+ * and INP keep changing, so they are sent once, with the first hidden
+ * event. Soft navigations are attributed to the landing route, as the
+ * browser only reports paint timings for the initial document.
+ *
+ * Returns a function that stops collection.
+ */
+export function startPerfCollection({
+  endpoint = PERF_ENDPOINT,
+  route = routePattern(location.pathname),
+  sampleRate = 1,
+}: PerfCollectionOptions = {}): () => void {
+  if (Math.random() >= sampleRate || typeof PerformanceObserver === "undefined") {
+    return () => {};
+  }
+
+  const queue: PerfSample[] = [];
+  const observers: PerformanceObserver[] = [];
+  let lcp: number | null = null;
+  let finalized = false;
+
+  // CLS: largest session window (shifts < 1s apart, window < 5s)
+  let cls = 0;
+  let sessionValue = 0;
+  let sessionStart = 0;
+  let sessionLast = 0;
+
+  // INP: worst interaction, ignoring one outlier per 50 interactions
+  const interactions = new Map<number, number>();
+
+  const observe = (type: string, callback: (entry: PerformanceEntry) => void, options: object = {}) => {
+    try {
+      const observer = new PerformanceObserver((list) => list.getEntries().forEach(callback));
+      observer.observe({ type, buffered: true, ...options });
+      observers.push(observer);
+    } catch {
+      // Entry type not supported by this browser
+    }
+  };
+
+  observe("paint", (entry) => {
+    if (entry.name === "first-contentful-paint") queue.push({ name: "fcp", value: entry.startTime });
+  });
+  observe("largest-contentful-paint", (entry) => {
+    lcp = entry.startTime;
+  });
+  observe("layout-shift", (entry) => {
+    const shift = entry as LayoutShiftEntry;
+    if (shift.hadRecentInput) return;
+    if (sessionValue > 0 && shift.startTime - sessionLast < 1000 && shift.startTime - sessionStart < 5000) {
+      sessionValue += shift.value;
+    } else {
+      sessionValue = shift.value;
+      sessionStart = shift.startTime;
+    }
+    sessionLast = shift.startTime;
+    cls = Math.max(cls, sessionValue);
+  });
+  observe(
+    "event",
+    (entry) => {
+      const { interactionId } = entry as EventTimingEntry;
+      if (!interactionId) return;
+      interactions.set(interactionId, Math.max(interactions.get(interactionId) ?? 0, entry.duration));
+    },
+    { durationThreshold: 40 }
+  );
+  observe("mark", (entry) => {
+    if (MARK_NAMES.has(entry.name)) {
+      queue.push({ name: entry.name as PerfMarkName, value: entry.startTime });
+    }
+  });
+
+  const [navigation] = performance.getEntriesByType("navigation") as PerformanceNavigationTiming[];
+  if (navigation) queue.push({ name: "ttfb", value: navigation.responseStart });
+
+  function inp(): number | null {
+    if (interactions.size === 0) return null;
+    const durations = [...interactions.values()].sort((a, b) => b - a);
+    return durations[Math.min(durations.length - 1, Math.floor(interactions.size / 50))]!;
+  }
+
+  function flush() {
+    if (!finalized) {
+      finalized = true;
+      if (lcp !== null) queue.push({ name: "lcp", value: lcp });
+      queue.push({ name: "cls", value: cls });
+      const interaction = inp();
+      if (interaction !== null) queue.push({ name: "inp", value: interaction });
+    }
+
+    while (queue.length > 0) {
+      const beacon: PerfBeacon = { route, samples: queue.splice(0, MAX_BEACON_SAMPLES) };
+      const body = JSON.stringify(beacon);
+      const sent =
+        typeof navigator.sendBeacon === "function" &&
+        navigator.sendBeacon(endpoint, new Blob([body], { type: "application/json" }));
+      if (!sent) {
+        fetch(endpoint, { method: "POST", body, keepalive: true }).catch(() => {});
+      }
+    }
+  }
+
+  const onVisibilityChange = () => {
+    if (document.visibilityState === "hidden") flush();
+  };
+  document.addEventListener("visibilitychange", onVisibilityChange);
+  window.addEventListener("pagehide", flush);
+
+  return () => {
+    observers.forEach((observer) => observer.disconnect());
+    document.removeEventListener("visibilitychange", onVisibilityChange);
+    window.removeEventListener("pagehide", flush);
+  };
+}
@@ -0,0 +1,55 @@
+import { SITE_ROUTES } from "@/lib/constants/routes";
+import { PERF_MARKS, type PerfMarkName } from "./marks";
+
+/**
+ * Telemetry contract shared by the page-side collector, the ingestion route
+ * and the lab benchmark
+ */
+
+export const PERF_ENDPOINT = "/api/perf";
+
+export const WEB_VITALS = ["fcp", "lcp", "cls", "inp", "ttfb"] as const;
+export type WebVitalName = (typeof WEB_VITALS)[number];
+
+export type PerfMetricName = WebVitalName | PerfMarkName;
+
+export const PERF_METRICS: readonly PerfMetricName[] = [...WEB_VITALS, ...Object.values(PERF_MARKS)];
+
+export function isPerfMetricName(value: unknown): value is PerfMetricName {
+  return PERF_METRICS.includes(value as PerfMetricName);
+}
+
+export interface PerfSample {
+  name: PerfMetricName;
+  /** Milliseconds since navigation start; unitless for CLS */
+  value: number;
+}
+
+/** Body of one `sendBeacon` call */
+export interface PerfBeacon {
+  /** Route pattern, e.g. `/news/[slug]` */
+  route: string;
+  samples: PerfSample[];
+}
+
+/** Most samples accepted in one beacon */
+export const MAX_BEACON_SAMPLES = 50;
+
+const STATIC_ROUTES = new Set<string>(Object.values(SITE_ROUTES));
+const DYNAMIC_ROUTES = [
+  { prefix: `${SITE_ROUTES.roster}/`, pattern: `${SITE_ROUTES.roster}/[id]` },
+  { prefix: `${SITE_ROUTES.news}/`, pattern: `${SITE_ROUTES.news}/[slug]` },
+];
+
+/**
+ * Pathname -> route pattern, so samples aggregate per page template and the
+ * store stays bounded. Unknown paths share one `other` bucket.
+ */
+export function routePattern(pathname: string): string {
+  const path = pathname.length > 1 ? pathname.replace(/\/+$/, "") : pathname;
+  if (STATIC_ROUTES.has(path)) return path;
+  const dynamic = DYNAMIC_ROUTES.find(
+    ({ prefix }) => path.startsWith(prefix) && !path.slice(prefix.length).includes("/")
+  );
+  return dynamic?.pattern ?? "other";
+}
@@ -0,0 +1,11 @@
+/**
+ * Performance telemetry barrel export
+ * Client code should import `@/lib/perf/collect` and `@/lib/perf/marks`
+ * directly to keep the file-backed store out of the browser bundle
+ */
+export * from "./budgets";
+export * from "./collect";
+export * from "./config";
+export * from "./marks";
+export * from "./stats";
+export * from "./store";
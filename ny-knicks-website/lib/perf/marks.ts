@@ -0,0 +1,21 @@
+/**
+ * Custom `performance.mark` names reported alongside the Web Vitals
+ */
+export const PERF_MARKS = {
+  /** Hero background video started playing */
+  heroReady: "hero:ready",
+  /** Live score ticker received its first snapshot */
+  tickerFirstUpdate: "ticker:first-update",
+  /** Masonry gallery placed its first tiles */
+  galleryFirstTiles: "gallery:first-tiles",
+} as const;
+
+export type PerfMarkName = (typeof PERF_MARKS)[keyof typeof PERF_MARKS];
+
+/** Mark only the first occurrence per page load */
+export function markOnce(name: PerfMarkName): void {
+  if (typeof performance === "undefined") return;
+  if (performance.getEntriesByName(name, "mark").length === 0) {
+    performance.mark(name);
+  }
+}
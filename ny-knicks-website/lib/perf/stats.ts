@@ -0,0 +1,26 @@
+export interface PercentileSummary {
+  count: number;
+  p50: number;
+  p75: number;
+  p95: number;
+}
+
+/** Linear-interpolated percentile of ascending `sorted` values, `p` in 0-100 */
+export function percentile(sorted: readonly number[], p: number): number {
+  if (sorted.length === 0) return Number.NaN;
+  const rank = (p / 100) * (sorted.length - 1);
+  const lower = Math.floor(rank);
+  const upper = Math.ceil(rank);
+  const low = sorted[lower]!;
+  return low + (sorted[upper]! - low) * (rank - lower);
+}
+
+export function summarize(values: readonly number[]): PercentileSummary {
+  const sorted = [...values].sort((a, b) => a - b);
+  return {
+    count: sorted.length,
+    p50: percentile(sorted, 50),
+    p75: percentile(sorted, 75),
+    p95: percentile(sorted, 95),
+  };
+}
@@ -0,0 +1,114 @@
+import { existsSync, readFileSync } from "node:fs";
+import { mkdir, rename, writeFile } from "node:fs/promises";
+import path from "node:path";
+import { checkVitalsBudget, type BudgetViolation } from "./budgets";
+import type { PerfBeacon, PerfMetricName } from "./config";
+import { summarize, type PercentileSummary } from "./stats";
+
+/**
+ * Local store for field telemetry: the most recent samples per route and
+ * metric, persisted as JSON so percentiles survive restarts. Writes are
+ * batched and atomic (temp file + rename); a full window drops its oldest
+ * samples first. An unreadable file starts the store empty.
+ */
+
+export interface PerfStoreOptions {
+  file?: string;
+  /** Samples kept per route and metric */
+  maxSamples?: number;
+  /** Delay before pending samples are written to disk */
+  flushDelayMs?: number;
+}
+
+export interface RoutePerfSummary {
+  metrics: Partial<Record<PerfMetricName, PercentileSummary>>;
+  /** Web Vitals whose p75 is over budget */
+  overBudget: BudgetViolation[];
+}
+
+type Samples = Record<string, Partial<Record<PerfMetricName, number[]>>>;
+
+export class PerfStore {
+  private readonly file: string;
+  private readonly maxSamples: number;
+  private readonly flushDelayMs: number;
+  private readonly samples: Samples;
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+  constructor({
+    file = ".perf/metrics.json",
+    maxSamples = 1000,
+    flushDelayMs = 5000,
+  }: PerfStoreOptions = {}) {
+    this.file = path.resolve(file);
+    this.maxSamples = maxSamples;
+    this.flushDelayMs = flushDelayMs;
+    this.samples = readSamples(this.file);
+  }
+
+  record({ route, samples }: PerfBeacon): void {
+    const metrics = (this.samples[route] ??= {});
+    for (const { name, value } of samples) {
+      const values = (metrics[name] ??= []);
+      values.push(value);
+      if (values.length > this.maxSamples) values.splice(0, values.length - this.maxSamples);
+    }
+    this.scheduleFlush();
+  }
+
+  summary(): Record<string, RoutePerfSummary> {
+    const result: Record<string, RoutePerfSummary> = {};
+    for (const [route, metrics] of Object.entries(this.samples)) {
+      const summaries: RoutePerfSummary["metrics"] = {};
+      for (const [name, values] of Object.entries(metrics)) {
+        if (values.length > 0) summaries[name as PerfMetricName] = summarize(values);
+      }
+      result[route] = {
+        metrics: summaries,
+        overBudget: checkVitalsBudget({
+          fcp: summaries.fcp?.p75,
+          lcp: summaries.lcp?.p75,
+          cls: summaries.cls?.p75,
+        }),
+      };
+    }
+    return result;
+  }
+
+  async flush(): Promise<void> {
+    if (this.flushTimer) clearTimeout(this.flushTimer);
+    this.flushTimer = null;
+    await mkdir(path.dirname(this.file), { recursive: true });
+    const temp = `${this.file}.${process.pid}.tmp`;
+    await writeFile(temp, JSON.stringify(this.samples));
+    await rename(temp, this.file);
+  }
+
+  private scheduleFlush() {
+    if (this.flushTimer) return;
+    this.flushTimer = setTimeout(() => {
+      this.flush().catch((error: unknown) => console.error("Failed to write perf store", error));
+    }, this.flushDelayMs);
+    this.flushTimer.unref?.();
+  }
+}
+
+function readSamples(file: string): Samples {
+  if (!existsSync(file)) return {};
+  try {
+    const parsed: unknown = JSON.parse(readFileSync(file, "utf8"));
+    if (parsed && typeof parsed === "object" && !Array.isArray(parsed)) return parsed as Samples;
+    throw new Error("not an object");
+  } catch (error) {
+    console.warn(`Ignoring unreadable perf store ${file}: ${(error as Error).message}`);
+    return {};
+  }
+}
+
+const globalForPerf = globalThis as unknown as { knicksPerfStore?: PerfStore };
+
+/** Process-wide store; `PERF_STORE_PATH` sets the file */
+export function getPerfStore(): PerfStore {
+  globalForPerf.knicksPerfStore ??= new PerfStore({ file: process.env.PERF_STORE_PATH });
+  return globalForPerf.knicksPerfStore;
+}
@@ -0,0 +1,99 @@
+import { encodeVarints, hashString, toBase64, VarintWriter } from "./encoding";
+import { tokenize } from "./tokenize";
+import {
+  SEARCH_FIELD_WEIGHTS,
+  SEARCH_INDEX_VERSION,
+  type SearchDocument,
+  type SearchField,
+  type SerializedSearchIndex,
+} from "./types";
+
+const MAX_WEIGHT = 255;
+
+/**
+ * Build a serialized search index. Documents are indexed in the given
+ * order, which is also the result order for facet-only queries, so pass
+ * them in default listing order (e.g. newest first).
+ */
+export function buildSearchIndex<TStored extends object>(
+  documents: readonly SearchDocument<TStored>[]
+): SerializedSearchIndex {
+  // term -> document -> accumulated weight, documents visited in order
+  const termPostings = new Map<string, Map<number, number>>();
+  const facetSets = new Map<string, Map<string, number[]>>();
+  const stored: Record<string, unknown[]> = {};
+
+  documents.forEach((document, doc) => {
+    for (const [field, text] of Object.entries(document.text)) {
+      if (!text) continue;
+      const weight = SEARCH_FIELD_WEIGHTS[field as SearchField];
+      for (const term of tokenize(text)) {
+        let postings = termPostings.get(term);
+        if (!postings) termPostings.set(term, (postings = new Map()));
+        postings.set(doc, Math.min(MAX_WEIGHT, (postings.get(doc) ?? 0) + weight));
+      }
+    }
+
+    for (const [field, raw] of Object.entries(document.facets)) {
+      if (raw === undefined) continue;
+      let values = facetSets.get(field);
+      if (!values) facetSets.set(field, (values = new Map()));
+      for (const value of new Set(typeof raw === "string" ? [raw] : raw)) {
+        let docs = values.get(value);
+        if (!docs) values.set(value, (docs = []));
+        docs.push(doc);
+      }
+    }
+
+    for (const [field, value] of Object.entries(document.stored)) {
+      (stored[field] ??= new Array(documents.length).fill(null))[doc] = value ?? null;
+    }
+  });
+
+  const terms = [...termPostings.keys()].sort();
+  const postingsWriter = new VarintWriter();
+  const lengths: number[] = [];
+  for (const term of terms) {
+    const start = postingsWriter.byteLength;
+    let previous = 0;
+    for (const [doc, weight] of termPostings.get(term)!) {
+      postingsWriter.write(doc - previous);
+      postingsWriter.write(weight);
+      previous = doc;
+    }
+    lengths.push(postingsWriter.byteLength - start);
+  }
+
+  const facets: SerializedSearchIndex["facets"] = {};
+  for (const [field, values] of facetSets) {
+    const encoded: Record<string, string> = {};
+    for (const [value, docs] of values) {
+      encoded[value] = encodeDocumentSet(docs, documents.length);
+    }
+    facets[field] = encoded;
+  }
+
+  return {
+    version: SEARCH_INDEX_VERSION,
+    hash: hashString(JSON.stringify(documents)),
+    count: documents.length,
+    stored,
+    terms,
+    offsets: toBase64(encodeVarints(lengths)),
+    postings: toBase64(postingsWriter.finish()),
+    facets,
+  };
+}
+
+/** Sparse sets as gap lists, dense ones as bitsets */
+function encodeDocumentSet(docs: readonly number[], count: number): string {
+  const gaps = encodeVarints(docs.map((doc, i) => doc - (i > 0 ? docs[i - 1]! : 0)));
+  const bitsetBytes = Math.ceil(count / 32) * 4;
+  if (gaps.length <= bitsetBytes) {
+    return `l:${toBase64(gaps)}`;
+  }
+
+  const bits = new Uint32Array(bitsetBytes / 4);
+  for (const doc of docs) bits[doc >>> 5]! |= 1 << (doc & 31);
+  return `b:${toBase64(new Uint8Array(bits.buffer))}`;
+}
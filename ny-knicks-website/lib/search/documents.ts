@@ -0,0 +1,68 @@
+import type { NewsArticle, Player } from "@/types";
+import type { SearchDocument } from "./types";
+
+/**
+ * What the site indexes: article and player mappings to search documents
+ */
+
+export const SEARCH_INDEX_NAMES = ["news", "players"] as const;
+
+export type SearchIndexName = (typeof SEARCH_INDEX_NAMES)[number];
+
+export function isSearchIndexName(name: string): name is SearchIndexName {
+  return (SEARCH_INDEX_NAMES as readonly string[]).includes(name);
+}
+
+/** Static asset URL of an index */
+export function searchIndexUrl(name: SearchIndexName): string {
+  return `/api/search/${name}`;
+}
+
+/** News hits carry what a result row renders, not the article body */
+export type NewsSearchHit = Pick<
+  NewsArticle,
+  "id" | "slug" | "title" | "excerpt" | "publishedAt" | "author" | "image" | "tags" | "readingTime"
+>;
+
+export type PlayerSearchHit = Player;
+
+const monthFormat = new Intl.DateTimeFormat("en-CA", {
+  timeZone: "America/New_York",
+  year: "numeric",
+  month: "2-digit",
+});
+
+/** Date bucket facet value, e.g. `2026-10` */
+export function monthBucket(isoDate: string): string {
+  return monthFormat.format(new Date(isoDate)).slice(0, 7);
+}
+
+export function newsSearchDocument(article: NewsArticle): SearchDocument<NewsSearchHit> {
+  return {
+    text: { title: article.title, excerpt: article.excerpt, content: article.content },
+    facets: {
+      tag: article.tags,
+      author: article.author,
+      month: monthBucket(article.publishedAt),
+    },
+    stored: {
+      id: article.id,
+      slug: article.slug,
+      title: article.title,
+      excerpt: article.excerpt,
+      publishedAt: article.publishedAt,
+      author: article.author,
+      image: article.image,
+      tags: article.tags,
+      readingTime: article.readingTime,
+    },
+  };
+}
+
+export function playerSearchDocument(player: Player): SearchDocument<PlayerSearchHit> {
+  return {
+    text: { title: player.name, excerpt: `${player.position} #${player.number}` },
+    facets: { position: player.position },
+    stored: player,
+  };
+}
@@ -0,0 +1,139 @@
+/**
+ * Compact binary encodings for the search index: unsigned LEB128 varints,
+ * base64 (works in Node, browsers and workers) and 32-bit word bitsets.
+ */
+
+export class VarintWriter {
+  private bytes = new Uint8Array(1024);
+  private length = 0;
+
+  get byteLength(): number {
+    return this.length;
+  }
+
+  write(value: number): void {
+    if (this.length + 5 > this.bytes.length) {
+      const grown = new Uint8Array(this.bytes.length * 2);
+      grown.set(this.bytes);
+      this.bytes = grown;
+    }
+    let remaining = value >>> 0;
+    while (remaining >= 0x80) {
+      this.bytes[this.length++] = (remaining & 0x7f) | 0x80;
+      remaining >>>= 7;
+    }
+    this.bytes[this.length++] = remaining;
+  }
+
+  finish(): Uint8Array {
+    return this.bytes.subarray(0, this.length);
+  }
+}
+
+export class VarintReader {
+  constructor(
+    private readonly bytes: Uint8Array,
+    public offset = 0
+  ) {}
+
+  read(): number {
+    let value = 0;
+    let shift = 0;
+    let byte: number;
+    do {
+      byte = this.bytes[this.offset++]!;
+      value |= (byte & 0x7f) << shift;
+      shift += 7;
+    } while (byte & 0x80);
+    return value >>> 0;
+  }
+}
+
+export function encodeVarints(values: Iterable<number>): Uint8Array {
+  const writer = new VarintWriter();
+  for (const value of values) writer.write(value);
+  return writer.finish();
+}
+
+export function toBase64(bytes: Uint8Array): string {
+  let binary = "";
+  // Chunked so large arrays don't overflow the argument limit
+  for (let i = 0; i < bytes.length; i += 0x8000) {
+    binary += String.fromCharCode(...bytes.subarray(i, i + 0x8000));
+  }
+  return btoa(binary);
+}
+
+export function fromBase64(text: string): Uint8Array {
+  const binary = atob(text);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+  return bytes;
+}
+
+export type Bitset = Uint32Array;
+
+export function createBitset(size: number): Bitset {
+  return new Uint32Array(Math.ceil(size / 32));
+}
+
+export function setBit(bits: Bitset, index: number): void {
+  bits[index >>> 5]! |= 1 << (index & 31);
+}
+
+export function hasBit(bits: Bitset, index: number): boolean {
+  return (bits[index >>> 5]! & (1 << (index & 31))) !== 0;
+}
+
+/** `target &= other`, in place */
+export function andInto(target: Bitset, other: Bitset): Bitset {
+  for (let i = 0; i < target.length; i++) target[i]! &= other[i]!;
+  return target;
+}
+
+/** `target |= other`, in place */
+export function orInto(target: Bitset, other: Bitset): Bitset {
+  for (let i = 0; i < target.length; i++) target[i]! |= other[i]!;
+  return target;
+}
+
+function popcount32(word: number): number {
+  word -= (word >>> 1) & 0x55555555;
+  word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+  return (Math.imul((word + (word >>> 4)) & 0x0f0f0f0f, 0x01010101) >>> 24);
+}
+
+export function countBits(bits: Bitset): number {
+  let count = 0;
+  for (let i = 0; i < bits.length; i++) count += popcount32(bits[i]!);
+  return count;
+}
+
+/** Size of `a & b` without allocating */
+export function countIntersection(a: Bitset, b: Bitset): number {
+  let count = 0;
+  for (let i = 0; i < a.length; i++) count += popcount32(a[i]! & b[i]!);
+  return count;
+}
+
+/** Indices of set bits, ascending */
+export function* iterateBits(bits: Bitset): Generator<number> {
+  for (let i = 0; i < bits.length; i++) {
+    let word = bits[i]!;
+    while (word !== 0) {
+      const lowest = word & -word;
+      yield i * 32 + (31 - Math.clz32(lowest));
+      word ^= lowest;
+    }
+  }
+}
+
+/** FNV-1a, for content versioning without a crypto dependency */
+export function hashString(text: string): string {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(36);
+}
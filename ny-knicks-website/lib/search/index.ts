@@ -0,0 +1,12 @@
+/**
+ * Search barrel export
+ * Client code (and the worker) should import `@/lib/search/query` and
+ * `@/lib/search/documents` directly to keep the data layer out of the bundle
+ */
+export * from "./build";
+export * from "./documents";
+export * from "./encoding";
+export * from "./query";
+export * from "./server";
+export * from "./tokenize";
+export * from "./types";
@@ -0,0 +1,255 @@
+import {
+  andInto,
+  countBits,
+  countIntersection,
+  createBitset,
+  fromBase64,
+  iterateBits,
+  orInto,
+  setBit,
+  VarintReader,
+  type Bitset,
+} from "./encoding";
+import { tokenizeQuery } from "./tokenize";
+import {
+  SEARCH_INDEX_VERSION,
+  type SearchQuery,
+  type SearchResult,
+  type SerializedSearchIndex,
+} from "./types";
+
+/** Vocabulary terms a trailing prefix may expand to */
+const MAX_PREFIX_EXPANSIONS = 64;
+
+/**
+ * Queries a serialized index entirely in memory. Postings and facet sets
+ * are decoded on first use and kept, so repeated keystrokes and facet
+ * toggles only do bitset arithmetic.
+ */
+export class SearchIndex<TStored = Record<string, unknown>> {
+  readonly count: number;
+  readonly hash: string;
+
+  private readonly terms: string[];
+  private readonly termStarts: Uint32Array;
+  private readonly postings: Uint8Array;
+  private readonly stored: Record<string, unknown[]>;
+  private readonly encodedFacets: SerializedSearchIndex["facets"];
+  private readonly facetCache = new Map<string, Bitset>();
+  private readonly postingCache = new Map<number, Map<number, number>>();
+  private readonly all: Bitset;
+
+  constructor(data: SerializedSearchIndex) {
+    if (data.version !== SEARCH_INDEX_VERSION) {
+      throw new Error(
+        `Search index version ${data.version} is not supported (expected ${SEARCH_INDEX_VERSION})`
+      );
+    }
+
+    this.count = data.count;
+    this.hash = data.hash;
+    this.terms = data.terms;
+    this.postings = fromBase64(data.postings);
+    this.stored = data.stored;
+    this.encodedFacets = data.facets;
+
+    const lengths = new VarintReader(fromBase64(data.offsets));
+    this.termStarts = new Uint32Array(this.terms.length + 1);
+    for (let i = 0; i < this.terms.length; i++) {
+      this.termStarts[i + 1] = this.termStarts[i]! + lengths.read();
+    }
+
+    this.all = createBitset(this.count);
+    for (let doc = 0; doc < this.count; doc++) setBit(this.all, doc);
+  }
+
+  /** Facet fields and their values, for rendering filter controls */
+  facetValues(): Record<string, string[]> {
+    return Object.fromEntries(
+      Object.entries(this.encodedFacets).map(([field, values]) => [
+        field,
+        Object.keys(values).sort(),
+      ])
+    );
+  }
+
+  search({ text = "", filters = {}, offset = 0, limit = 20 }: SearchQuery = {}): SearchResult<TStored> {
+    const start = performance.now();
+
+    const scores = this.matchText(text);
+    const textSet = scores ? this.toBitset(scores.keys()) : this.all;
+
+    // Disjunctive faceting: each field's counts ignore that field's own filter
+    const fieldSets = new Map<string, Bitset>();
+    for (const [field, values] of Object.entries(filters)) {
+      if (values.length > 0) fieldSets.set(field, this.unionOf(field, values));
+    }
+
+    const matches = textSet.slice();
+    for (const set of fieldSets.values()) andInto(matches, set);
+
+    const facets: SearchResult<TStored>["facets"] = {};
+    for (const field of Object.keys(this.encodedFacets)) {
+      let base = matches;
+      if (fieldSets.has(field)) {
+        base = textSet.slice();
+        for (const [other, set] of fieldSets) {
+          if (other !== field) andInto(base, set);
+        }
+      }
+      const counts: Record<string, number> = {};
+      for (const value of Object.keys(this.encodedFacets[field]!)) {
+        const count = countIntersection(base, this.facetSet(field, value));
+        if (count > 0) counts[value] = count;
+      }
+      facets[field] = counts;
+    }
+
+    const total = countBits(matches);
+    let ordered: Iterable<number> = iterateBits(matches);
+    if (scores) {
+      ordered = [...iterateBits(matches)].sort(
+        (a, b) => scores.get(b)! - scores.get(a)! || a - b
+      );
+    }
+
+    const hits: TStored[] = [];
+    let position = 0;
+    for (const doc of ordered) {
+      if (position++ < offset) continue;
+      if (hits.length >= limit) break;
+      hits.push(this.document(doc));
+    }
+
+    return { total, hits, facets, tookMs: performance.now() - start };
+  }
+
+  document(doc: number): TStored {
+    const document: Record<string, unknown> = {};
+    for (const [field, column] of Object.entries(this.stored)) {
+      const value = column[doc];
+      if (value !== null && value !== undefined) document[field] = value;
+    }
+    return document as TStored;
+  }
+
+  /**
+   * Document -> score for documents containing every query term, or `null`
+   * for an empty query
+   */
+  private matchText(text: string): Map<number, number> | null {
+    const { terms, prefix } = tokenizeQuery(text);
+    const groups = terms.map((term) => {
+      const index = this.findTerm(term);
+      return index === -1 ? [] : [index];
+    });
+    if (prefix) groups.push(this.expandPrefix(prefix));
+    if (groups.length === 0) return null;
+
+    let result: Map<number, number> | null = null;
+    // Rarest group first keeps the intersection small
+    const postingLists = groups
+      .map((indices) => this.unionPostings(indices))
+      .sort((a, b) => a.size - b.size);
+    for (const postings of postingLists) {
+      if (!result) {
+        result = new Map(postings);
+        continue;
+      }
+      for (const [doc, score] of result) {
+        const weight = postings.get(doc);
+        if (weight === undefined) result.delete(doc);
+        else result.set(doc, score + weight);
+      }
+    }
+    return result ?? new Map();
+  }
+
+  private unionPostings(termIndices: readonly number[]): Map<number, number> {
+    if (termIndices.length === 1) return this.decodePostings(termIndices[0]!);
+
+    const union = new Map<number, number>();
+    for (const index of termIndices) {
+      for (const [doc, weight] of this.decodePostings(index)) {
+        union.set(doc, Math.max(union.get(doc) ?? 0, weight));
+      }
+    }
+    return union;
+  }
+
+  private decodePostings(termIndex: number): Map<number, number> {
+    const cached = this.postingCache.get(termIndex);
+    if (cached) return cached;
+
+    const postings = new Map<number, number>();
+    const reader = new VarintReader(this.postings, this.termStarts[termIndex]!);
+    const end = this.termStarts[termIndex + 1]!;
+    let doc = 0;
+    while (reader.offset < end) {
+      doc += reader.read();
+      postings.set(doc, reader.read());
+    }
+    this.postingCache.set(termIndex, postings);
+    return postings;
+  }
+
+  private findTerm(term: string): number {
+    const index = this.lowerBound(term);
+    return this.terms[index] === term ? index : -1;
+  }
+
+  private expandPrefix(prefix: string): number[] {
+    const indices: number[] = [];
+    for (let i = this.lowerBound(prefix); i < this.terms.length; i++) {
+      if (!this.terms[i]!.startsWith(prefix) || indices.length >= MAX_PREFIX_EXPANSIONS) break;
+      indices.push(i);
+    }
+    return indices;
+  }
+
+  private lowerBound(term: string): number {
+    let low = 0;
+    let high = this.terms.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (this.terms[middle]! < term) low = middle + 1;
+      else high = middle;
+    }
+    return low;
+  }
+
+  private unionOf(field: string, values: readonly string[]): Bitset {
+    const union = createBitset(this.count);
+    for (const value of values) orInto(union, this.facetSet(field, value));
+    return union;
+  }
+
+  private facetSet(field: string, value: string): Bitset {
+    const key = `${field}\u0000${value}`;
+    const cached = this.facetCache.get(key);
+    if (cached) return cached;
+
+    const encoded = this.encodedFacets[field]?.[value];
+    let bits = createBitset(this.count);
+    if (encoded?.startsWith("b:")) {
+      const bytes = fromBase64(encoded.slice(2));
+      bits = new Uint32Array(bytes.buffer, bytes.byteOffset, bytes.byteLength / 4);
+    } else if (encoded?.startsWith("l:")) {
+      const bytes = fromBase64(encoded.slice(2));
+      const reader = new VarintReader(bytes);
+      let doc = 0;
+      while (reader.offset < bytes.length) {
+        doc += reader.read();
+        setBit(bits, doc);
+      }
+    }
+    this.facetCache.set(key, bits);
+    return bits;
+  }
+
+  private toBitset(docs: Iterable<number>): Bitset {
+    const bits = createBitset(this.count);
+    for (const doc of docs) setBit(bits, doc);
+    return bits;
+  }
+}
@@ -0,0 +1,60 @@
+import { SearchIndex } from "./query";
+import type { SearchQuery, SearchResult, SerializedSearchIndex } from "./types";
+
+/**
+ * Search worker: downloads one index and answers queries off the main
+ * thread. Queries sent before the index has loaded wait for it.
+ */
+
+export type SearchWorkerRequest =
+  | { type: "load"; url: string }
+  | { type: "query"; id: number; query: SearchQuery };
+
+export type SearchWorkerResponse =
+  | { type: "ready"; count: number; hash: string; facetValues: Record<string, string[]> }
+  | { type: "result"; id: number; result: SearchResult<unknown> }
+  | { type: "error"; id?: number; message: string };
+
+// Typed locally: the project compiles against the DOM lib, not WebWorker
+const scope = self as unknown as {
+  postMessage(message: SearchWorkerResponse): void;
+  onmessage: ((event: MessageEvent<SearchWorkerRequest>) => void) | null;
+};
+
+let index: Promise<SearchIndex<unknown>> | null = null;
+
+function reply(message: SearchWorkerResponse) {
+  scope.postMessage(message);
+}
+
+scope.onmessage = async (event: MessageEvent<SearchWorkerRequest>) => {
+  const message = event.data;
+
+  if (message.type === "load") {
+    index = fetch(message.url)
+      .then((response) => {
+        if (!response.ok) throw new Error(`Search index request failed with ${response.status}`);
+        return response.json() as Promise<SerializedSearchIndex>;
+      })
+      .then((data) => new SearchIndex<unknown>(data));
+    try {
+      const loaded = await index;
+      reply({
+        type: "ready",
+        count: loaded.count,
+        hash: loaded.hash,
+        facetValues: loaded.facetValues(),
+      });
+    } catch (error) {
+      reply({ type: "error", message: String(error) });
+    }
+    return;
+  }
+
+  try {
+    if (!index) throw new Error("Search index not loaded");
+    reply({ type: "result", id: message.id, result: (await index).search(message.query) });
+  } catch (error) {
+    reply({ type: "error", id: message.id, message: String(error) });
+  }
+};
@@ -0,0 +1,18 @@
+import { getAllNewsArticles, getPlayers } from "@/lib/data";
+import { buildSearchIndex } from "./build";
+import { newsSearchDocument, playerSearchDocument, type SearchIndexName } from "./documents";
+import type { SerializedSearchIndex } from "./types";
+
+/**
+ * Build a site search index from the data layer (server only)
+ */
+export async function buildSiteSearchIndex(
+  name: SearchIndexName
+): Promise<SerializedSearchIndex> {
+  switch (name) {
+    case "news":
+      return buildSearchIndex((await getAllNewsArticles()).map(newsSearchDocument));
+    case "players":
+      return buildSearchIndex((await getPlayers()).map(playerSearchDocument));
+  }
+}
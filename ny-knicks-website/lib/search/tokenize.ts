@@ -0,0 +1,38 @@
+/**
+ * Text normalization shared by the index builder and the query side, so
+ * both always agree on terms
+ */
+
+const STOP_WORDS = new Set([
+  "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "he",
+  "in", "is", "it", "its", "of", "on", "or", "that", "the", "to", "was", "were",
+  "will", "with",
+]);
+
+const MIN_TERM_LENGTH = 2;
+
+export function normalize(text: string): string {
+  return text
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase();
+}
+
+export function tokenize(text: string): string[] {
+  return normalize(text)
+    .split(/[^a-z0-9]+/)
+    .filter((token) => token.length >= MIN_TERM_LENGTH && !STOP_WORDS.has(token));
+}
+
+/**
+ * Query tokens; the last one is a prefix while the user is still typing it
+ * (no trailing space)
+ */
+export function tokenizeQuery(text: string): { terms: string[]; prefix: string | null } {
+  const tokens = normalize(text).split(/[^a-z0-9]+/).filter(Boolean);
+  const typing = /[a-z0-9]$/i.test(text) ? tokens.pop() ?? null : null;
+  const terms = tokens.filter(
+    (token) => token.length >= MIN_TERM_LENGTH && !STOP_WORDS.has(token)
+  );
+  return { terms, prefix: typing };
+}
@@ -0,0 +1,59 @@
+/**
+ * Search index wire format and query contract
+ */
+
+/** Text fields, in descending weight order */
+export const SEARCH_FIELD_WEIGHTS = {
+  title: 8,
+  excerpt: 3,
+  content: 1,
+} as const;
+
+export type SearchField = keyof typeof SEARCH_FIELD_WEIGHTS;
+
+export type FacetValue = string | readonly string[] | undefined;
+
+export interface SearchDocument<TStored> {
+  text: Partial<Record<SearchField, string>>;
+  facets: Record<string, FacetValue>;
+  /** Returned as the hit; keep it to what a result row renders */
+  stored: TStored;
+}
+
+export const SEARCH_INDEX_VERSION = 1;
+
+export interface SerializedSearchIndex {
+  version: typeof SEARCH_INDEX_VERSION;
+  /** Content hash of the indexed documents */
+  hash: string;
+  count: number;
+  /** Stored fields, column-wise: field -> value per document */
+  stored: Record<string, unknown[]>;
+  /** Sorted vocabulary */
+  terms: string[];
+  /** Base64 varints: byte length of each term's postings */
+  offsets: string;
+  /** Base64 varints: per term, (document gap, weight) pairs */
+  postings: string;
+  /**
+   * Facet field -> value -> document set, base64. `b:` is a raw bitset,
+   * `l:` a varint gap list, whichever is smaller.
+   */
+  facets: Record<string, Record<string, string>>;
+}
+
+export interface SearchQuery {
+  text?: string;
+  /** Facet field -> accepted values (OR within a field, AND across fields) */
+  filters?: Record<string, readonly string[]>;
+  offset?: number;
+  limit?: number;
+}
+
+export interface SearchResult<TStored> {
+  total: number;
+  hits: TStored[];
+  /** Facet field -> value -> matching documents, given the other filters */
+  facets: Record<string, Record<string, number>>;
+  tookMs: number;
+}
@@ -0,0 +1,4 @@
+/**
+ * Zustand stores barrel export
+ */
+export * from "./liveScores";
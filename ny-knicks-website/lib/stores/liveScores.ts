@@ -0,0 +1,63 @@
+import { create } from "zustand";
+import type { LiveGameState } from "@/types";
+import {
+  applyGameDelta,
+  type ScoreBatch,
+  type ScoreSnapshot,
+} from "@/lib/live/delta";
+
+/**
+ * Client-side live score state, fed by the score stream.
+ *
+ * Batches only replace the game objects they touch, so components that
+ * select a single game (or a single field of it) re-render only when that
+ * game changes.
+ */
+export interface LiveScoresState {
+  games: Record<string, LiveGameState>;
+  /** Game ids in ticker order */
+  order: string[];
+  epoch: string | null;
+  seq: number;
+  connected: boolean;
+  applySnapshot: (snapshot: ScoreSnapshot) => void;
+  applyBatch: (batch: ScoreBatch) => void;
+  setConnected: (connected: boolean) => void;
+}
+
+export const useLiveScores = create<LiveScoresState>()((set) => ({
+  games: {},
+  order: [],
+  epoch: null,
+  seq: 0,
+  connected: false,
+
+  applySnapshot: (snapshot) =>
+    set({
+      games: Object.fromEntries(
+        snapshot.games.map((game) => [game.gameId, game])
+      ),
+      order: snapshot.games.map((game) => game.gameId),
+      epoch: snapshot.epoch,
+      seq: snapshot.seq,
+    }),
+
+  applyBatch: (batch) =>
+    set((state) => {
+      if (batch.seq <= state.seq) return state;
+
+      const games = { ...state.games };
+      let order = state.order;
+
+      for (const delta of batch.deltas) {
+        const next = applyGameDelta(games[delta.id], delta);
+        if (!next) continue;
+        if (!games[delta.id]) order = [...order, delta.id];
+        games[delta.id] = next;
+      }
+
+      return { games, order, seq: batch.seq };
+    }),
+
+  setConnected: (connected) => set({ connected }),
+}));
@@ -2,3 +2,4 @@
  * Utils barrel export
  */
 export * from "./cn";
+export * from "./random";
@@ -0,0 +1,23 @@
+/**
+ * Hero video renditions, produced by `npm run encode:hero`
+ */
+
+export interface VideoRendition {
+  width: number;
+  height: number;
+  /** Target video bitrate */
+  bitrateKbps: number;
+  src: string;
+  type: string;
+}
+
+export const HERO_VIDEO_DIR = "/video/hero";
+
+export const HERO_POSTER = `${HERO_VIDEO_DIR}/poster.jpg`;
+
+export const HERO_RENDITIONS: readonly VideoRendition[] = [
+  { width: 640, height: 360, bitrateKbps: 500, src: `${HERO_VIDEO_DIR}/hero-360.mp4`, type: "video/mp4" },
+  { width: 854, height: 480, bitrateKbps: 900, src: `${HERO_VIDEO_DIR}/hero-480.mp4`, type: "video/mp4" },
+  { width: 1280, height: 720, bitrateKbps: 2000, src: `${HERO_VIDEO_DIR}/hero-720.mp4`, type: "video/mp4" },
+  { width: 1920, height: 1080, bitrateKbps: 4000, src: `${HERO_VIDEO_DIR}/hero-1080.mp4`, type: "video/mp4" },
+];
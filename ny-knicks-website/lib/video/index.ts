@@ -0,0 +1,5 @@
+/**
+ * Video barrel export
+ */
+export * from "./config";
+export * from "./selectRendition";
@@ -0,0 +1,80 @@
+import type { VideoRendition } from "./config";
+
+/**
+ * Rendition selection for background video, based on the Network
+ * Information API, viewport size and user preferences
+ */
+
+export interface PlaybackEnvironment {
+  reducedMotion: boolean;
+  saveData: boolean;
+  /** `navigator.connection.effectiveType`, when supported */
+  effectiveType?: string;
+  /** `navigator.connection.downlink` in Mbps, when supported */
+  downlinkMbps?: number;
+  viewportWidth: number;
+  viewportHeight: number;
+  devicePixelRatio: number;
+}
+
+interface NetworkInformationLike {
+  saveData?: boolean;
+  effectiveType?: string;
+  downlink?: number;
+}
+
+/** Share of the measured downlink the video may use */
+const BANDWIDTH_HEADROOM = 0.6;
+
+/** Pixel density beyond which a background video gains nothing visible */
+const MAX_DEVICE_PIXEL_RATIO = 2;
+
+export function readPlaybackEnvironment(): PlaybackEnvironment {
+  const connection = (navigator as Navigator & { connection?: NetworkInformationLike })
+    .connection;
+
+  return {
+    reducedMotion: window.matchMedia("(prefers-reduced-motion: reduce)").matches,
+    saveData: connection?.saveData ?? false,
+    effectiveType: connection?.effectiveType,
+    downlinkMbps: connection?.downlink,
+    viewportWidth: window.innerWidth,
+    viewportHeight: window.innerHeight,
+    devicePixelRatio: window.devicePixelRatio || 1,
+  };
+}
+
+/**
+ * Pick the rendition to play, or `null` to stay on the poster.
+ *
+ * Starts from the smallest rendition that covers the viewport (the video is
+ * `object-fit: cover`) and steps down until it fits the bandwidth budget.
+ */
+export function selectRendition(
+  renditions: readonly VideoRendition[],
+  env: PlaybackEnvironment
+): VideoRendition | null {
+  if (renditions.length === 0 || env.reducedMotion || env.saveData) return null;
+  if (env.effectiveType === "slow-2g" || env.effectiveType === "2g") return null;
+
+  const sorted = [...renditions].sort((a, b) => a.height - b.height);
+  const lowest = sorted[0]!;
+
+  if (env.effectiveType === "3g") return lowest;
+
+  const dpr = Math.min(env.devicePixelRatio, MAX_DEVICE_PIXEL_RATIO);
+  // Height needed to cover the viewport with 16:9 content
+  const coverHeight =
+    Math.max(env.viewportHeight, (env.viewportWidth * 9) / 16) * dpr;
+
+  let index = sorted.findIndex((rendition) => rendition.height >= coverHeight);
+  if (index === -1) index = sorted.length - 1;
+
+  if (env.downlinkMbps !== undefined && env.downlinkMbps > 0) {
+    const budgetKbps = env.downlinkMbps * 1000 * BANDWIDTH_HEADROOM;
+    while (index > 0 && sorted[index]!.bitrateKbps > budgetKbps) index--;
+    if (lowest.bitrateKbps > budgetKbps) return null;
+  }
+
+  return sorted[index] ?? lowest;
+}
@@ -1,7 +1,30 @@
 import type { NextConfig } from "next";
 
 const nextConfig: NextConfig = {
-  /* config options here */
+  images: {
+    // Match the formats produced by `npm run build:images` for any
+    // remaining next/image usage
+    formats: ["image/avif", "image/webp"],
+  },
+  async headers() {
+    return [
+      {
+        // Variants are content-hashed, so they never change in place
+        source: "/_img/:path*",
+        headers: [
+          { key: "Cache-Control", value: "public, max-age=31536000, immutable" },
+        ],
+      },
+      {
+        // Browsers must always see the current worker so a deploy can
+        // replace the cached build
+        source: "/sw.js",
+        headers: [
+          { key: "Cache-Control", value: "no-cache, no-store, must-revalidate" },
+        ],
+      },
+    ];
+  },
 };
 
 export default nextConfig;
@@ -0,0 +1,92 @@
+/**
+ * Data layer benchmark: simulates a game-night burst of concurrent home page
+ * renders against the in-memory source (with artificial latency) and
+ * compares direct queries with the cached, coalescing data layer.
+ *
+ *   npm run bench:data -- --renders 2000 --latency 25
+ */
+import { performance } from "node:perf_hooks";
+import { parseArgs } from "node:util";
+import {
+  FIXTURE_SEED,
+  createMemoryDataSource,
+  getDataCache,
+  getNewsArticles,
+  getPlayers,
+  getUpcomingGames,
+  revalidateData,
+  setDataSource,
+  toGame,
+  toNewsArticle,
+  toPlayer,
+  type GameRow,
+  type MemoryDataSource,
+  type NewsRow,
+  type PlayerRow,
+} from "@/lib/data";
+
+const { values } = parseArgs({
+  options: {
+    renders: { type: "string", default: "1000" },
+    latency: { type: "string", default: "20" },
+  },
+});
+
+const RENDERS = Number(values.renders);
+const LATENCY_MS = Number(values.latency);
+
+function totalQueries(source: MemoryDataSource) {
+  const { players, games, news } = source.queryCounts;
+  return players + games + news;
+}
+
+async function renderHomeDirect(source: MemoryDataSource) {
+  const [players, games, news] = await Promise.all([
+    source.select<PlayerRow>("players", { order: { column: "jersey_number" } }),
+    source.select<GameRow>("games", { order: { column: "date" } }),
+    source.select<NewsRow>("news", {
+      order: { column: "published_date", ascending: false },
+      range: { from: 0, to: 11 },
+    }),
+  ]);
+  return [players.map(toPlayer), games.map(toGame), news.map(toNewsArticle)];
+}
+
+function renderHomeCached() {
+  return Promise.all([getPlayers(), getUpcomingGames(), getNewsArticles()]);
+}
+
+async function run(label: string, render: () => Promise<unknown>, source: MemoryDataSource) {
+  const queriesBefore = totalQueries(source);
+  const start = performance.now();
+  await Promise.all(Array.from({ length: RENDERS }, render));
+  const elapsed = performance.now() - start;
+  const queries = totalQueries(source) - queriesBefore;
+
+  console.log(
+    `${label.padEnd(32)} ${elapsed.toFixed(1).padStart(9)} ms  ` +
+      `${String(queries).padStart(6)} queries`
+  );
+}
+
+async function main() {
+  console.log(`${RENDERS} concurrent home renders, ${LATENCY_MS} ms per query\n`);
+
+  const direct = createMemoryDataSource(FIXTURE_SEED, { latencyMs: LATENCY_MS });
+  await run("direct queries", () => renderHomeDirect(direct), direct);
+
+  const cached = createMemoryDataSource(FIXTURE_SEED, { latencyMs: LATENCY_MS });
+  setDataSource(cached);
+  await run("cached (cold, coalesced)", renderHomeCached, cached);
+  await run("cached (warm)", renderHomeCached, cached);
+
+  revalidateData("news");
+  await run("cached (after news revalidate)", renderHomeCached, cached);
+
+  console.log("\ncache stats:", getDataCache().stats());
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,140 @@
+/**
+ * Gallery benchmark: loads 10k synthetic items into the virtualized
+ * `MediaGallery` and into a naive grid that mounts every tile, then compares
+ * time to interactive, scroll frame rate, JS heap, DOM size and mounted tiles.
+ *
+ *   ENABLE_BENCH_ROUTES=1 npm run build && ENABLE_BENCH_ROUTES=1 npm start
+ *   npm run bench:gallery -- --count 10000 --profile desktop
+ */
+import { parseArgs } from "node:util";
+import { Browser, sleep, type Page } from "./lib/cdp";
+import { applyThrottling, getThrottlingProfile } from "./lib/throttling";
+import { installVitalsObserver, median, readVitals } from "./lib/vitals";
+
+const { values } = parseArgs({
+  options: {
+    base: { type: "string", default: "http://localhost:3000" },
+    profile: { type: "string", default: "desktop" },
+    count: { type: "string", default: "10000" },
+    runs: { type: "string", default: "3" },
+    scroll: { type: "string", default: "5" },
+    quiet: { type: "string", default: "5" },
+  },
+});
+
+const MODES = [
+  { label: "virtualized", mode: "virtual" },
+  { label: "naive (all tiles)", mode: "naive" },
+];
+
+interface ScrollResult {
+  fps: number;
+  /** Frames longer than 1.5x the display refresh interval */
+  droppedFrames: number;
+  p95FrameMs: number;
+}
+
+interface RunResult extends ScrollResult {
+  tti: number;
+  heapMb: number;
+  domNodes: number;
+  tiles: number;
+}
+
+/** Scroll at a steady speed for a while, recording every frame's duration */
+function measureScroll(page: Page, seconds: number): Promise<ScrollResult> {
+  return page.evaluate<ScrollResult>(`new Promise((resolve) => {
+    const frames = [];
+    const duration = ${seconds * 1000};
+    let start = null;
+    let previous = null;
+    const step = (now) => {
+      if (start === null) start = now;
+      if (previous !== null) frames.push(now - previous);
+      previous = now;
+      window.scrollBy(0, 40);
+      if (now - start < duration) requestAnimationFrame(step);
+      else {
+        const sorted = [...frames].sort((a, b) => a - b);
+        const interval = sorted[Math.floor(sorted.length / 2)] || 16.7;
+        resolve({
+          fps: frames.length / ((now - start) / 1000),
+          droppedFrames: frames.filter((frame) => frame > interval * 1.5).length,
+          p95FrameMs: sorted[Math.floor(sorted.length * 0.95)] || 0,
+        });
+      }
+    };
+    requestAnimationFrame(step);
+  })`);
+}
+
+async function readMemory(page: Page): Promise<{ heapMb: number; domNodes: number }> {
+  await page.send("HeapProfiler.collectGarbage");
+  await page.send("Performance.enable");
+  const { metrics } = await page.send<{ metrics: { name: string; value: number }[] }>(
+    "Performance.getMetrics"
+  );
+  const metric = (name: string) => metrics.find((entry) => entry.name === name)?.value ?? 0;
+  return { heapMb: metric("JSHeapUsedSize") / 1024 / 1024, domNodes: metric("Nodes") };
+}
+
+async function measure(browser: Browser, url: string): Promise<RunResult> {
+  const page = await browser.newPage();
+  try {
+    await applyThrottling(page, getThrottlingProfile(values.profile));
+    await installVitalsObserver(page);
+
+    await page.goto(url);
+    // TTI needs a quiet window with no long tasks after the last one
+    await sleep(Number(values.quiet) * 1000);
+    const { tti } = await readVitals(page);
+
+    const scroll = await measureScroll(page, Number(values.scroll));
+    await sleep(500);
+    const memory = await readMemory(page);
+    const tiles = await page.evaluate<number>(
+      `document.querySelectorAll("[data-gallery-tile]:not([hidden])").length`
+    );
+
+    return { tti: tti ?? Number.NaN, ...scroll, ...memory, tiles };
+  } finally {
+    await page.close();
+  }
+}
+
+async function main() {
+  const runs = Number(values.runs);
+  const browser = await Browser.launch();
+  console.log(
+    `${values.count} items, profile ${values.profile}, ${runs} runs per mode, median values\n`
+  );
+  console.log(
+    `${"mode".padEnd(20)} ${"TTI".padStart(8)} ${"FPS".padStart(6)} ${"dropped".padStart(8)} ` +
+      `${"p95 frame".padStart(10)} ${"heap".padStart(9)} ${"DOM nodes".padStart(10)} ${"tiles".padStart(7)}`
+  );
+
+  try {
+    for (const { label, mode } of MODES) {
+      const url = new URL(`/bench/gallery?count=${values.count}&mode=${mode}`, values.base).href;
+      const results: RunResult[] = [];
+      for (let i = 0; i < runs; i++) {
+        results.push(await measure(browser, url));
+      }
+      const pick = (key: keyof RunResult) => median(results.map((result) => result[key]));
+      console.log(
+        `${label.padEnd(20)} ${`${pick("tti").toFixed(0)}ms`.padStart(8)} ` +
+          `${pick("fps").toFixed(1).padStart(6)} ${pick("droppedFrames").toFixed(0).padStart(8)} ` +
+          `${`${pick("p95FrameMs").toFixed(1)}ms`.padStart(10)} ` +
+          `${`${pick("heapMb").toFixed(1)} MB`.padStart(9)} ${pick("domNodes").toFixed(0).padStart(10)} ` +
+          `${pick("tiles").toFixed(0).padStart(7)}`
+      );
+    }
+  } finally {
+    await browser.close();
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
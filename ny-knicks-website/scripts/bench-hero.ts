@@ -0,0 +1,85 @@
+/**
+ * Hero video benchmark: loads the poster-first `HeroVideo` and a naive
+ * `<video autoplay>` hero in headless Chrome under throttling, and compares
+ * FCP, LCP and bytes transferred.
+ *
+ *   ENABLE_BENCH_ROUTES=1 npm run build && ENABLE_BENCH_ROUTES=1 npm start
+ *   npm run bench:hero -- --profile mobile --runs 5
+ */
+import { parseArgs } from "node:util";
+import { Browser, sleep } from "./lib/cdp";
+import { applyThrottling, getThrottlingProfile } from "./lib/throttling";
+import { installVitalsObserver, median, readVitals, trackTransferSize } from "./lib/vitals";
+
+const { values } = parseArgs({
+  options: {
+    base: { type: "string", default: "http://localhost:3000" },
+    profile: { type: "string", default: "mobile" },
+    runs: { type: "string", default: "3" },
+    settle: { type: "string", default: "8" },
+  },
+});
+
+const VARIANTS = [
+  { label: "HeroVideo (poster-first)", path: "/bench/hero" },
+  { label: "naive <video autoplay>", path: "/bench/hero-naive" },
+];
+
+interface RunResult {
+  fcp: number;
+  lcp: number;
+  kilobytes: number;
+}
+
+async function measure(browser: Browser, url: string): Promise<RunResult> {
+  const page = await browser.newPage();
+  try {
+    await applyThrottling(page, getThrottlingProfile(values.profile));
+    await installVitalsObserver(page);
+    const transfer = trackTransferSize(page);
+
+    await page.goto(url);
+    // Keep measuring after load: that is when deferred video starts streaming
+    await sleep(Number(values.settle) * 1000);
+
+    const vitals = await readVitals(page);
+    transfer.stop();
+    return {
+      fcp: vitals.fcp ?? Number.NaN,
+      lcp: vitals.lcp ?? Number.NaN,
+      kilobytes: transfer.total() / 1024,
+    };
+  } finally {
+    await page.close();
+  }
+}
+
+async function main() {
+  const runs = Number(values.runs);
+  const browser = await Browser.launch();
+  console.log(`profile ${values.profile}, ${runs} runs per variant, median values\n`);
+  console.log(`${"variant".padEnd(28)} ${"FCP".padStart(9)} ${"LCP".padStart(9)} ${"transferred".padStart(13)}`);
+
+  try {
+    for (const variant of VARIANTS) {
+      const results: RunResult[] = [];
+      for (let i = 0; i < runs; i++) {
+        results.push(await measure(browser, new URL(variant.path, values.base).href));
+      }
+      const fcp = median(results.map((result) => result.fcp));
+      const lcp = median(results.map((result) => result.lcp));
+      const kilobytes = median(results.map((result) => result.kilobytes));
+      console.log(
+        `${variant.label.padEnd(28)} ${`${fcp.toFixed(0)}ms`.padStart(9)} ` +
+          `${`${lcp.toFixed(0)}ms`.padStart(9)} ${`${kilobytes.toFixed(0)} KiB`.padStart(13)}`
+      );
+    }
+  } finally {
+    await browser.close();
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
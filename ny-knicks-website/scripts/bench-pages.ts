@@ -0,0 +1,188 @@
+/**
+ * Budget check for every page: loads each route of the last build in
+ * headless Chrome under throttled CPU and network profiles, takes the median
+ * lab vitals over several cold loads and compares them, along with each
+ * route's gzipped client JS, against `lib/perf/budgets.ts`.
+ *
+ *   npm run build && npm start
+ *   npm run bench:pages -- --profile mobile,slow --runs 3
+ *
+ * Exits with status 1 when any route is over budget, never reported FCP or
+ * LCP, or could not be loaded at all (a dynamic route with no prerendered
+ * instance, e.g. on an empty database; `--allow-skip` tolerates those). Results are also
+ * written to `.next/perf-report.json`.
+ */
+import { writeFile } from "node:fs/promises";
+import path from "node:path";
+import { parseArgs } from "node:util";
+import {
+  checkVitalsBudget,
+  JS_BUDGET_BYTES,
+  VITALS_BUDGETS,
+  type BudgetViolation,
+} from "@/lib/perf/budgets";
+import { Browser, sleep } from "./lib/cdp";
+import { NextBuild } from "./lib/next-build";
+import { applyThrottling, getThrottlingProfile, type ThrottlingProfile } from "./lib/throttling";
+import { installVitalsObserver, median, readVitals, type LabVitals } from "./lib/vitals";
+
+const { values } = parseArgs({
+  options: {
+    base: { type: "string", default: "http://localhost:3000" },
+    dir: { type: "string", default: ".next" },
+    profile: { type: "string", default: "mobile" },
+    runs: { type: "string", default: "3" },
+    /** Seconds to wait after load so late long tasks count towards TBT */
+    settle: { type: "string", default: "3" },
+    route: { type: "string", multiple: true },
+    "allow-skip": { type: "boolean", default: false },
+  },
+});
+
+const build = new NextBuild(values.dir);
+
+type BudgetedVitals = Pick<LabVitals, "fcp" | "lcp" | "cls" | "tbt">;
+
+interface PageTarget {
+  route: string;
+  /** Concrete path loaded for the route (first prerendered instance for dynamic routes) */
+  pathname: string;
+  jsBytes: number | null;
+}
+
+interface PageResult extends PageTarget {
+  profile: string;
+  vitals: BudgetedVitals;
+  violations: BudgetViolation[];
+}
+
+async function listPages(): Promise<{ targets: PageTarget[]; skipped: string[] }> {
+  const appRoutes = await build.appRoutes();
+  const prerender = await build.prerenderManifest();
+  const targets: PageTarget[] = [];
+  const skipped: string[] = [];
+
+  for (const [entry, route] of Object.entries(appRoutes).sort(([, a], [, b]) => a.localeCompare(b))) {
+    if (!entry.endsWith("/page") || route.startsWith("/_") || route.startsWith("/bench")) continue;
+    if (values.route && !values.route.includes(route)) continue;
+
+    const pathname = route.includes("[")
+      ? Object.keys(prerender.routes).find((key) => prerender.routes[key]?.srcRoute === route)
+      : route;
+    if (!pathname) {
+      console.warn(`Skipping ${route}: no prerendered instance to load`);
+      skipped.push(route);
+      continue;
+    }
+    targets.push({ route, pathname, jsBytes: await build.clientJsBytes(entry) });
+  }
+  return { targets, skipped };
+}
+
+async function measure(browser: Browser, url: string, profile: ThrottlingProfile): Promise<LabVitals> {
+  const page = await browser.newPage();
+  try {
+    await applyThrottling(page, profile);
+    await installVitalsObserver(page);
+    await page.goto(url);
+    await sleep(Number(values.settle) * 1000);
+    return await readVitals(page);
+  } finally {
+    await page.close();
+  }
+}
+
+function medianOf(runs: LabVitals[], key: keyof BudgetedVitals): number | null {
+  const measured = runs.map((run) => run[key]).filter((value): value is number => value !== null);
+  return measured.length > 0 ? median(measured) : null;
+}
+
+function formatMs(value: number | null): string {
+  return value === null ? "-" : `${value.toFixed(0)}ms`;
+}
+
+async function main() {
+  if (!build.exists()) {
+    throw new Error(`No build output in ${build.dir}; run \`next build\` first`);
+  }
+
+  const profiles = values.profile.split(",").map((name) => getThrottlingProfile(name.trim()));
+  const runs = Number(values.runs);
+  const { targets: pages, skipped } = await listPages();
+  const results: PageResult[] = [];
+
+  console.log(
+    `${pages.length} pages, ${runs} cold loads each, median values. Budgets: ` +
+      `FCP ${VITALS_BUDGETS.fcp}ms, LCP ${VITALS_BUDGETS.lcp}ms, TBT ${VITALS_BUDGETS.tbt}ms, ` +
+      `CLS ${VITALS_BUDGETS.cls}, JS ${(JS_BUDGET_BYTES / 1024).toFixed(0)} kB\n`
+  );
+
+  const browser = await Browser.launch();
+  try {
+    for (const profile of profiles) {
+      console.log(`profile ${profile.name}`);
+      console.log(
+        `${"route".padEnd(24)} ${"FCP".padStart(8)} ${"LCP".padStart(8)} ${"TBT".padStart(8)} ` +
+          `${"CLS".padStart(6)} ${"client js".padStart(10)}`
+      );
+
+      for (const target of pages) {
+        const url = new URL(target.pathname, values.base).href;
+        const samples: LabVitals[] = [];
+        for (let i = 0; i < runs; i++) samples.push(await measure(browser, url, profile));
+
+        const vitals: BudgetedVitals = {
+          fcp: medianOf(samples, "fcp"),
+          lcp: medianOf(samples, "lcp"),
+          tbt: medianOf(samples, "tbt") ?? 0,
+          cls: medianOf(samples, "cls") ?? 0,
+        };
+        const violations = checkVitalsBudget(vitals);
+        // A page that never painted (or a broken observer) must not pass
+        for (const metric of ["fcp", "lcp"] as const) {
+          if (vitals[metric] === null) {
+            violations.push({ metric, value: Number.NaN, budget: VITALS_BUDGETS[metric] });
+          }
+        }
+        if (target.jsBytes !== null && target.jsBytes > JS_BUDGET_BYTES) {
+          violations.push({ metric: "js", value: target.jsBytes, budget: JS_BUDGET_BYTES });
+        }
+        results.push({ ...target, profile: profile.name, vitals, violations });
+
+        const js = target.jsBytes === null ? "-" : `${(target.jsBytes / 1024).toFixed(1)} kB`;
+        console.log(
+          `${target.route.padEnd(24)} ${formatMs(vitals.fcp).padStart(8)} ${formatMs(vitals.lcp).padStart(8)} ` +
+            `${formatMs(vitals.tbt).padStart(8)} ${vitals.cls.toFixed(3).padStart(6)} ${js.padStart(10)}` +
+            (violations.length > 0
+              ? `  over: ${violations.map((v) => (Number.isNaN(v.value) ? `${v.metric} (missing)` : v.metric)).join(", ")}`
+              : "")
+        );
+      }
+      console.log("");
+    }
+  } finally {
+    await browser.close();
+  }
+
+  await writeFile(path.join(build.dir, "perf-report.json"), `${JSON.stringify(results, null, 2)}\n`);
+
+  const failed = results.filter((result) => result.violations.length > 0);
+  if (failed.length > 0) {
+    console.error(
+      `${failed.length} route/profile run(s) over budget: ` +
+        failed.map((result) => `${result.route} (${result.profile})`).join(", ")
+    );
+    process.exitCode = 1;
+  }
+  if (skipped.length > 0 && !values["allow-skip"]) {
+    console.error(
+      `${skipped.length} route(s) not measured: ${skipped.join(", ")} (pass --allow-skip to tolerate)`
+    );
+    process.exitCode = 1;
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,177 @@
+/**
+ * Search index benchmark: builds the news index over a synthetic corpus
+ * (50k articles by default) and reports index size (raw, gzip, brotli),
+ * build and load time, and query latency for typing and facet toggles,
+ * next to a naive array scan over the same articles.
+ *
+ *   npm run bench:search -- --articles 50000 --queries 2000
+ */
+import { parseArgs } from "node:util";
+import { brotliCompressSync, gzipSync } from "node:zlib";
+import { toNewsArticle, type NewsRow } from "@/lib/data/rows";
+import { buildSearchIndex } from "@/lib/search/build";
+import { monthBucket, newsSearchDocument, type NewsSearchHit } from "@/lib/search/documents";
+import { SearchIndex } from "@/lib/search/query";
+import { tokenize } from "@/lib/search/tokenize";
+import type { SearchQuery, SerializedSearchIndex } from "@/lib/search/types";
+import { mulberry32 } from "@/lib/utils/random";
+import type { NewsArticle } from "@/types";
+
+const { values } = parseArgs({
+  options: {
+    articles: { type: "string", default: "50000" },
+    queries: { type: "string", default: "2000" },
+    seed: { type: "string", default: "7" },
+  },
+});
+
+const BASKETBALL_WORDS = [
+  "knicks", "garden", "brunson", "towns", "anunoby", "bridges", "hart", "robinson",
+  "playoffs", "rebound", "assist", "defense", "offense", "clutch", "buzzer", "trade",
+  "rookie", "draft", "injury", "rotation", "bench", "starter", "coach", "practice",
+  "overtime", "threes", "paint", "transition", "season", "conference", "eastern", "celtics",
+];
+const TAGS = Array.from({ length: 40 }, (_, i) => `tag-${i}`);
+const AUTHORS = Array.from({ length: 25 }, (_, i) => `Writer ${i + 1}`);
+
+const random = mulberry32(Number(values.seed));
+
+/** ~5k-word vocabulary with a Zipf-like frequency skew, like real prose */
+const SYLLABLES = ["ka", "ro", "mi", "tel", "son", "ar", "den", "vi", "lo", "que", "stra", "ben"];
+const VOCABULARY = [
+  ...BASKETBALL_WORDS,
+  ...Array.from({ length: 5000 }, () => {
+    const length = 2 + Math.floor(random() * 3);
+    return Array.from({ length }, () => SYLLABLES[Math.floor(random() * SYLLABLES.length)]).join("");
+  }),
+];
+
+function word(): string {
+  return VOCABULARY[Math.floor(VOCABULARY.length * random() ** 3)]!;
+}
+
+function sentence(words: number): string {
+  return Array.from({ length: words }, word).join(" ");
+}
+
+function pick<T>(items: readonly T[]): T {
+  return items[Math.floor(random() * items.length)]!;
+}
+
+function syntheticCorpus(count: number): NewsArticle[] {
+  const newest = Date.UTC(2026, 9, 15);
+  const span = 5 * 365 * 24 * 3600 * 1000;
+
+  return Array.from({ length: count }, (_, i): NewsRow => ({
+    id: `article-${i}`,
+    slug: `article-${i}`,
+    title: sentence(5 + Math.floor(random() * 6)),
+    excerpt: sentence(20 + Math.floor(random() * 15)),
+    content: sentence(150 + Math.floor(random() * 250)),
+    author: pick(AUTHORS),
+    // Newest first, like the site's listing order
+    published_date: new Date(newest - (span * i) / count).toISOString(),
+    featured_image: null,
+    tags: Array.from(new Set(Array.from({ length: 1 + Math.floor(random() * 3) }, () => pick(TAGS)))),
+  })).map(toNewsArticle);
+}
+
+/** A user typing a query: every keystroke is a query */
+function typingQueries(phrase: string): string[] {
+  return Array.from({ length: phrase.length }, (_, i) => phrase.slice(0, i + 1));
+}
+
+function randomQuery(months: readonly string[]): SearchQuery {
+  const kind = random();
+  const filters: Record<string, string[]> = {};
+  if (kind > 0.4) filters.tag = [pick(TAGS)];
+  if (kind > 0.7) filters.author = [pick(AUTHORS), pick(AUTHORS)];
+  if (kind > 0.85) filters.month = [pick(months)];
+  const text = kind < 0.8 ? sentence(1 + Math.floor(random() * 2)) : "";
+  return { text, filters, limit: 20 };
+}
+
+/** What a client would do without an index */
+function naiveSearch(articles: readonly NewsArticle[], query: SearchQuery): number {
+  const terms = tokenize(query.text ?? "");
+  const { tag = [], author = [], month = [] } = query.filters ?? {};
+  return articles.filter((article) => {
+    const text = `${article.title} ${article.excerpt} ${article.content ?? ""}`.toLowerCase();
+    if (!terms.every((term) => text.includes(term))) return false;
+    if (tag.length && !article.tags?.some((value) => tag.includes(value))) return false;
+    if (author.length && !author.includes(article.author ?? "")) return false;
+    if (month.length && !month.includes(monthBucket(article.publishedAt))) return false;
+    return true;
+  }).length;
+}
+
+function percentiles(samples: number[]) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const at = (p: number) => sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] ?? 0;
+  return `p50 ${at(0.5).toFixed(2)}ms  p95 ${at(0.95).toFixed(2)}ms  max ${at(1).toFixed(2)}ms`;
+}
+
+function timeQueries(run: (query: SearchQuery) => void, queries: readonly SearchQuery[]): number[] {
+  return queries.map((query) => {
+    const start = performance.now();
+    run(query);
+    return performance.now() - start;
+  });
+}
+
+function kib(bytes: number): string {
+  return `${(bytes / 1024).toFixed(0)} KiB`.padStart(11);
+}
+
+function main() {
+  const count = Number(values.articles);
+  console.log(`generating ${count} articles...`);
+  const articles = syntheticCorpus(count);
+
+  let start = performance.now();
+  const serialized = buildSearchIndex(articles.map(newsSearchDocument));
+  const buildMs = performance.now() - start;
+  const json = JSON.stringify(serialized);
+
+  console.log(`\nbuild ${buildMs.toFixed(0)}ms, ${serialized.terms.length} terms\n`);
+  console.log(`${"part".padEnd(12)} ${"raw".padStart(11)} ${"gzip".padStart(11)} ${"brotli".padStart(11)}`);
+  const parts: [string, unknown][] = [
+    ["terms", serialized.terms],
+    ["postings", [serialized.offsets, serialized.postings]],
+    ["facets", serialized.facets],
+    ["stored", serialized.stored],
+    ["total", serialized],
+  ];
+  for (const [label, part] of parts) {
+    const bytes = Buffer.from(JSON.stringify(part));
+    console.log(
+      `${label.padEnd(12)} ${kib(bytes.length)} ${kib(gzipSync(bytes).length)} ` +
+        `${kib(brotliCompressSync(bytes).length)}`
+    );
+  }
+
+  const heapBefore = process.memoryUsage().heapUsed;
+  start = performance.now();
+  const index = new SearchIndex<NewsSearchHit>(JSON.parse(json) as SerializedSearchIndex);
+  const loadMs = performance.now() - start;
+  console.log(
+    `\nload (parse + decode) ${loadMs.toFixed(0)}ms, ` +
+      `~${((process.memoryUsage().heapUsed - heapBefore) / 1024 / 1024).toFixed(0)} MB heap`
+  );
+
+  const months = index.facetValues().month ?? [];
+  const queries = Array.from({ length: Number(values.queries) }, () => randomQuery(months));
+  const typed = [...typingQueries("knicks clutch defense"), ...typingQueries("brunson threes")].map(
+    (text): SearchQuery => ({ text, limit: 20 })
+  );
+
+  console.log(`\nquery latency (${queries.length} mixed text/facet queries)`);
+  console.log(`  index, cold cache   ${percentiles(timeQueries((query) => index.search(query), queries))}`);
+  console.log(`  index, warm cache   ${percentiles(timeQueries((query) => index.search(query), queries))}`);
+  console.log(`  typing, per key     ${percentiles(timeQueries((query) => index.search(query), typed))}`);
+
+  const naiveSample = queries.slice(0, Math.min(100, queries.length));
+  console.log(`  naive array scan    ${percentiles(timeQueries((query) => naiveSearch(articles, query), naiveSample))}`);
+}
+
+main();
@@ -0,0 +1,246 @@
+/**
+ * Responsive image pipeline. Encodes every raster image under `public/` and
+ * every `Player.image` / `NewsArticle.image` source into AVIF and WebP
+ * variants at fixed breakpoints, plus a blurred placeholder, and writes the
+ * manifest read by `<KnicksImage>`.
+ *
+ * Incremental: sources whose content hash matches the existing manifest
+ * (and whose variants are still on disk) are not re-encoded.
+ *
+ *   npm run build:images            # runs automatically before dev/build
+ *   npm run build:images -- --force # re-encode everything
+ *   npm run build:images -- --manifest-only  # just make sure the manifest exists
+ *
+ * Sources that can't be read (offline, a failing image host or database)
+ * keep their previous manifest entry and variants.
+ */
+import { createHash } from "node:crypto";
+import { existsSync } from "node:fs";
+import { mkdir, readdir, readFile, rm, writeFile } from "node:fs/promises";
+import { availableParallelism } from "node:os";
+import path from "node:path";
+import { parseArgs } from "node:util";
+import type sharpModule from "sharp";
+import { getAllNewsArticles, getPlayers } from "@/lib/data";
+import {
+  IMAGE_BREAKPOINTS,
+  IMAGE_FORMATS,
+  IMAGE_OUTPUT_DIR,
+  type ImageFormat,
+  type ImageManifest,
+  type ImageManifestEntry,
+} from "@/lib/images/config";
+
+type Sharp = typeof sharpModule;
+
+const ROOT = process.cwd();
+const PUBLIC_DIR = path.join(ROOT, "public");
+const OUTPUT_DIR = path.join(PUBLIC_DIR, IMAGE_OUTPUT_DIR);
+const MANIFEST_PATH = path.join(ROOT, "lib/images/manifest.json");
+const RASTER_EXTENSIONS = new Set([".jpg", ".jpeg", ".png", ".webp", ".avif"]);
+const QUALITY: Record<ImageFormat, number> = { avif: 50, webp: 72 };
+const PLACEHOLDER_WIDTH = 16;
+
+const { values } = parseArgs({
+  options: {
+    force: { type: "boolean", default: false },
+    /** Write the existing (or an empty) manifest without reading any source */
+    "manifest-only": { type: "boolean", default: false },
+  },
+});
+
+async function readManifest(): Promise<ImageManifest> {
+  try {
+    return JSON.parse(await readFile(MANIFEST_PATH, "utf8")) as ImageManifest;
+  } catch {
+    return { version: 1, images: {} };
+  }
+}
+
+async function writeManifest(manifest: ImageManifest) {
+  await mkdir(path.dirname(MANIFEST_PATH), { recursive: true });
+  await writeFile(MANIFEST_PATH, `${JSON.stringify(manifest, null, 2)}\n`);
+}
+
+async function listPublicImages(dir = PUBLIC_DIR): Promise<string[]> {
+  const entries = await readdir(dir, { withFileTypes: true });
+  const files = await Promise.all(
+    entries.map(async (entry) => {
+      const fullPath = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        return fullPath === OUTPUT_DIR ? [] : listPublicImages(fullPath);
+      }
+      return RASTER_EXTENSIONS.has(path.extname(entry.name).toLowerCase())
+        ? [`/${path.relative(PUBLIC_DIR, fullPath).split(path.sep).join("/")}`]
+        : [];
+    })
+  );
+  return files.flat();
+}
+
+/** Player and article images, or `null` when the data source is unavailable */
+async function listContentImages(): Promise<string[] | null> {
+  try {
+    const [players, articles] = await Promise.all([
+      getPlayers(),
+      getAllNewsArticles(),
+    ]);
+    return [...players, ...articles]
+      .map((item) => item.image)
+      .filter((image): image is string => Boolean(image));
+  } catch (error) {
+    console.warn(`build:images: cannot list content images: ${(error as Error).message}`);
+    return null;
+  }
+}
+
+async function readSource(src: string): Promise<Buffer> {
+  if (/^https?:\/\//.test(src)) {
+    const response = await fetch(src);
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    return Buffer.from(await response.arrayBuffer());
+  }
+  return readFile(path.join(PUBLIC_DIR, src));
+}
+
+function variantsOnDisk(entry: ImageManifestEntry) {
+  return IMAGE_FORMATS.every((format) =>
+    entry.variants[format].every((variant) =>
+      existsSync(path.join(PUBLIC_DIR, variant.path))
+    )
+  );
+}
+
+async function encode(
+  sharp: Sharp,
+  src: string,
+  input: Buffer,
+  hash: string
+): Promise<ImageManifestEntry> {
+  const { width, height, orientation = 1 } = await sharp(input).metadata();
+  if (!width || !height) throw new Error(`Cannot read dimensions of ${src}`);
+
+  // EXIF orientations 5-8 are rotated by 90 degrees
+  const [displayWidth, displayHeight] =
+    orientation >= 5 ? [height, width] : [width, height];
+
+  // Never upscale: keep the breakpoints below the source width, plus the
+  // source width itself when it is not larger than every breakpoint
+  const largest = IMAGE_BREAKPOINTS[IMAGE_BREAKPOINTS.length - 1] ?? displayWidth;
+  const widths: number[] = IMAGE_BREAKPOINTS.filter((bp) => bp < displayWidth);
+  if (displayWidth <= largest) widths.push(displayWidth);
+
+  const variants = {} as ImageManifestEntry["variants"];
+  for (const format of IMAGE_FORMATS) {
+    variants[format] = await Promise.all(
+      widths.map(async (variantWidth) => {
+        const fileName = `${hash}-${variantWidth}.${format}`;
+        await sharp(input)
+          .rotate()
+          .resize({ width: variantWidth, withoutEnlargement: true })
+          .toFormat(format, { quality: QUALITY[format] })
+          .toFile(path.join(OUTPUT_DIR, fileName));
+        return { width: variantWidth, path: `/${IMAGE_OUTPUT_DIR}/${fileName}` };
+      })
+    );
+  }
+
+  const placeholder = await sharp(input)
+    .rotate()
+    .resize({ width: PLACEHOLDER_WIDTH })
+    .blur()
+    .webp({ quality: 40 })
+    .toBuffer();
+
+  console.log(`  encoded ${src} (${widths.length} widths)`);
+  return {
+    hash,
+    width: displayWidth,
+    height: displayHeight,
+    placeholder: `data:image/webp;base64,${placeholder.toString("base64")}`,
+    variants,
+  };
+}
+
+async function runPool<T>(items: readonly T[], limit: number, task: (item: T) => Promise<void>) {
+  let next = 0;
+  await Promise.all(
+    Array.from({ length: Math.min(limit, items.length) }, async () => {
+      while (next < items.length) {
+        await task(items[next++]!);
+      }
+    })
+  );
+}
+
+async function main() {
+  const previous = await readManifest();
+  if (values["manifest-only"]) {
+    await writeManifest(previous);
+    return;
+  }
+
+  const sharp = await import("sharp").then((mod) => mod.default).catch(() => null);
+  if (!sharp) {
+    // Without variants every KnicksImage would silently fall back to a plain <img>
+    throw new Error("build:images: sharp is not installed; run `npm install` (it is a devDependency)");
+  }
+
+  const publicImages = await listPublicImages();
+  const contentImages = await listContentImages();
+  const sources = Array.from(new Set([...publicImages, ...(contentImages ?? [])]));
+  await mkdir(OUTPUT_DIR, { recursive: true });
+
+  const manifest: ImageManifest = { version: 1, images: {} };
+  let reused = 0;
+
+  // Without a content listing, keep every previously encoded remote source
+  if (!contentImages) {
+    for (const [src, entry] of Object.entries(previous.images)) {
+      if (!publicImages.includes(src)) manifest.images[src] = entry;
+    }
+  }
+
+  await runPool(sources, availableParallelism(), async (src) => {
+    let input: Buffer;
+    try {
+      input = await readSource(src);
+    } catch (error) {
+      const kept = previous.images[src];
+      if (kept) manifest.images[src] = kept;
+      console.warn(`  ${kept ? "kept previous variants of" : "skipped"} ${src}: ${(error as Error).message}`);
+      return;
+    }
+
+    const hash = createHash("sha256").update(input).digest("hex").slice(0, 12);
+    const cached = previous.images[src];
+    if (!values.force && cached?.hash === hash && variantsOnDisk(cached)) {
+      manifest.images[src] = cached;
+      reused++;
+      return;
+    }
+    manifest.images[src] = await encode(sharp, src, input, hash);
+  });
+
+  // Remove variants no longer referenced by any source
+  const live = new Set(
+    Object.values(manifest.images).flatMap((entry) =>
+      IMAGE_FORMATS.flatMap((format) =>
+        entry.variants[format].map((variant) => path.basename(variant.path))
+      )
+    )
+  );
+  const stale = (await readdir(OUTPUT_DIR)).filter((file) => !live.has(file));
+  await Promise.all(stale.map((file) => rm(path.join(OUTPUT_DIR, file))));
+
+  await writeManifest(manifest);
+  console.log(
+    `build:images: ${sources.length} sources, ${reused} unchanged, ` +
+      `${Object.keys(manifest.images).length - reused} encoded, ${stale.length} stale files removed`
+  );
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
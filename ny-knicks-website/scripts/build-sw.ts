@@ -0,0 +1,105 @@
+/**
+ * Generates `public/sw.js` from the build manifest: compiles
+ * `lib/offline/sw.ts` and prepends the precache list (shell pages, their
+ * JS and CSS, fonts) and the content version for this build.
+ *
+ *   npm run build     # runs automatically afterwards
+ *   npm run build:sw
+ */
+import { createHash } from "node:crypto";
+import { existsSync } from "node:fs";
+import { readdir, readFile, writeFile } from "node:fs/promises";
+import path from "node:path";
+import ts from "typescript";
+import {
+  MEDIA_CACHE_MAX_BYTES,
+  MEDIA_CACHE_MAX_ENTRIES,
+  OFFLINE_PATH,
+  SW_BYPASS_PATHS,
+  SW_CACHE_PREFIX,
+  SW_URL,
+  type SwManifest,
+} from "@/lib/offline/config";
+import { NextBuild } from "./lib/next-build";
+
+const ROOT = process.cwd();
+const SOURCE = path.join(ROOT, "lib/offline/sw.ts");
+const OUTPUT = path.join(ROOT, "public", SW_URL.slice(1));
+
+/** App entries whose client JS makes up the shell */
+const SHELL_ENTRIES = ["/(site)/page", "/(site)/offline/page"];
+const SHELL_PAGES = ["/", OFFLINE_PATH];
+const FONT_EXTENSIONS = new Set([".woff2", ".woff"]);
+
+/** Files under `dir`, recursively (paths built from `dir`: no `Dirent.parentPath` before Node 20.12) */
+async function listFiles(dir: string): Promise<string[]> {
+  if (!existsSync(dir)) return [];
+  const entries = await readdir(dir, { withFileTypes: true });
+  const files = await Promise.all(
+    entries.map(async (entry) => {
+      const fullPath = path.join(dir, entry.name);
+      if (entry.isDirectory()) return listFiles(fullPath);
+      return entry.isFile() ? [fullPath] : [];
+    })
+  );
+  return files.flat();
+}
+
+async function main() {
+  const build = new NextBuild();
+  if (!build.exists()) {
+    throw new Error("No build output in .next; run `next build` first");
+  }
+
+  const staticFiles = await listFiles(path.join(build.dir, "static"));
+  const toUrl = (file: string) => `/_next/${path.relative(build.dir, file).split(path.sep).join("/")}`;
+  const shellScripts = new Set<string>();
+  for (const entry of SHELL_ENTRIES) {
+    (await build.clientFiles(entry)).forEach((file) => shellScripts.add(`/_next/${file}`));
+  }
+
+  const precache = [
+    ...SHELL_PAGES,
+    ...shellScripts,
+    ...staticFiles.filter((file) => file.endsWith(".css")).map(toUrl),
+    ...staticFiles.filter((file) => FONT_EXTENSIONS.has(path.extname(file))).map(toUrl),
+  ];
+
+  const buildId = await build.buildId();
+  const version = createHash("sha256")
+    .update(buildId)
+    .update(precache.join("\n"))
+    .digest("hex")
+    .slice(0, 12);
+
+  const manifest: SwManifest = {
+    version,
+    precache,
+    cachePrefix: SW_CACHE_PREFIX,
+    offlinePath: OFFLINE_PATH,
+    media: { maxEntries: MEDIA_CACHE_MAX_ENTRIES, maxBytes: MEDIA_CACHE_MAX_BYTES },
+    bypass: SW_BYPASS_PATHS,
+  };
+
+  const { outputText } = ts.transpileModule(await readFile(SOURCE, "utf8"), {
+    fileName: SOURCE,
+    compilerOptions: {
+      module: ts.ModuleKind.ESNext,
+      target: ts.ScriptTarget.ES2020,
+      removeComments: true,
+    },
+  });
+  // Classic worker script: drop the module marker left by type-only imports
+  const body = outputText.replace(/^export \{\};?\s*$/m, "");
+
+  await writeFile(
+    OUTPUT,
+    `self.__SW_MANIFEST = ${JSON.stringify(manifest)};\n${body}`
+  );
+  console.log(`sw.js: version ${version}, ${precache.length} precached URLs`);
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,149 @@
+/**
+ * Offline check for the service worker, run against a production server:
+ * warms the main routes, then reports cache hit rates on a second visit
+ * (over a throttled connection) and verifies that visited routes still
+ * render offline while unvisited ones get the offline page.
+ *
+ *   npm run build && npm start
+ *   npm run check:offline -- --profile slow --min-hit-rate 0.9
+ *
+ * Exits with status 1 when any check fails.
+ */
+import { parseArgs } from "node:util";
+import type { SwStats, SwStrategy } from "@/lib/offline/config";
+import { SITE_ROUTES } from "@/lib/constants/routes";
+import { Browser, sleep, type Page } from "./lib/cdp";
+import { applyThrottling, getThrottlingProfile } from "./lib/throttling";
+
+const { values } = parseArgs({
+  options: {
+    base: { type: "string", default: "http://localhost:3000" },
+    profile: { type: "string", default: "slow" },
+    "min-hit-rate": { type: "string", default: "0.9" },
+  },
+});
+
+const ROUTES = [SITE_ROUTES.home, SITE_ROUTES.roster, SITE_ROUTES.schedule, SITE_ROUTES.news];
+/** Strategies counted towards the hit rate of a repeat visit */
+const REPEAT_VISIT_STRATEGIES: SwStrategy[] = ["static", "pages"];
+
+const failures: string[] = [];
+
+function check(ok: boolean, message: string) {
+  console.log(`${ok ? "ok  " : "FAIL"} ${message}`);
+  if (!ok) failures.push(message);
+}
+
+/** Same protocol as `lib/offline/client.ts`, inlined into the page */
+function askWorker<T>(page: Page, type: "stats" | "reset-stats"): Promise<T> {
+  return page.evaluate<T>(`new Promise((resolve) => {
+    const channel = new MessageChannel();
+    channel.port1.onmessage = (event) => resolve(event.data);
+    navigator.serviceWorker.controller.postMessage({ type: "${type}" }, [channel.port2]);
+  })`);
+}
+
+function waitForController(page: Page): Promise<boolean> {
+  return page.evaluate<boolean>(`navigator.serviceWorker.ready.then(() =>
+    navigator.serviceWorker.controller
+      ? true
+      : new Promise((resolve) =>
+          navigator.serviceWorker.addEventListener("controllerchange", () => resolve(true), { once: true })
+        )
+  )`);
+}
+
+/**
+ * Take the page and its service worker offline: page-level emulation alone
+ * doesn't cover requests the worker makes itself
+ */
+async function goOffline(browser: Browser, page: Page): Promise<void> {
+  const conditions = { offline: true, latency: 0, downloadThroughput: -1, uploadThroughput: -1 };
+  await page.send("Network.enable");
+  await page.send("Network.emulateNetworkConditions", conditions);
+
+  const { targetInfos } = await browser.send<{ targetInfos: { targetId: string; type: string; url: string }[] }>(
+    "Target.getTargets"
+  );
+  const worker = targetInfos.find(
+    (target) => target.type === "service_worker" && target.url.startsWith(values.base)
+  );
+  if (!worker) throw new Error("No service worker target to take offline");
+
+  const { sessionId } = await browser.send<{ sessionId: string }>("Target.attachToTarget", {
+    targetId: worker.targetId,
+    flatten: true,
+  });
+  await browser.send("Network.enable", {}, sessionId);
+  await browser.send("Network.emulateNetworkConditions", conditions, sessionId);
+}
+
+function isOfflinePage(page: Page): Promise<boolean> {
+  return page.evaluate<boolean>(`document.title.startsWith("Offline")`);
+}
+
+async function main() {
+  const minHitRate = Number(values["min-hit-rate"]);
+  const url = (pathname: string) => new URL(pathname, values.base).href;
+  const browser = await Browser.launch();
+  const page = await browser.newPage();
+
+  try {
+    await page.goto(url(SITE_ROUTES.home));
+    check(await waitForController(page), "service worker controls the page");
+    for (const route of ROUTES) await page.goto(url(route));
+    // Let background revalidation and precaching settle
+    await sleep(1000);
+
+    const { version } = await askWorker<SwStats>(page, "stats");
+    const names = await page.evaluate<string[]>(`caches.keys()`);
+    const stale = names.filter((name) => !name.endsWith(`-${version}`));
+    check(names.length > 0 && stale.length === 0, `all caches are keyed by version ${version}`);
+
+    await askWorker(page, "reset-stats");
+    await applyThrottling(page, getThrottlingProfile(values.profile));
+    for (const route of ROUTES) await page.goto(url(route));
+
+    const { strategies } = await askWorker<SwStats>(page, "stats");
+    for (const strategy of Object.keys(strategies) as SwStrategy[]) {
+      const { hits, misses } = strategies[strategy];
+      console.log(`     ${strategy.padEnd(7)} ${hits} hits, ${misses} misses`);
+    }
+    const hits = REPEAT_VISIT_STRATEGIES.reduce((total, key) => total + strategies[key].hits, 0);
+    const misses = REPEAT_VISIT_STRATEGIES.reduce((total, key) => total + strategies[key].misses, 0);
+    const hitRate = hits / Math.max(1, hits + misses);
+    check(
+      hitRate >= minHitRate,
+      `repeat visit hit rate ${(hitRate * 100).toFixed(1)}% (min ${(minHitRate * 100).toFixed(0)}%, ${values.profile})`
+    );
+
+    await goOffline(browser, page);
+    for (const route of ROUTES) {
+      let rendered = false;
+      try {
+        await page.goto(url(route));
+        rendered = !(await isOfflinePage(page));
+      } catch {
+        // Navigation error: the worker had nothing to serve
+      }
+      check(rendered, `${route} renders offline`);
+    }
+
+    // A never-visited URL falls back to the offline page
+    await page.goto(url(`${SITE_ROUTES.contact}?offline-check=${Date.now()}`));
+    check(await isOfflinePage(page), "unvisited route gets the offline page");
+  } finally {
+    await page.close();
+    await browser.close();
+  }
+
+  if (failures.length > 0) {
+    console.error(`\n${failures.length} offline check(s) failed`);
+    process.exit(1);
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
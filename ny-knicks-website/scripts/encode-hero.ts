@@ -0,0 +1,108 @@
+/**
+ * Offline hero video encoder. Produces the bitrate ladder in
+ * `HERO_RENDITIONS` (H.264 MP4, audio stripped, fast-start) and a poster
+ * frame, using the system `ffmpeg`.
+ *
+ *   npm run encode:hero -- --input media/hero-source.mov [--poster-at 2.5] [--force]
+ *
+ * The poster is written to `public/`, so `build:images` picks it up and
+ * generates its responsive variants.
+ */
+import { spawn } from "node:child_process";
+import { existsSync, statSync } from "node:fs";
+import { mkdir } from "node:fs/promises";
+import path from "node:path";
+import { parseArgs } from "node:util";
+import { HERO_POSTER, HERO_RENDITIONS } from "@/lib/video/config";
+
+const { values } = parseArgs({
+  options: {
+    input: { type: "string" },
+    "poster-at": { type: "string", default: "1" },
+    "max-seconds": { type: "string", default: "20" },
+    force: { type: "boolean", default: false },
+  },
+});
+
+const PUBLIC_DIR = path.join(process.cwd(), "public");
+
+function ffmpeg(args: string[]): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const child = spawn("ffmpeg", ["-hide_banner", "-loglevel", "error", "-y", ...args], {
+      stdio: "inherit",
+    });
+    child.on("error", (error) =>
+      reject(new Error(`Could not run ffmpeg (${error.message}); is it installed?`))
+    );
+    child.on("exit", (code) =>
+      code === 0 ? resolve() : reject(new Error(`ffmpeg exited with code ${code}`))
+    );
+  });
+}
+
+/** Outputs newer than the source are kept unless --force is given */
+function isFresh(output: string, input: string) {
+  return (
+    !values.force &&
+    existsSync(output) &&
+    statSync(output).mtimeMs > statSync(input).mtimeMs
+  );
+}
+
+async function main() {
+  const input = values.input;
+  if (!input || !existsSync(input)) {
+    throw new Error("Pass the source video with --input <file>");
+  }
+
+  const posterPath = path.join(PUBLIC_DIR, HERO_POSTER);
+  await mkdir(path.dirname(posterPath), { recursive: true });
+
+  for (const rendition of HERO_RENDITIONS) {
+    const output = path.join(PUBLIC_DIR, rendition.src);
+    if (isFresh(output, input)) {
+      console.log(`  unchanged ${rendition.src}`);
+      continue;
+    }
+
+    const bitrate = rendition.bitrateKbps;
+    await ffmpeg([
+      "-i", input,
+      "-t", values["max-seconds"],
+      "-an",
+      "-vf", `scale=-2:${rendition.height}:flags=lanczos,fps=30`,
+      "-c:v", "libx264",
+      "-profile:v", "high",
+      "-preset", "slow",
+      "-b:v", `${bitrate}k`,
+      "-maxrate", `${Math.round(bitrate * 1.5)}k`,
+      "-bufsize", `${bitrate * 2}k`,
+      // A keyframe every 2s keeps seeking and loop restarts cheap
+      "-g", "60",
+      "-pix_fmt", "yuv420p",
+      "-movflags", "+faststart",
+      output,
+    ]);
+    console.log(`  encoded ${rendition.src} (${rendition.height}p @ ${bitrate} kbps)`);
+  }
+
+  if (!isFresh(posterPath, input)) {
+    const largest = HERO_RENDITIONS[HERO_RENDITIONS.length - 1];
+    await ffmpeg([
+      "-ss", values["poster-at"],
+      "-i", input,
+      "-frames:v", "1",
+      "-vf", `scale=-2:${largest?.height ?? 1080}:flags=lanczos`,
+      "-q:v", "2",
+      posterPath,
+    ]);
+    console.log(`  poster ${HERO_POSTER}`);
+  }
+
+  console.log("encode:hero: done; run `npm run build:images` to refresh poster variants");
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
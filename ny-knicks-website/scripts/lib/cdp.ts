@@ -0,0 +1,228 @@
+/**
+ * Minimal Chrome DevTools Protocol client for benchmark scripts.
+ *
+ * Launches a local Chrome/Chromium with `--remote-debugging-pipe` (no
+ * WebSocket or browser-automation dependency) and exposes pages with
+ * `send`, event waiting and `evaluate`. Set `CHROME_PATH` to pick a browser.
+ */
+import { spawn, type ChildProcess } from "node:child_process";
+import { existsSync } from "node:fs";
+import { mkdtemp, rm } from "node:fs/promises";
+import os from "node:os";
+import path from "node:path";
+import type { Readable, Writable } from "node:stream";
+
+type Params = Record<string, unknown>;
+
+export interface CdpEvent {
+  method: string;
+  params: Params;
+  sessionId?: string;
+}
+
+interface CdpMessage extends Partial<CdpEvent> {
+  id?: number;
+  result?: Params;
+  error?: { message: string };
+}
+
+const CHROME_CANDIDATES = [
+  process.env.CHROME_PATH,
+  "/usr/bin/google-chrome",
+  "/usr/bin/google-chrome-stable",
+  "/usr/bin/chromium",
+  "/usr/bin/chromium-browser",
+  "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+  "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+];
+
+export function findChrome(): string {
+  const found = CHROME_CANDIDATES.find((candidate) => candidate && existsSync(candidate));
+  if (!found) {
+    throw new Error("No Chrome/Chromium found; set CHROME_PATH to the browser binary");
+  }
+  return found;
+}
+
+export class Browser {
+  private nextId = 1;
+  private buffer = "";
+  private readonly pending = new Map<
+    number,
+    { resolve: (result: Params) => void; reject: (error: Error) => void }
+  >();
+  private readonly listeners = new Set<(event: CdpEvent) => void>();
+
+  private constructor(
+    private readonly child: ChildProcess,
+    private readonly input: Writable,
+    output: Readable,
+    private readonly profileDir: string
+  ) {
+    // Chrome closing the pipe on exit is expected
+    input.on("error", () => {});
+    output.setEncoding("utf8");
+    output.on("data", (chunk: string) => this.receive(chunk));
+  }
+
+  static async launch({ headless = true }: { headless?: boolean } = {}): Promise<Browser> {
+    const profileDir = await mkdtemp(path.join(os.tmpdir(), "knicks-bench-"));
+    const child = spawn(
+      findChrome(),
+      [
+        ...(headless ? ["--headless=new"] : []),
+        "--remote-debugging-pipe",
+        `--user-data-dir=${profileDir}`,
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--autoplay-policy=no-user-gesture-required",
+        "--mute-audio",
+        "about:blank",
+      ],
+      { stdio: ["ignore", "ignore", "ignore", "pipe", "pipe"] }
+    );
+
+    const browser = new Browser(
+      child,
+      child.stdio[3] as Writable,
+      child.stdio[4] as Readable,
+      profileDir
+    );
+    await browser.send("Target.setDiscoverTargets", { discover: true });
+    return browser;
+  }
+
+  send<T = Params>(method: string, params: Params = {}, sessionId?: string): Promise<T> {
+    const id = this.nextId++;
+    const message = JSON.stringify({ id, method, params, sessionId });
+    return new Promise<T>((resolve, reject) => {
+      this.pending.set(id, { resolve: (result) => resolve(result as T), reject });
+      this.input.write(`${message}\0`);
+    });
+  }
+
+  on(listener: (event: CdpEvent) => void): () => void {
+    this.listeners.add(listener);
+    return () => this.listeners.delete(listener);
+  }
+
+  /** Open a page in a fresh browser context (empty cache and storage) */
+  async newPage(): Promise<Page> {
+    const { browserContextId } = await this.send<{ browserContextId: string }>(
+      "Target.createBrowserContext",
+      { disposeOnDetach: true }
+    );
+    const { targetId } = await this.send<{ targetId: string }>("Target.createTarget", {
+      url: "about:blank",
+      browserContextId,
+    });
+    const { sessionId } = await this.send<{ sessionId: string }>("Target.attachToTarget", {
+      targetId,
+      flatten: true,
+    });
+    return new Page(this, targetId, sessionId, browserContextId);
+  }
+
+  async close(): Promise<void> {
+    const exited = new Promise<void>((resolve) => this.child.once("exit", () => resolve()));
+    this.send("Browser.close").catch(() => this.child.kill());
+    await Promise.race([exited, sleep(5000).then(() => this.child.kill())]);
+    await rm(this.profileDir, { recursive: true, force: true });
+  }
+
+  private receive(chunk: string) {
+    this.buffer += chunk;
+    let end = this.buffer.indexOf("\0");
+    while (end !== -1) {
+      const message = JSON.parse(this.buffer.slice(0, end)) as CdpMessage;
+      this.buffer = this.buffer.slice(end + 1);
+      this.dispatch(message);
+      end = this.buffer.indexOf("\0");
+    }
+  }
+
+  private dispatch(message: CdpMessage) {
+    if (message.id !== undefined) {
+      const pending = this.pending.get(message.id);
+      this.pending.delete(message.id);
+      if (message.error) pending?.reject(new Error(message.error.message));
+      else pending?.resolve(message.result ?? {});
+      return;
+    }
+    if (message.method) {
+      const event: CdpEvent = {
+        method: message.method,
+        params: message.params ?? {},
+        sessionId: message.sessionId,
+      };
+      this.listeners.forEach((listener) => listener(event));
+    }
+  }
+}
+
+export class Page {
+  constructor(
+    private readonly browser: Browser,
+    readonly targetId: string,
+    readonly sessionId: string,
+    private readonly browserContextId: string
+  ) {}
+
+  send<T = Params>(method: string, params: Params = {}): Promise<T> {
+    return this.browser.send<T>(method, params, this.sessionId);
+  }
+
+  /** Subscribe to an event of this page */
+  on(method: string, handler: (params: Params) => void): () => void {
+    return this.browser.on((event) => {
+      if (event.sessionId === this.sessionId && event.method === method) {
+        handler(event.params);
+      }
+    });
+  }
+
+  waitFor(method: string, timeoutMs = 30_000): Promise<Params> {
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        off();
+        reject(new Error(`Timed out waiting for ${method}`));
+      }, timeoutMs);
+      const off = this.on(method, (params) => {
+        clearTimeout(timer);
+        off();
+        resolve(params);
+      });
+    });
+  }
+
+  /** Navigate and resolve once the load event has fired */
+  async goto(url: string, timeoutMs = 60_000): Promise<void> {
+    await this.send("Page.enable");
+    const loaded = this.waitFor("Page.loadEventFired", timeoutMs);
+    const { errorText } = await this.send<{ errorText?: string }>("Page.navigate", { url });
+    if (errorText) throw new Error(`Navigation to ${url} failed: ${errorText}`);
+    await loaded;
+  }
+
+  async evaluate<T>(expression: string): Promise<T> {
+    const { result, exceptionDetails } = await this.send<{
+      result: { value?: unknown };
+      exceptionDetails?: { text: string };
+    }>("Runtime.evaluate", { expression, awaitPromise: true, returnByValue: true });
+    if (exceptionDetails) throw new Error(`Evaluation failed: ${exceptionDetails.text}`);
+    return result.value as T;
+  }
+
+  async close(): Promise<void> {
+    await this.browser.send("Target.closeTarget", { targetId: this.targetId });
+    await this.browser
+      .send("Target.disposeBrowserContext", { browserContextId: this.browserContextId })
+      .catch(() => {});
+  }
+}
+
+export function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
@@ -0,0 +1,114 @@
+import { existsSync } from "node:fs";
+import { readFile, stat } from "node:fs/promises";
+import path from "node:path";
+import vm from "node:vm";
+import { gzipSync } from "node:zlib";
+
+/**
+ * Read-only access to the `.next` output of the last `next build`, for
+ * reports and generated assets. Handles webpack and Turbopack manifests.
+ */
+
+export interface PrerenderManifest {
+  routes: Record<string, { srcRoute: string | null; initialRevalidateSeconds: number | false }>;
+  dynamicRoutes: Record<string, { fallback: string | false | null }>;
+}
+
+export class NextBuild {
+  readonly dir: string;
+  readonly serverAppDir: string;
+  private readonly gzipSizes = new Map<string, number>();
+
+  constructor(dir = ".next") {
+    this.dir = path.resolve(dir);
+    this.serverAppDir = path.join(this.dir, "server/app");
+  }
+
+  exists(): boolean {
+    return existsSync(path.join(this.dir, "BUILD_ID"));
+  }
+
+  async buildId(): Promise<string> {
+    return (await readFile(path.join(this.dir, "BUILD_ID"), "utf8")).trim();
+  }
+
+  async readJson<T>(file: string): Promise<T | null> {
+    const full = path.join(this.dir, file);
+    return existsSync(full) ? (JSON.parse(await readFile(full, "utf8")) as T) : null;
+  }
+
+  /** App entry (e.g. `/(site)/roster/page`) -> route (e.g. `/roster`) */
+  async appRoutes(): Promise<Record<string, string>> {
+    return (await this.readJson<Record<string, string>>("app-path-routes-manifest.json")) ?? {};
+  }
+
+  async prerenderManifest(): Promise<PrerenderManifest> {
+    return (
+      (await this.readJson<PrerenderManifest>("prerender-manifest.json")) ?? {
+        routes: {},
+        dynamicRoutes: {},
+      }
+    );
+  }
+
+  /** JS loaded by every page (framework and runtime) */
+  async rootMainFiles(): Promise<string[]> {
+    const manifest = await this.readJson<{ rootMainFiles?: string[] }>("build-manifest.json");
+    return manifest?.rootMainFiles ?? [];
+  }
+
+  /** Prerendered output of a concrete path, without extension */
+  outputBase(pathname: string): string {
+    return path.join(this.serverAppDir, pathname === "/" ? "index" : pathname.slice(1));
+  }
+
+  /** Client JS of an app entry, relative to the build dir, shared chunks included */
+  async clientFiles(entry: string): Promise<string[]> {
+    const appBuildManifest = await this.readJson<{ pages: Record<string, string[]> }>(
+      "app-build-manifest.json"
+    );
+    const pageFiles = appBuildManifest?.pages[entry];
+    if (pageFiles) return pageFiles.filter((file) => file.endsWith(".js"));
+
+    const files = new Set(await this.rootMainFiles());
+    const manifestFile = path.join(this.serverAppDir, `${entry}_client-reference-manifest.js`);
+    if (existsSync(manifestFile)) {
+      // Turbopack: the manifest is a script assigning to globalThis.__RSC_MANIFEST
+      const sandbox: {
+        __RSC_MANIFEST?: Record<string, { entryJSFiles?: Record<string, string[]> }>;
+      } = {};
+      vm.runInNewContext(await readFile(manifestFile, "utf8"), { globalThis: sandbox });
+      for (const manifest of Object.values(sandbox.__RSC_MANIFEST ?? {})) {
+        for (const chunks of Object.values(manifest.entryJSFiles ?? {})) {
+          chunks.forEach((file) => files.add(file));
+        }
+      }
+    }
+    return [...files].filter((file) => file.endsWith(".js"));
+  }
+
+  /** Gzipped size of a file (absolute, or relative to the build dir) */
+  async gzippedSize(file: string): Promise<number | null> {
+    const full = path.resolve(this.dir, file);
+    const cached = this.gzipSizes.get(full);
+    if (cached !== undefined) return cached;
+    if (!existsSync(full) || !(await stat(full)).isFile()) return null;
+    const size = gzipSync(await readFile(full)).length;
+    this.gzipSizes.set(full, size);
+    return size;
+  }
+
+  /** Gzipped client JS of an app entry, or `null` when none is found */
+  async clientJsBytes(entry: string): Promise<number | null> {
+    let total = 0;
+    let found = false;
+    for (const file of await this.clientFiles(entry)) {
+      const size = await this.gzippedSize(file);
+      if (size !== null) {
+        total += size;
+        found = true;
+      }
+    }
+    return found ? total : null;
+  }
+}
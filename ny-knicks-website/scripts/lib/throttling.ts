@@ -0,0 +1,70 @@
+import type { Page } from "./cdp";
+
+/**
+ * Device and network profiles for headless benchmarks, modeled on the
+ * Lighthouse mobile and desktop presets
+ */
+
+export interface ThrottlingProfile {
+  name: string;
+  /** Round-trip latency added to every request */
+  latencyMs: number;
+  downloadKbps: number;
+  uploadKbps: number;
+  /** CPU slowdown multiplier */
+  cpuSlowdown: number;
+  viewport: { width: number; height: number; deviceScaleFactor: number; mobile: boolean };
+}
+
+export const THROTTLING_PROFILES = {
+  /** Lighthouse's default mobile run: slow 4G on a mid-range phone */
+  mobile: {
+    name: "mobile",
+    latencyMs: 150,
+    downloadKbps: 1638,
+    uploadKbps: 750,
+    cpuSlowdown: 4,
+    viewport: { width: 412, height: 823, deviceScaleFactor: 1.75, mobile: true },
+  },
+  /** Congested stadium Wi-Fi / 3G */
+  slow: {
+    name: "slow",
+    latencyMs: 400,
+    downloadKbps: 400,
+    uploadKbps: 400,
+    cpuSlowdown: 4,
+    viewport: { width: 412, height: 823, deviceScaleFactor: 1.75, mobile: true },
+  },
+  desktop: {
+    name: "desktop",
+    latencyMs: 40,
+    downloadKbps: 10240,
+    uploadKbps: 10240,
+    cpuSlowdown: 1,
+    viewport: { width: 1350, height: 940, deviceScaleFactor: 1, mobile: false },
+  },
+} satisfies Record<string, ThrottlingProfile>;
+
+export type ThrottlingProfileName = keyof typeof THROTTLING_PROFILES;
+
+export function getThrottlingProfile(name: string): ThrottlingProfile {
+  const profile = THROTTLING_PROFILES[name as ThrottlingProfileName];
+  if (!profile) {
+    throw new Error(
+      `Unknown profile "${name}"; expected one of ${Object.keys(THROTTLING_PROFILES).join(", ")}`
+    );
+  }
+  return profile;
+}
+
+export async function applyThrottling(page: Page, profile: ThrottlingProfile): Promise<void> {
+  await page.send("Network.enable");
+  await page.send("Network.emulateNetworkConditions", {
+    offline: false,
+    latency: profile.latencyMs,
+    downloadThroughput: (profile.downloadKbps * 1024) / 8,
+    uploadThroughput: (profile.uploadKbps * 1024) / 8,
+  });
+  await page.send("Emulation.setCPUThrottlingRate", { rate: profile.cpuSlowdown });
+  await page.send("Emulation.setDeviceMetricsOverride", profile.viewport);
+}
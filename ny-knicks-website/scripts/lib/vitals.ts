@@ -0,0 +1,104 @@
+import type { Page } from "./cdp";
+
+/**
+ * Lab Web Vitals for headless runs. The observer script is injected before
+ * any page script runs and records paint, layout shift and long task
+ * entries on `window.__benchVitals`.
+ */
+
+export interface LabVitals {
+  fcp: number | null;
+  lcp: number | null;
+  /** Largest session window of layout shifts, as in `lib/perf/collect.ts` */
+  cls: number;
+  /** Total Blocking Time: long task time beyond 50ms, after FCP */
+  tbt: number;
+  /**
+   * Time to Interactive, as of reading: the end of the last long task, but
+   * no earlier than FCP and DOMContentLoaded. Read after a quiet period.
+   */
+  tti: number | null;
+}
+
+const OBSERVER_SCRIPT = `(() => {
+  const vitals = { fcp: null, lcp: null, cls: 0, longTasks: [] };
+  // CLS session window: shifts < 1s apart, window < 5s
+  const session = { value: 0, start: 0, last: 0 };
+  window.__benchVitals = vitals;
+  const observe = (type, callback) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback))
+        .observe({ type, buffered: true });
+    } catch {}
+  };
+  observe("paint", (entry) => {
+    if (entry.name === "first-contentful-paint") vitals.fcp = entry.startTime;
+  });
+  observe("largest-contentful-paint", (entry) => { vitals.lcp = entry.startTime; });
+  observe("layout-shift", (entry) => {
+    if (entry.hadRecentInput) return;
+    if (session.value > 0 && entry.startTime - session.last < 1000 && entry.startTime - session.start < 5000) {
+      session.value += entry.value;
+    } else {
+      session.value = entry.value;
+      session.start = entry.startTime;
+    }
+    session.last = entry.startTime;
+    vitals.cls = Math.max(vitals.cls, session.value);
+  });
+  observe("longtask", (entry) => {
+    vitals.longTasks.push([entry.startTime, entry.duration]);
+  });
+})();`;
+
+export async function installVitalsObserver(page: Page): Promise<void> {
+  await page.send("Page.enable");
+  await page.send("Page.addScriptToEvaluateOnNewDocument", { source: OBSERVER_SCRIPT });
+}
+
+export function readVitals(page: Page): Promise<LabVitals> {
+  return page.evaluate<LabVitals>(`(() => {
+    const { fcp, lcp, cls, longTasks } = window.__benchVitals;
+    const start = fcp ?? 0;
+    const tbt = longTasks
+      .filter(([startTime]) => startTime >= start)
+      .reduce((total, [, duration]) => total + Math.max(0, duration - 50), 0);
+    const [navigation] = performance.getEntriesByType("navigation");
+    const tti = fcp === null ? null : Math.max(
+      fcp,
+      navigation ? navigation.domContentLoadedEventEnd : 0,
+      ...longTasks.map(([startTime, duration]) => startTime + duration)
+    );
+    return { fcp, lcp, cls, tbt, tti };
+  })()`);
+}
+
+/** Tracks bytes received over the network, including still-streaming responses */
+export function trackTransferSize(page: Page): { total: () => number; stop: () => void } {
+  const bytes = new Map<string, number>();
+  const offReceived = page.on("Network.dataReceived", (params) => {
+    const requestId = params.requestId as string;
+    const received = (params.encodedDataLength as number) || (params.dataLength as number);
+    bytes.set(requestId, (bytes.get(requestId) ?? 0) + received);
+  });
+  const offFinished = page.on("Network.loadingFinished", (params) => {
+    bytes.set(params.requestId as string, params.encodedDataLength as number);
+  });
+
+  return {
+    total: () => Array.from(bytes.values()).reduce((sum, value) => sum + value, 0),
+    stop: () => {
+      offReceived();
+      offFinished();
+    },
+  };
+}
+
+export function median(values: readonly number[]): number {
+  const sorted = [...values].sort((a, b) => a - b);
+  const middle = Math.floor(sorted.length / 2);
+  if (sorted.length === 0) return 0;
+  return sorted.length % 2
+    ? sorted[middle]!
+    : (sorted[middle - 1]! + sorted[middle]!) / 2;
+}
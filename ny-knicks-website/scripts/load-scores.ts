@@ -0,0 +1,182 @@
+/**
+ * Load test for the live score stream. Ramps up concurrent SSE connections
+ * against a running server and reports, per step, how many connections were
+ * established and how long a batch takes to reach every client (fan-out
+ * spread).
+ *
+ * A step fails on any connection error, on a client the server closes
+ * mid-step (e.g. dropped as too slow), when no batch was published during
+ * the step (no live games), or when any batch missed a connected client.
+ *
+ *   LIVE_SCORES_FEED=fake npm run build && LIVE_SCORES_FEED=fake npm start
+ *   npm run loadtest:scores -- --steps 500,1000,2500,5000,10000
+ *
+ * Raise the open file limit (`ulimit -n`) on both sides for large steps.
+ */
+import http from "node:http";
+import { performance } from "node:perf_hooks";
+import { parseArgs } from "node:util";
+
+const { values } = parseArgs({
+  options: {
+    url: { type: "string", default: "http://localhost:3000/api/scores/stream" },
+    steps: { type: "string", default: "250,500,1000,2500,5000" },
+    hold: { type: "string", default: "10" },
+    budget: { type: "string", default: "500" },
+  },
+});
+
+const URL_TARGET = new URL(values.url);
+const STEPS = values.steps.split(",").map(Number);
+const HOLD_MS = Number(values.hold) * 1000;
+const SPREAD_BUDGET_MS = Number(values.budget);
+
+interface StepResult {
+  connections: number;
+  established: number;
+  /** Connection failures plus clients closed by the server mid-step */
+  errors: number;
+  events: number;
+  /** Batches published while every client was connected */
+  batches: number;
+  /** Measured batches that did not reach every established client */
+  incomplete: number;
+  spreadP50: number;
+  spreadP95: number;
+}
+
+function percentile(sorted: number[], p: number) {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] ?? 0;
+}
+
+async function runStep(connections: number): Promise<StepResult> {
+  const arrivals = new Map<string, { first: number; last: number; count: number }>();
+  const requests: http.ClientRequest[] = [];
+  let established = 0;
+  let errors = 0;
+  let events = 0;
+  let holding = true;
+
+  const onEvent = (id: string) => {
+    const now = performance.now();
+    events++;
+    const arrival = arrivals.get(id);
+    if (arrival) {
+      arrival.last = now;
+      arrival.count++;
+    } else {
+      arrivals.set(id, { first: now, last: now, count: 1 });
+    }
+  };
+
+  await Promise.all(
+    Array.from(
+      { length: connections },
+      () =>
+        new Promise<void>((resolve) => {
+          const request = http.get(URL_TARGET, { agent: false }, (response) => {
+            if (response.statusCode !== 200) {
+              errors++;
+              response.resume();
+              resolve();
+              return;
+            }
+            established++;
+            resolve();
+
+            response.on("close", () => {
+              if (holding) errors++;
+            });
+
+            let buffer = "";
+            response.setEncoding("utf8");
+            response.on("data", (chunk: string) => {
+              buffer += chunk;
+              let end = buffer.indexOf("\n\n");
+              while (end !== -1) {
+                const frame = buffer.slice(0, end);
+                buffer = buffer.slice(end + 2);
+                if (frame.includes("event: batch")) {
+                  const id = /^id: (.*)$/m.exec(frame)?.[1];
+                  if (id) onEvent(id);
+                }
+                end = buffer.indexOf("\n\n");
+              }
+            });
+          });
+          request.on("error", () => {
+            errors++;
+            resolve();
+          });
+          requests.push(request);
+        })
+    )
+  );
+
+  // Only measure batches published after every client is connected
+  const measureFrom = performance.now();
+  await new Promise((resolve) => setTimeout(resolve, HOLD_MS));
+  holding = false;
+  // Batches first seen this close to the end may still be in flight
+  const measureUntil = performance.now() - SPREAD_BUDGET_MS;
+  requests.forEach((request) => request.destroy());
+
+  const measured = Array.from(arrivals.values()).filter(
+    (arrival) => arrival.first >= measureFrom && arrival.first <= measureUntil
+  );
+  const spreads = measured.map((arrival) => arrival.last - arrival.first).sort((a, b) => a - b);
+
+  return {
+    connections,
+    established,
+    errors,
+    events,
+    batches: measured.length,
+    incomplete: measured.filter((arrival) => arrival.count < established).length,
+    spreadP50: percentile(spreads, 0.5),
+    spreadP95: percentile(spreads, 0.95),
+  };
+}
+
+async function main() {
+  console.log(`target ${URL_TARGET.href}, holding each step ${HOLD_MS / 1000}s\n`);
+  console.log(
+    "connections  established  errors   events  batches  incomplete  spread p50  spread p95"
+  );
+
+  let sustained = 0;
+  for (const step of STEPS) {
+    const result = await runStep(step);
+    console.log(
+      `${String(result.connections).padStart(11)}  ${String(result.established).padStart(11)}  ` +
+        `${String(result.errors).padStart(6)}  ${String(result.events).padStart(7)}  ` +
+        `${String(result.batches).padStart(7)}  ${String(result.incomplete).padStart(10)}  ` +
+        `${result.spreadP50.toFixed(1).padStart(8)}ms  ${result.spreadP95.toFixed(1).padStart(8)}ms`
+    );
+
+    const healthy =
+      result.errors === 0 &&
+      result.established === step &&
+      result.batches > 0 &&
+      result.incomplete === 0 &&
+      result.spreadP95 <= SPREAD_BUDGET_MS;
+    if (!healthy) {
+      if (result.batches === 0) console.warn("no batches measured; is a game live on the feed?");
+      break;
+    }
+    sustained = step;
+
+    // Let the server release the previous step's sockets
+    await new Promise((resolve) => setTimeout(resolve, 2000));
+  }
+
+  console.log(
+    `\nsustained ${sustained} concurrent connections with p95 fan-out spread <= ${SPREAD_BUDGET_MS}ms`
+  );
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
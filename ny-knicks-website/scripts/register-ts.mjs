@@ -0,0 +1,12 @@
+/**
+ * Lets Node run the TypeScript scripts in this folder directly:
+ *
+ *   node --import ./scripts/register-ts.mjs scripts/bench-data.ts
+ *
+ * Compiles `.ts`/`.tsx` with the project's own `typescript` package and
+ * resolves the `@/` path alias plus extensionless relative imports, so
+ * scripts can import app modules exactly as the app does.
+ */
+import { register } from "node:module";
+
+register("./ts-loader.mjs", import.meta.url);
@@ -0,0 +1,126 @@
+/**
+ * Per-route build report: render mode (static, ISR, dynamic), prerendered
+ * payload size (HTML + RSC, gzipped) and client JS size (gzipped), read
+ * from the `.next` output of the last `next build`.
+ *
+ *   npm run build                         # prints the report afterwards
+ *   npm run report:routes -- --strict     # fail on unexpected dynamic routes
+ *
+ * Only live scores and a few APIs are expected to be dynamic; anything else
+ * rendering per request is flagged.
+ */
+import { writeFile } from "node:fs/promises";
+import path from "node:path";
+import { parseArgs } from "node:util";
+import { NextBuild } from "./lib/next-build";
+
+const { values } = parseArgs({
+  options: {
+    dir: { type: "string", default: ".next" },
+    strict: { type: "boolean", default: false },
+  },
+});
+
+/** Routes allowed to render per request (prefix match) */
+const ALLOWED_DYNAMIC = ["/api/scores/stream", "/api/revalidate", "/api/media", "/api/perf", "/bench"];
+
+const build = new NextBuild(values.dir);
+
+interface RouteReport {
+  route: string;
+  mode: string;
+  /** Prerendered instances (dynamic segments) */
+  instances: number;
+  htmlBytes: number | null;
+  rscBytes: number | null;
+  jsBytes: number | null;
+  flagged: boolean;
+}
+
+function renderMode(revalidate: number | false): string {
+  return revalidate === false ? "static" : `ISR ${revalidate}s`;
+}
+
+function isAllowedDynamic(route: string): boolean {
+  return ALLOWED_DYNAMIC.some((prefix) => route === prefix || route.startsWith(`${prefix}/`));
+}
+
+function formatBytes(bytes: number | null): string {
+  return bytes === null ? "-" : `${(bytes / 1024).toFixed(1)} kB`;
+}
+
+async function main() {
+  if (!build.exists()) {
+    console.warn(`No build output in ${build.dir}; run \`next build\` first`);
+    process.exitCode = values.strict ? 1 : 0;
+    return;
+  }
+  const appRoutes = await build.appRoutes();
+  const prerender = await build.prerenderManifest();
+
+  const reports: RouteReport[] = [];
+  for (const [entry, route] of Object.entries(appRoutes).sort(([, a], [, b]) => a.localeCompare(b))) {
+    if (route.startsWith("/_")) continue;
+
+    const isPage = entry.endsWith("/page");
+    const staticRoute = prerender.routes[route];
+    const dynamicRoute = prerender.dynamicRoutes[route];
+    const instances = dynamicRoute
+      ? Object.keys(prerender.routes).filter(
+          (pathname) => prerender.routes[pathname]?.srcRoute === route
+        )
+      : [];
+
+    let mode = "dynamic";
+    if (staticRoute) {
+      mode = renderMode(staticRoute.initialRevalidateSeconds);
+    } else if (dynamicRoute) {
+      const first = instances[0] ? prerender.routes[instances[0]] : undefined;
+      const onDemand = dynamicRoute.fallback === false ? "" : " + on demand";
+      mode = `${renderMode(first?.initialRevalidateSeconds ?? false)} (params${onDemand})`;
+    }
+
+    // Payload of the page itself, or of its first prerendered instance
+    const sample = staticRoute ? route : instances[0];
+    const base = sample ? build.outputBase(sample) : null;
+    reports.push({
+      route,
+      mode,
+      instances: instances.length,
+      htmlBytes: base ? await build.gzippedSize(`${base}${isPage ? ".html" : ".body"}`) : null,
+      rscBytes: base && isPage ? await build.gzippedSize(`${base}.rsc`) : null,
+      jsBytes: isPage ? await build.clientJsBytes(entry) : null,
+      flagged: mode === "dynamic" && !isAllowedDynamic(route),
+    });
+  }
+
+  console.log(
+    `${"route".padEnd(28)} ${"mode".padEnd(30)} ${"html/body".padStart(10)} ` +
+      `${"rsc".padStart(9)} ${"client js".padStart(10)}`
+  );
+  for (const report of reports) {
+    const route = report.instances ? `${report.route} (${report.instances})` : report.route;
+    console.log(
+      `${route.padEnd(28)} ${`${report.mode}${report.flagged ? "  !" : ""}`.padEnd(30)} ` +
+        `${formatBytes(report.htmlBytes).padStart(10)} ${formatBytes(report.rscBytes).padStart(9)} ` +
+        `${formatBytes(report.jsBytes).padStart(10)}`
+    );
+  }
+  console.log("\nSizes are gzipped; client JS includes the shared framework chunks.");
+
+  await writeFile(path.join(build.dir, "route-report.json"), `${JSON.stringify(reports, null, 2)}\n`);
+
+  const flagged = reports.filter((report) => report.flagged);
+  if (flagged.length > 0) {
+    console.warn(
+      `\n${flagged.length} route(s) render per request but are not expected to: ` +
+        flagged.map((report) => report.route).join(", ")
+    );
+    if (values.strict) process.exitCode = 1;
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,61 @@
+/**
+ * ESM loader hooks used by `register-ts.mjs`
+ */
+import { existsSync, statSync } from "node:fs";
+import { readFile } from "node:fs/promises";
+import path from "node:path";
+import { fileURLToPath, pathToFileURL } from "node:url";
+import ts from "typescript";
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const CANDIDATES = [".ts", ".tsx", "/index.ts", "/index.tsx"];
+
+function findSourceFile(base) {
+  if (existsSync(base) && statSync(base).isFile()) return base;
+  for (const suffix of CANDIDATES) {
+    if (existsSync(base + suffix)) return base + suffix;
+  }
+  return null;
+}
+
+export async function resolve(specifier, context, nextResolve) {
+  let base = null;
+
+  if (specifier.startsWith("@/")) {
+    base = path.join(ROOT, specifier.slice(2));
+  } else if (
+    (specifier.startsWith("./") || specifier.startsWith("../")) &&
+    context.parentURL?.startsWith("file:")
+  ) {
+    base = path.resolve(path.dirname(fileURLToPath(context.parentURL)), specifier);
+  }
+
+  const file = base && findSourceFile(base);
+  if (file) {
+    return { url: pathToFileURL(file).href, shortCircuit: true };
+  }
+  return nextResolve(specifier, context);
+}
+
+export async function load(url, context, nextLoad) {
+  // JSON imported the way the bundler allows it, without import attributes
+  if (url.startsWith("file:") && url.endsWith(".json")) {
+    const json = await readFile(fileURLToPath(url), "utf8");
+    return { format: "module", source: `export default ${json};`, shortCircuit: true };
+  }
+  if (!/\.tsx?$/.test(url)) return nextLoad(url, context);
+
+  const fileName = fileURLToPath(url);
+  const source = await readFile(fileName, "utf8");
+  const { outputText } = ts.transpileModule(source, {
+    fileName,
+    compilerOptions: {
+      module: ts.ModuleKind.ESNext,
+      target: ts.ScriptTarget.ES2022,
+      jsx: ts.JsxEmit.ReactJSX,
+      sourceMap: false,
+    },
+  });
+
+  return { format: "module", source: outputText, shortCircuit: true };
+}
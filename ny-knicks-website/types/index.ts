@@ -27,4 +27,37 @@ export interface NewsArticle {
   publishedAt: string;
   author?: string;
   slug: string;
+  /** Article body (plain text) */
+  content?: string;
+  tags?: string[];
+  /** Estimated reading time in minutes */
+  readingTime?: number;
+}
+
+export type GameStatus = "scheduled" | "live" | "halftime" | "final";
+
+export interface LiveGameState {
+  gameId: string;
+  opponent: string;
+  isHome: boolean;
+  knicksScore: number;
+  opponentScore: number;
+  period: number;
+  /** Game clock as `m:ss` */
+  clock: string;
+  status: GameStatus;
+}
+
+export interface MediaItem {
+  id: string;
+  type: "image" | "video";
+  /** Full-size image, or video file */
+  src: string;
+  /** Grid thumbnail (video poster for clips) */
+  thumbnail?: string;
+  /** Intrinsic dimensions, used to lay out the grid before anything loads */
+  width: number;
+  height: number;
+  caption?: string;
+  category?: string;
 }